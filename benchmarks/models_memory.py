@@ -0,0 +1,81 @@
+"""Measure the memory used by the models of a large project, and their processing.
+
+The dependencies (with 2 repositories each) and their version results are created
+like the parsers and the version checker do, measuring the memory they retain with
+tracemalloc, then the dependencies with an outdated major version are found 3
+times. To compare two revisions, run the script from the root of each checkout:
+
+    PYTHONPATH=. python benchmarks/models_memory.py
+"""
+import random
+import time
+import tracemalloc
+
+from deps_report.models import Dependency, DependencyRepository
+from deps_report.models.results import VersionResult
+from deps_report.utils.output import common as output_common
+
+try:
+    from deps_report.models.dependency_repository import intern_repositories
+except ImportError:
+    # Revisions before the repositories were interned
+    intern_repositories = list  # type: ignore
+# Revisions before the versions results were classified in one pass only found
+# the outdated major versions
+classify = getattr(output_common, "classify_versions_results", None) or getattr(
+    output_common, "get_dependencies_with_outdated_major"
+)
+
+DEPENDENCIES_COUNT = 50000
+CLASSIFICATIONS_COUNT = 3
+
+
+def main() -> None:
+    """Print the memory used by the models and the time to classify them."""
+    rnd = random.Random(0)
+    versions = [
+        f"{rnd.randrange(10)}.{rnd.randrange(30)}.{rnd.randrange(20)}"
+        for _ in range(DEPENDENCIES_COUNT)
+    ]
+
+    tracemalloc.start()
+    results = []
+    for index in range(DEPENDENCIES_COUNT):
+        # Build new strings and repositories, as parsing each file would
+        repositories = intern_repositories(
+            [
+                DependencyRepository(name="pypi", url="https://pypi.org/simple"),
+                DependencyRepository(name="mirror", url="https://example.com/simple"),
+            ]
+        )
+        dependency = Dependency(
+            name=f"package-{index}",
+            version="".join(versions[index]),
+            repositories=repositories,
+            transitive=index % 2 == 0,
+            for_dev=False,
+        )
+        results.append(
+            VersionResult(
+                dependency=dependency,
+                installed_version="".join(versions[index]),
+                latest_version="".join(versions[-index]),
+            )
+        )
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started_at = time.perf_counter()
+    for _ in range(CLASSIFICATIONS_COUNT):
+        classify(results)
+    duration = time.perf_counter() - started_at
+
+    print(
+        f"{DEPENDENCIES_COUNT} dependencies and version results "
+        f"({len(set(versions))} distinct versions): {memory / 1e6:.1f} MB, "
+        f"{CLASSIFICATIONS_COUNT} outdated major classifications in {duration:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
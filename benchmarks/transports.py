@@ -0,0 +1,247 @@
+"""Compare the HTTP transports on many requests to a single host.
+
+A local stand-in of the repository (a Hypercorn server speaking HTTP/2 and
+HTTP/1.1 over TLS, answering the simple pages after `--server-delay`) is reached
+through a proxy delaying the data of each direction by half of `--latency`, and
+the first data of each connection by a round trip for the TCP handshake, as a
+distant host would. They run in another process, so only the CPU time of the
+client is measured. For each transport and concurrency, the requests are sent with
+a new transport and their duration, the CPU time of the client and the number of
+connections opened are printed.
+
+The stand-in server requires packages which are not dependencies of deps-report:
+
+    pip install "httpx[http2]" hypercorn trustme
+    PYTHONPATH=. python benchmarks/transports.py --latency 0.05
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+from typing import Any, Awaitable, Callable
+
+import trustme
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+PROXY_CHUNK_SIZE = 64 * 1024
+
+
+ASGIApplication = Callable[[dict[str, Any], Any, Any], Awaitable[None]]
+
+
+def create_simple_index_app(delay: float) -> ASGIApplication:
+    """Create an ASGI application answering the simple page of any package."""
+
+    async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        await asyncio.sleep(delay)
+        name = scope["path"].rstrip("/").split("/")[-1]
+        body = "".join(
+            f'<a href="#">{name}-{version}.tar.gz</a>' for version in range(1, 20)
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/html")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def _get_free_port() -> int:
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        return int(free_socket.getsockname()[1])
+
+
+class LatencyProxy:
+    """TCP proxy delaying the data of each direction by `delay` seconds."""
+
+    def __init__(self, target_port: int, delay: float, connections_count: Any) -> None:
+        """Create the proxy to the server listening on the given local port."""
+        self.target_port = target_port
+        self.delay = delay
+        self.connections_count = connections_count
+
+    async def _forward(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Chunks are queued with their reception time, so the delay doesn't add up
+        queue: asyncio.Queue[tuple[float, bytes]] = asyncio.Queue()
+
+        async def write() -> None:
+            while True:
+                received_at, data = await queue.get()
+                if not data:
+                    break
+                await asyncio.sleep(max(received_at + self.delay - time.monotonic(), 0))
+                writer.write(data)
+                await writer.drain()
+            writer.close()
+
+        writer_task = asyncio.create_task(write())
+        try:
+            while data := await reader.read(PROXY_CHUNK_SIZE):
+                queue.put_nowait((time.monotonic(), data))
+        except ConnectionError:
+            pass
+        queue.put_nowait((time.monotonic(), b""))
+        await writer_task
+
+    async def handle(
+        self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter
+    ) -> None:
+        """Forward a client connection to the server."""
+        with self.connections_count.get_lock():
+            self.connections_count.value += 1
+        # The connection is accepted locally, the round trip of the handshake of
+        # a distant host is spent before forwarding anything
+        await asyncio.sleep(2 * self.delay)
+        server_reader, server_writer = await asyncio.open_connection(
+            "127.0.0.1", self.target_port
+        )
+        await asyncio.gather(
+            self._forward(client_reader, server_writer),
+            self._forward(server_reader, client_writer),
+            return_exceptions=True,
+        )
+
+
+async def run_requests(
+    transport_name: str, url: str, requests_count: int, concurrency: int
+) -> tuple[float, float]:
+    """Send the requests with a new transport, return their duration and CPU time."""
+    from deps_report.transports import get_transport
+
+    transport = get_transport(transport_name)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send_request(index: int) -> None:
+        async with semaphore:
+            response = await transport.request("GET", f"{url}/package-{index}/")
+            response.raise_for_status()
+
+    started_at = time.perf_counter()
+    cpu_started_at = time.process_time()
+    try:
+        await asyncio.gather(*(send_request(index) for index in range(requests_count)))
+    finally:
+        await transport.close()
+    return time.perf_counter() - started_at, time.process_time() - cpu_started_at
+
+
+async def serve_repository(
+    certificate_file: str,
+    latency: float,
+    server_delay: float,
+    proxy_port: Any,
+    connections_count: Any,
+) -> None:
+    """Run the stand-in server and its proxy, until the process is terminated."""
+    server_port = _get_free_port()
+    config = Config()
+    config.bind = [f"127.0.0.1:{server_port}"]
+    config.certfile = config.keyfile = certificate_file
+    config.alpn_protocols = ["h2", "http/1.1"]
+    config.accesslog = config.errorlog = None
+    server_task = asyncio.create_task(
+        serve(create_simple_index_app(server_delay), config)  # type: ignore
+    )
+
+    proxy = LatencyProxy(server_port, latency / 2, connections_count)
+    proxy_server = await asyncio.start_server(proxy.handle, "127.0.0.1", 0)
+    proxy_port.value = proxy_server.sockets[0].getsockname()[1]
+    await server_task
+
+
+def run_repository(*args: Any) -> None:
+    """Entry point of the process of the stand-in server."""
+    asyncio.run(serve_repository(*args))
+
+
+async def run_benchmarks(
+    arguments: argparse.Namespace, url: str, connections_count: Any
+) -> None:
+    """Send the requests with each transport and concurrency."""
+    # Imported once the authority is trusted, as aiohttp creates its SSL context
+    # on import
+    from deps_report.transports import TRANSPORTS
+
+    print(
+        f"{arguments.requests} requests, latency {arguments.latency * 1000:.0f} ms, "
+        f"server delay {arguments.server_delay * 1000:.0f} ms"
+    )
+    for transport_name in TRANSPORTS:
+        for concurrency in arguments.concurrency:
+            connections_count.value = 0
+            duration, cpu_time = await run_requests(
+                transport_name, url, arguments.requests, concurrency
+            )
+            print(
+                f"{transport_name:>8} concurrency {concurrency:>3}: {duration:.2f}s "
+                f"(CPU {cpu_time:.2f}s), {connections_count.value} connections"
+            )
+
+
+def main(arguments: argparse.Namespace, certificates_dir: str) -> None:
+    """Start the stand-in server in another process, then run the benchmarks."""
+    authority = trustme.CA()
+    authority_file = os.path.join(certificates_dir, "ca.pem")
+    authority.cert_pem.write_to_path(authority_file)
+    certificate_file = os.path.join(certificates_dir, "localhost.pem")
+    authority.issue_cert("localhost").private_key_and_cert_chain_pem.write_to_path(
+        certificate_file
+    )
+    # Trusted by the SSL contexts of aiohttp and httpx
+    os.environ["SSL_CERT_FILE"] = authority_file
+
+    proxy_port = multiprocessing.Value("i", 0)
+    connections_count = multiprocessing.Value("i", 0)
+    repository_process = multiprocessing.Process(
+        target=run_repository,
+        args=(
+            certificate_file,
+            arguments.latency,
+            arguments.server_delay,
+            proxy_port,
+            connections_count,
+        ),
+        daemon=True,
+    )
+    repository_process.start()
+    try:
+        while not proxy_port.value:
+            time.sleep(0.1)
+        asyncio.run(
+            run_benchmarks(
+                arguments,
+                f"https://localhost:{proxy_port.value}/simple",
+                connections_count,
+            )
+        )
+    finally:
+        repository_process.terminate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[10, 100], help="Concurrencies"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Round trip time in seconds"
+    )
+    parser.add_argument(
+        "--server-delay", type=float, default=0.02, help="Response time in seconds"
+    )
+    with tempfile.TemporaryDirectory() as certificates_dir:
+        main(parser.parse_args(), certificates_dir)
@@ -0,0 +1,322 @@
+"""Async API to check dependencies from another program, without any output.
+
+A `Scanner` keeps its checkers (and their datasets and HTTP connections) between
+the scans, so many projects can be checked in the same event loop:
+
+    async with Scanner() as scanner:
+        reports = await scanner.scan_files(["a/Pipfile.lock", "b/poetry.lock"])
+"""
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, Type
+
+from deps_report.dependencies_version_checkers import VERSION_CHECKER_RULES
+from deps_report.dependencies_version_checkers.base import (
+    DependenciesVersionCheckerBase,
+)
+from deps_report.dependencies_version_checkers.versions_store import LatestVersionsStore
+from deps_report.models import RuntimeInformations, VerificationError
+from deps_report.models.results import ProjectReport
+from deps_report.parsers import ParserBase, get_parser_for_file_path
+from deps_report.policy import (
+    POLICY_RULES_CHECKS,
+    FailurePolicy,
+    PolicyRule,
+    get_policy_failures,
+)
+from deps_report.processing import (
+    CHECKS,
+    Dependencies,
+    process_project,
+    validate_checks,
+)
+from deps_report.runtime_version_checkers import (
+    VERSION_CHECKER_RULES as RUNTIME_VERSION_CHECKER_RULES,
+)
+from deps_report.runtime_version_checkers.base import RuntimeVersionCheckerBase
+from deps_report.transports import TransportBase, get_transport
+from deps_report.utils.concurrency_limiter import ConcurrencyStats
+from deps_report.vulnerabilities_checkers import (
+    DEFAULT_VULNERABILITY_DATABASE,
+    get_vulnerability_checker_class_for_parser,
+)
+from deps_report.vulnerabilities_checkers.base import VulnerabilityCheckerBase
+
+DEFAULT_SCAN_CONCURRENCY = 8
+
+
+class Scanner:
+    """Check the dependencies of projects, sharing the checkers between the scans.
+
+    The checkers are created on first use, with all the data of the vulnerabilities
+    database as the projects are not known in advance. Nothing is printed and no
+    Github comment is sent: the reports are only returned.
+    """
+
+    def __init__(
+        self,
+        vulnerability_database: str = DEFAULT_VULNERABILITY_DATABASE,
+        vulnerability_database_source: str | None = None,
+        versions_cache_ttl: float = 0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        total_timeout: float | None = None,
+        versions_store: LatestVersionsStore | None = None,
+        transport: TransportBase | None = None,
+        concurrency_limits_path: str | None = None,
+    ) -> None:
+        """Initialize the scanner, the checkers are created on first use.
+
+        If `versions_cache_ttl` is set, the latest versions found are reused between
+        the scans for this number of seconds. All the checkers share the given
+        transport (or a default one), which is closed with the scanner. The
+        concurrency limits per repository host learned are stored in the given path
+        when closing the scanner, as the initial ones of the next scanners.
+        """
+        self.vulnerability_database = vulnerability_database
+        self.vulnerability_database_source = vulnerability_database_source
+        self.versions_cache_ttl = versions_cache_ttl
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.versions_store = versions_store
+        self.transport = transport or get_transport()
+        self.concurrency_limits_path = concurrency_limits_path
+        self._version_checkers: dict[Type, DependenciesVersionCheckerBase] = {}
+        self._vulnerability_checkers: dict[Type, VulnerabilityCheckerBase] = {}
+        self._runtime_checkers: dict[Type, RuntimeVersionCheckerBase] = {}
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "Scanner":
+        """Use the scanner as a context manager, closing it when leaving."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close the scanner."""
+        await self.close()
+
+    def _get_version_checker(self, parser: Type) -> DependenciesVersionCheckerBase:
+        checker_class = VERSION_CHECKER_RULES[parser]
+        if checker_class not in self._version_checkers:
+            self._version_checkers[checker_class] = checker_class(
+                cache_ttl=self.versions_cache_ttl,
+                connect_timeout=self.connect_timeout,
+                read_timeout=self.read_timeout,
+                total_timeout=self.total_timeout,
+                versions_store=self.versions_store,
+                transport=self.transport,
+                concurrency_limits_path=self.concurrency_limits_path,
+            )
+        return self._version_checkers[checker_class]
+
+    async def _get_vulnerability_checker(
+        self, parser: Type
+    ) -> VulnerabilityCheckerBase:
+        checker_class = get_vulnerability_checker_class_for_parser(
+            parser, self.vulnerability_database
+        )
+        # Concurrent scans wait for the same dataset instead of downloading it again
+        async with self._lock:
+            if checker_class not in self._vulnerability_checkers:
+                self._vulnerability_checkers[
+                    checker_class
+                ] = await checker_class.create(
+                    self.vulnerability_database_source, transport=self.transport
+                )
+        return self._vulnerability_checkers[checker_class]
+
+    def _get_runtime_checker(self, parser: Type) -> RuntimeVersionCheckerBase:
+        checker_class = RUNTIME_VERSION_CHECKER_RULES[parser]
+        if checker_class not in self._runtime_checkers:
+            self._runtime_checkers[checker_class] = checker_class(
+                transport=self.transport
+            )
+        return self._runtime_checkers[checker_class]
+
+    async def refresh(self) -> None:
+        """Download again the datasets of all the checkers already created.
+
+        A checker whose dataset cannot be downloaded again keeps its previous one.
+        """
+        for checker_class in list(self._vulnerability_checkers):
+            vulnerability_checker = await checker_class.create(
+                self.vulnerability_database_source, transport=self.transport
+            )
+            if vulnerability_checker.has_data():
+                self._vulnerability_checkers[checker_class] = vulnerability_checker
+
+        for runtime_checker in self._runtime_checkers.values():
+            try:
+                await runtime_checker.refresh()
+            except VerificationError:
+                # Keep the previous data, it will be refreshed on next call
+                pass
+
+    def get_concurrency_stats(self) -> list[ConcurrencyStats]:
+        """Get the statistics of the requests sent to each repository host."""
+        return [
+            item
+            for version_checker in self._version_checkers.values()
+            for item in version_checker.get_concurrency_stats()
+        ]
+
+    async def close(self) -> None:
+        """Release the resources held by the checkers."""
+        for version_checker in self._version_checkers.values():
+            await version_checker.close()
+        self._version_checkers.clear()
+        await self.transport.close()
+
+    async def _scan_parser(
+        self,
+        parser: ParserBase,
+        checks: list[str] | None,
+        deadline: float | None,
+        fail_on: list[PolicyRule] | None,
+        vulnerabilities_first: bool,
+        dependencies: Dependencies,
+        runtime_version: str | None,
+    ) -> ProjectReport:
+        started_at = time.monotonic()
+        checks = CHECKS if checks is None else validate_checks(checks)
+        for rule in fail_on or []:
+            if POLICY_RULES_CHECKS[rule.name] not in checks:
+                raise ValueError(
+                    f"Policy rule {rule} requires the {POLICY_RULES_CHECKS[rule.name]} check"
+                )
+        parser_type = type(parser)
+
+        runtime_informations: RuntimeInformations | None = None
+        if runtime_version and "runtime" in checks:
+            try:
+                runtime_informations = await self._get_runtime_checker(
+                    parser_type
+                ).get_runtime_informations(runtime_version)
+            except VerificationError:
+                runtime_informations = None
+
+        policy = None
+        if fail_on:
+            policy = FailurePolicy(fail_on)
+            policy.record_runtime(runtime_informations)
+        report = await process_project(
+            dependencies,
+            self._get_version_checker(parser_type) if "outdated" in checks else None,
+            await self._get_vulnerability_checker(parser_type)
+            if "vulnerabilities" in checks
+            else None,
+            runtime_informations,
+            max(deadline - (time.monotonic() - started_at), 0) if deadline else None,
+            policy,
+            vulnerabilities_first,
+        )
+        report.skipped_checks = [check for check in CHECKS if check not in checks]
+        if fail_on:
+            report.policy_failures = get_policy_failures(fail_on, report)
+        return report
+
+    async def scan_file(
+        self,
+        file_path: str,
+        checks: list[str] | None = None,
+        deadline: float | None = None,
+        fail_on: list[PolicyRule] | None = None,
+        vulnerabilities_first: bool = False,
+    ) -> ProjectReport:
+        """Check the dependencies of the given dependencies file.
+
+        Only the given checks are run (all of them by default, see
+        `processing.CHECKS`). The dependencies not checked after `deadline` seconds,
+        or once the `fail_on` policy fails, are reported as unfinished, and the
+        rules of the policy met are in the `policy_failures` of the report.
+        Raise ValueError if the file is not supported, if a check is unknown or if a
+        rule of the policy requires a check which is not run.
+        """
+        parser = get_parser_for_file_path(file_path)
+        return await self._scan_parser(
+            parser,
+            checks,
+            deadline,
+            fail_on,
+            vulnerabilities_first,
+            parser.iter_dependencies()
+            if parser.streams_dependencies
+            else parser.get_dependencies(),
+            parser.get_runtime_version(),
+        )
+
+    async def scan_contents(
+        self,
+        file_name: str,
+        files: dict[str, str],
+        checks: list[str] | None = None,
+        deadline: float | None = None,
+        fail_on: list[PolicyRule] | None = None,
+        vulnerabilities_first: bool = False,
+        expand_env: bool = False,
+    ) -> ProjectReport:
+        """Check the dependencies of the given dependencies files contents.
+
+        The files are given by name (e.g. `Pipfile` and `Pipfile.lock`), the one
+        to parse being `file_name`. As the contents can come from another machine,
+        the templated repositories URLs are only expanded with the environment
+        variables of this process if `expand_env` is set. Raise ValueError if a
+        file name is not valid or if a file needed by the parser is missing. See
+        `scan_file` for the other arguments.
+        """
+        for name in [file_name, *files]:
+            if not name or os.path.basename(name) != name or name in (".", ".."):
+                raise ValueError(f"Invalid file name {name}")
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, content in files.items():
+                with open(os.path.join(directory, name), "w") as file:
+                    file.write(content)
+
+            parser = get_parser_for_file_path(
+                os.path.join(directory, file_name), expand_env
+            )
+            try:
+                dependencies = parser.get_dependencies()
+                runtime_version = parser.get_runtime_version()
+            except FileNotFoundError as e:
+                raise ValueError(
+                    f"Missing file {os.path.basename(e.filename or file_name)}"
+                ) from e
+
+        return await self._scan_parser(
+            parser,
+            checks,
+            deadline,
+            fail_on,
+            vulnerabilities_first,
+            dependencies,
+            runtime_version,
+        )
+
+    async def scan_files(
+        self,
+        file_paths: list[str],
+        checks: list[str] | None = None,
+        deadline: float | None = None,
+        concurrency: int = DEFAULT_SCAN_CONCURRENCY,
+    ) -> dict[str, ProjectReport | Exception]:
+        """Check the dependencies of many projects, `concurrency` at a time.
+
+        The error raised while checking a project is returned as its result, so it
+        doesn't stop the scans of the other ones. See `scan_file` for the other
+        arguments, the deadline applying to each project.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scan(file_path: str) -> ProjectReport | Exception:
+            async with semaphore:
+                try:
+                    return await self.scan_file(file_path, checks, deadline)
+                except Exception as e:
+                    return e
+
+        results = await asyncio.gather(*(scan(path) for path in file_paths))
+        return dict(zip(file_paths, results))
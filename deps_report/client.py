@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import os
+
+import aiohttp
+from aiohttp.client_exceptions import ClientConnectionError, ClientError
+
+from deps_report.models.results import ProjectReport
+from deps_report.parsers.base import ParserBase
+from deps_report.utils.serialization import report_from_dict
+
+logger = logging.getLogger(__name__)
+
+UNIX_SOCKET_PREFIX = "unix:"
+CONNECT_TIMEOUT = 2
+# Time given to the server to send its report after the deadline
+DEADLINE_MARGIN = 5
+
+
+def _get_session_and_url(
+    server: str, deadline: float | None = None
+) -> tuple[aiohttp.ClientSession, str]:
+    """Get a session and the base URL to reach a server given as URL or `unix:<path>`."""
+    timeout = aiohttp.ClientTimeout(
+        total=deadline + DEADLINE_MARGIN if deadline else None,
+        connect=CONNECT_TIMEOUT,
+    )
+    if server.startswith(UNIX_SOCKET_PREFIX):
+        socket_path = server.removeprefix(UNIX_SOCKET_PREFIX)
+        connector = aiohttp.UnixConnector(path=socket_path)
+        return (
+            aiohttp.ClientSession(connector=connector, timeout=timeout),
+            "http://localhost",
+        )
+
+    return aiohttp.ClientSession(timeout=timeout), server.rstrip("/")
+
+
+async def get_report_from_server(
+    server: str, parser: ParserBase, file_path: str, deadline: float | None = None
+) -> ProjectReport | None:
+    """Ask a deps-report server for the report, return None if it's not reachable.
+
+    With a deadline, None is also returned if the server doesn't answer shortly
+    after it (e.g. if it's stalled).
+    """
+    files = {}
+    for path in parser.get_file_paths():
+        with open(path, "r") as file:
+            files[os.path.basename(path)] = file.read()
+
+    session, base_url = _get_session_and_url(server, deadline)
+    try:
+        async with session:
+            async with session.post(
+                f"{base_url}/report",
+                json={
+                    "file_name": os.path.basename(file_path),
+                    "files": files,
+                    "deadline": deadline,
+                },
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+    except (ClientConnectionError, ClientError, OSError, asyncio.TimeoutError):
+        logger.info(f"Cannot get report from deps-report server {server}")
+        return None
+
+    return report_from_dict(data)
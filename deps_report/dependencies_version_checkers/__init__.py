@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Any, Type
 
 from deps_report.dependencies_version_checkers.base import (
     DependenciesVersionCheckerBase,
@@ -8,19 +8,22 @@ from deps_report.dependencies_version_checkers.python import (
 )
 from deps_report.parsers import PythonPipenvParser
 from deps_report.parsers.python.poetry import PythonPoetryParser
+from deps_report.parsers.python.sbom import PythonSbomParser
 
 VERSION_CHECKER_RULES = {
     PythonPipenvParser: PythonDependenciesVersionChecker,
     PythonPoetryParser: PythonDependenciesVersionChecker,
+    PythonSbomParser: PythonDependenciesVersionChecker,
 }
 
 
 def get_dependencies_version_checker_for_parser(
     parser: Type,
+    **kwargs: Any,
 ) -> DependenciesVersionCheckerBase:
     """Get the correct dependencies version checker according to dependency parser used."""
     for parser_class, version_checker_class in VERSION_CHECKER_RULES.items():
         if parser == parser_class:
-            return version_checker_class()
+            return version_checker_class(**kwargs)
 
     raise NotImplementedError(f"Checking versions for {parser} is not implemented yet")
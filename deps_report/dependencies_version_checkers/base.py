@@ -1,7 +1,11 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Iterable
+
+from packaging.version import Version
 
 from deps_report.models import Dependency
+from deps_report.utils.concurrency_limiter import ConcurrencyStats
 
 logger = logging.getLogger(__name__)
 
@@ -11,3 +15,21 @@ class DependenciesVersionCheckerBase(ABC):
     async def get_latest_version_of_dependency(self, dependency: Dependency) -> str:
         """Get the latest version available of a specified dependency."""
         pass
+
+    def get_available_versions(self, dependency: Dependency) -> list[Version] | None:
+        """Get the sorted final versions of a dependency seen when fetching its latest version, if known."""
+        return None
+
+    def get_bypassed_repositories(
+        self, dependencies: Iterable[Dependency]
+    ) -> list[str]:
+        """Get the repositories skipped because unhealthy while checking the given dependencies."""
+        return []
+
+    def get_concurrency_stats(self) -> list[ConcurrencyStats]:
+        """Get the statistics of the requests sent to each repository host."""
+        return []
+
+    async def close(self) -> None:
+        """Release the resources (connections, sessions...) held by the checker."""
+        pass
@@ -1,18 +1,189 @@
 import logging
+import time
+from collections import OrderedDict
+from typing import Iterable
+from urllib.parse import urlparse
 
-import aiohttp
-from aiohttp.client import ClientSession
-from aiohttp.client_exceptions import ClientConnectionError, ClientError
 from bs4 import BeautifulSoup
 from packaging import version as version_parser
+from packaging.version import Version
 
 from deps_report.dependencies_version_checkers import DependenciesVersionCheckerBase
+from deps_report.dependencies_version_checkers.versions_store import LatestVersionsStore
 from deps_report.models import Dependency, VerificationError
+from deps_report.transports import (
+    HTTPStatusError,
+    Timeout,
+    TransportBase,
+    TransportError,
+    TransportTimeoutError,
+    get_transport,
+)
+from deps_report.utils.circuit_breaker import CircuitBreaker
+from deps_report.utils.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyStats,
+    load_concurrency_limits,
+    save_concurrency_limits,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 30
+DEFAULT_TOTAL_TIMEOUT = 60
+# Responses of a repository asking to send less requests
+THROTTLING_STATUSES = {429, 503}
+# Maximum number of dependencies whose available versions are kept, the least
+# recently used ones are dropped
+AVAILABLE_VERSIONS_MAX_SIZE = 2**12
+
+
+def get_repository_host(url: str) -> str:
+    """Get the host of a repository URL with its port, without its credentials."""
+    parsed_url = urlparse(url)
+    if not parsed_url.hostname:
+        return url
+    # Don't use netloc as it can contain credentials
+    host = (
+        f"[{parsed_url.hostname}]"
+        if ":" in parsed_url.hostname
+        else parsed_url.hostname
+    )
+    try:
+        port = parsed_url.port
+    except ValueError:
+        port = None
+    return f"{host}:{port}" if port else host
+
 
 class PythonDependenciesVersionChecker(DependenciesVersionCheckerBase):
+    def __init__(
+        self,
+        cache_ttl: float = 0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        total_timeout: float | None = None,
+        circuit_breaker_failure_threshold: int = 3,
+        circuit_breaker_probe_interval: float = 30,
+        versions_store: LatestVersionsStore | None = None,
+        transport: TransportBase | None = None,
+        concurrency_limits_path: str | None = None,
+    ) -> None:
+        """Initialize the Python dependencies version checker.
+
+        If `cache_ttl` is set, the latest versions found are kept in memory for this
+        number of seconds. The timeouts (in seconds) apply to each request made to a
+        repository. A repository host is skipped after a number of consecutive
+        failures, until a probe request to it succeeds. If a versions store is given,
+        it's used before requesting its repository. The requests are sent with the
+        given transport, or with a default one owned by the checker.
+
+        The concurrent requests to each repository host are limited, the limit being
+        adjusted to its latency and errors. If a path is given, the limits learned
+        are stored there when closing the checker, as the initial ones of next runs.
+        """
+        self.cache_ttl = cache_ttl
+        self.versions_store = versions_store
+        self.timeout = Timeout(
+            connect=connect_timeout, read=read_timeout, total=total_timeout
+        )
+        self.transport = transport or get_transport()
+        self._owns_transport = transport is None
+        self._cache: dict[tuple[str, ...], tuple[float, str]] = {}
+        self.circuit_breaker_failure_threshold = circuit_breaker_failure_threshold
+        self.circuit_breaker_probe_interval = circuit_breaker_probe_interval
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        # Hosts skipped by the latest check of each dependency (by name), as a
+        # checker can be shared by the scans of several projects
+        self._bypassed_hosts: dict[str, set[str]] = {}
+        self._unhealthy_hosts: set[str] = set()
+        self.concurrency_limits_path = concurrency_limits_path
+        self._stored_concurrency_limits = (
+            load_concurrency_limits(concurrency_limits_path)
+            if concurrency_limits_path
+            else {}
+        )
+        self._concurrency_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._available_versions: OrderedDict[str, list[Version]] = OrderedDict()
+
+    async def close(self) -> None:
+        """Close the versions store, and the transport if it's owned by the checker.
+
+        The concurrency limits of the hosts requested are stored if a path is given,
+        except the ones of the hosts failing at the end of the run.
+        """
+        if self.concurrency_limits_path:
+            save_concurrency_limits(
+                self.concurrency_limits_path,
+                {
+                    host: limiter.limit
+                    for host, limiter in self._concurrency_limiters.items()
+                    if limiter.requests_count and not limiter.is_failing
+                },
+            )
+        if self.versions_store is not None:
+            self.versions_store.close()
+        if self._owns_transport:
+            await self.transport.close()
+
+    def _get_circuit_breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._circuit_breakers:
+            self._circuit_breakers[host] = CircuitBreaker(
+                self.circuit_breaker_failure_threshold,
+                self.circuit_breaker_probe_interval,
+            )
+        return self._circuit_breakers[host]
+
+    def _get_concurrency_limiter(self, host: str) -> AdaptiveConcurrencyLimiter:
+        if host not in self._concurrency_limiters:
+            stored_limit = self._stored_concurrency_limits.get(host)
+            self._concurrency_limiters[host] = (
+                AdaptiveConcurrencyLimiter(stored_limit, slow_start=False)
+                if stored_limit is not None
+                else AdaptiveConcurrencyLimiter()
+            )
+        return self._concurrency_limiters[host]
+
+    def get_available_versions(self, dependency: Dependency) -> list[Version] | None:
+        """Get the sorted final versions of a dependency listed by its repository.
+
+        They are only known if the latest version has been fetched recently from
+        the repository (not from the cache or the versions store).
+        """
+        available_versions = self._available_versions.get(dependency.name)
+        if available_versions is not None:
+            self._available_versions.move_to_end(dependency.name)
+        return available_versions
+
+    def _set_available_versions(
+        self, dependency: Dependency, available_versions: list[Version]
+    ) -> None:
+        self._available_versions[dependency.name] = available_versions
+        self._available_versions.move_to_end(dependency.name)
+        if len(self._available_versions) > AVAILABLE_VERSIONS_MAX_SIZE:
+            self._available_versions.popitem(last=False)
+
+    def get_bypassed_repositories(
+        self, dependencies: Iterable[Dependency]
+    ) -> list[str]:
+        """Get the hosts of the repositories skipped because unhealthy by the latest check of the given dependencies."""
+        return sorted(
+            {
+                host
+                for dependency in dependencies
+                for host in self._bypassed_hosts.get(dependency.name, ())
+            }
+        )
+
+    def get_concurrency_stats(self) -> list[ConcurrencyStats]:
+        """Get the statistics of the requests sent to each repository host."""
+        return [
+            limiter.get_stats(host)
+            for host, limiter in sorted(self._concurrency_limiters.items())
+            if limiter.requests_count
+        ]
+
     def _get_version_from_wheel_filename(self, filename: str) -> str:
         return filename.split("-")[1]
 
@@ -27,15 +198,16 @@ class PythonDependenciesVersionChecker(DependenciesVersionCheckerBase):
         return filenames
 
     async def _get_latest_version_from_repository(
-        self, session: ClientSession, url: str
-    ) -> str:
-        async with session.get(url) as response:
-            if response.status == 404:
-                raise ValueError("Dependency doesn't exist on repository")
+        self, url: str
+    ) -> tuple[str, list[Version]]:
+        """Get the latest version from a repository, with its sorted final versions."""
+        response = await self.transport.request("GET", url, timeout=self.timeout)
+        if response.status == 404:
+            raise ValueError("Dependency doesn't exist on repository")
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            page_content = await response.text()
+        page_content = response.text()
 
         # Parse all filenames as version
         versions = []
@@ -56,30 +228,141 @@ class PythonDependenciesVersionChecker(DependenciesVersionCheckerBase):
 
             versions.append(parsed_version)
 
+        final_versions = sorted(
+            {
+                item
+                for item in versions
+                if isinstance(item, Version) and not item.is_prerelease
+            }
+        )
+
         # If all prerelease get latest one
         if all_are_prerelease and len(versions) != 0:
-            return str(versions[0])
+            return str(versions[0]), final_versions
 
         for dep_version in versions:
             if not dep_version.is_prerelease:
-                return str(dep_version)
+                return str(dep_version), final_versions
 
         raise ValueError(f"Cannot check version for {url}")
 
+    async def _get_latest_version_with_limiter(
+        self, limiter: AdaptiveConcurrencyLimiter, url: str
+    ) -> tuple[str, list[Version]]:
+        """Get the latest version from a repository, adjusting its concurrency limit."""
+        started_at = time.monotonic()
+        try:
+            result = await self._get_latest_version_from_repository(url)
+        except HTTPStatusError as e:
+            if e.status in THROTTLING_STATUSES:
+                limiter.record_overload()
+            else:
+                limiter.record_success(time.monotonic() - started_at)
+            raise
+        except TransportTimeoutError:
+            limiter.record_overload()
+            raise
+        except TransportError:
+            # Connection errors
+            limiter.record_failure()
+            raise
+        except ValueError:
+            limiter.record_success(time.monotonic() - started_at)
+            raise
+
+        limiter.record_success(time.monotonic() - started_at)
+        return result
+
     async def get_latest_version_of_dependency(self, dependency: Dependency) -> str:
         """Get the latest version available of a specified dependency."""
-        async with aiohttp.ClientSession() as session:
-            for repository in dependency.repositories:
-                url = f"{repository.url}/{dependency.name}"
+        cache_key = (dependency.name, *[item.url for item in dependency.repositories])
+        if self.cache_ttl > 0 and cache_key in self._cache:
+            cached_at, cached_version = self._cache[cache_key]
+            if time.monotonic() - cached_at < self.cache_ttl:
+                return cached_version
+
+        bypassed_hosts: set[str] = set()
+        try:
+            return await self._get_latest_version_from_repositories(
+                dependency, cache_key, bypassed_hosts
+            )
+        finally:
+            if bypassed_hosts:
+                self._bypassed_hosts[dependency.name] = bypassed_hosts
+            else:
+                self._bypassed_hosts.pop(dependency.name, None)
+
+    async def _get_latest_version_from_repositories(
+        self,
+        dependency: Dependency,
+        cache_key: tuple[str, ...],
+        bypassed_hosts: set[str],
+    ) -> str:
+        """Get the latest version from the first healthy repository which has it."""
+        for repository in dependency.repositories:
+            versions_store = (
+                self.versions_store
+                if self.versions_store is not None
+                and self.versions_store.is_for_repository(repository.url)
+                else None
+            )
+            if versions_store is not None:
+                await versions_store.sync_if_needed(self.transport, self.timeout)
+                stored_version = versions_store.get(dependency.name)
+                if stored_version is not None:
+                    return stored_version
+
+            host = get_repository_host(repository.url)
+            limiter = self._get_concurrency_limiter(host)
+            circuit_breaker = self._get_circuit_breaker(host)
+
+            url = f"{repository.url}/{dependency.name}"
+            try:
+                await limiter.acquire()
                 try:
-                    version = await self._get_latest_version_from_repository(
-                        session, url
-                    )
-                except ValueError:
-                    continue
-                except (ClientConnectionError, ClientError):
-                    logger.info("Error while fetching repository informations")
+                    # Requests waiting for a slot are only sent if the host is still healthy
+                    if not circuit_breaker.allow_request():
+                        if host not in self._unhealthy_hosts:
+                            logger.warning(
+                                f"Repository {host} is unhealthy, bypassing it"
+                            )
+                            self._unhealthy_hosts.add(host)
+                        bypassed_hosts.add(host)
+                        continue
+
+                    (
+                        version,
+                        available_versions,
+                    ) = await self._get_latest_version_with_limiter(limiter, url)
+                finally:
+                    limiter.release()
+            except ValueError:
+                # The repository answered, but without any valid version
+                circuit_breaker.record_success()
+                continue
+            except HTTPStatusError as e:
+                logger.info(f"Error {e.status} while fetching repository {host}")
+                # A client error means the repository answered (e.g. missing
+                # credentials), a server error is what a proxy in front of an
+                # index down returns
+                if e.status >= 500:
+                    circuit_breaker.record_failure()
                 else:
-                    return version
+                    circuit_breaker.record_success()
+            except TransportTimeoutError:
+                logger.info(f"Timeout while fetching repository {repository.name}")
+                circuit_breaker.record_failure()
+            except TransportError:
+                logger.info("Error while fetching repository informations")
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.record_success()
+                self._unhealthy_hosts.discard(host)
+                self._set_available_versions(dependency, available_versions)
+                if versions_store is not None:
+                    versions_store.set(dependency.name, version)
+                if self.cache_ttl > 0:
+                    self._cache[cache_key] = (time.monotonic(), version)
+                return version
 
         raise VerificationError(f"Cannot check version for {dependency.name}")
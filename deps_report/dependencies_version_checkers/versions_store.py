@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+import xmlrpc.client
+from typing import Any
+from xml.parsers.expat import ExpatError
+
+from packaging.utils import canonicalize_name
+
+from deps_report.transports import Timeout, TransportBase, TransportError
+
+logger = logging.getLogger(__name__)
+
+PYPI_CHANGES_FEED_URL = "https://pypi.org/pypi"
+DEFAULT_SYNC_INTERVAL = 60
+
+
+class LatestVersionsStore:
+    """Store on disk of the latest versions found on a repository.
+
+    The store is kept current with the changes feed of the repository (the
+    `changelog_since_serial` XML-RPC method of PyPI or of a mirror): the projects
+    changed since the last synchronization are removed from the store, the other ones
+    can be used without any request to the repository.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        repository_url: str,
+        feed_url: str = PYPI_CHANGES_FEED_URL,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ) -> None:
+        """Create the store of a repository, in a database of the cache directory."""
+        self.repository_url = repository_url.rstrip("/")
+        self.feed_url = feed_url
+        self.sync_interval = sync_interval
+        store_id = hashlib.sha256(f"{self.repository_url} {feed_url}".encode())
+        self.path = os.path.join(cache_dir, f"versions-{store_id.hexdigest()[:16]}.db")
+        self._connection: sqlite3.Connection | None = None
+        self._sync_attempted_at: float | None = None
+        self._is_synced = False
+        self._lock = asyncio.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=10)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS versions "
+                    "(name TEXT PRIMARY KEY, version TEXT NOT NULL)"
+                )
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS state "
+                    "(key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+                )
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database of the store."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def is_for_repository(self, repository_url: str) -> bool:
+        """Check if the store contains the versions of the given repository."""
+        return repository_url.rstrip("/") == self.repository_url
+
+    def get_serial(self) -> int | None:
+        """Get the serial of the changes feed the store is synchronized with."""
+        row = (
+            self._get_connection()
+            .execute("SELECT value FROM state WHERE key = 'serial'")
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def get(self, name: str) -> str | None:
+        """Get the latest version of a project, if known and the store is synchronized.
+
+        If the last synchronization failed, the store cannot be trusted and
+        nothing is returned.
+        """
+        if not self._is_synced:
+            return None
+        try:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT version FROM versions WHERE name = ?",
+                    (canonicalize_name(name),),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            logger.warning(f"Cannot read the versions store {self.path}")
+            return None
+        return row[0] if row else None
+
+    def set(self, name: str, version: str) -> None:
+        """Store the latest version of a project, found on the repository."""
+        try:
+            with self._get_connection() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO versions (name, version) VALUES (?, ?)",
+                    (canonicalize_name(name), version),
+                )
+        except sqlite3.Error:
+            logger.warning(f"Cannot write to the versions store {self.path}")
+
+    async def _call_feed(
+        self,
+        transport: TransportBase,
+        timeout: Timeout,
+        method: str,
+        *params: Any,
+    ) -> Any:
+        response = await transport.request(
+            "POST",
+            self.feed_url,
+            headers={"Content-Type": "text/xml"},
+            data=xmlrpc.client.dumps(params, method),
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        (result,), _ = xmlrpc.client.loads(response.text())
+        return result
+
+    async def _sync(self, transport: TransportBase, timeout: Timeout) -> None:
+        serial = self.get_serial()
+        connection = self._get_connection()
+
+        # Without a known serial, the stored versions cannot be checked
+        if serial is None:
+            last_serial = await self._call_feed(
+                transport, timeout, "changelog_last_serial"
+            )
+            with connection:
+                connection.execute("DELETE FROM versions")
+                connection.execute(
+                    "INSERT OR REPLACE INTO state (key, value) VALUES ('serial', ?)",
+                    (last_serial,),
+                )
+            return
+
+        # Each event is (name, version, timestamp, action, serial)
+        while events := await self._call_feed(
+            transport, timeout, "changelog_since_serial", serial
+        ):
+            last_serial = max(event[4] for event in events)
+            with connection:
+                connection.executemany(
+                    "DELETE FROM versions WHERE name = ?",
+                    {(canonicalize_name(event[0]),) for event in events},
+                )
+                connection.execute(
+                    "UPDATE state SET value = ? WHERE key = 'serial'", (last_serial,)
+                )
+            logger.info(
+                f"{len(events)} changes since serial {serial} on {self.feed_url}"
+            )
+            if last_serial <= serial:
+                break
+            serial = last_serial
+
+    async def sync_if_needed(self, transport: TransportBase, timeout: Timeout) -> None:
+        """Synchronize the store with the changes feed, at most every sync interval."""
+        async with self._lock:
+            if (
+                self._sync_attempted_at is not None
+                and time.monotonic() - self._sync_attempted_at < self.sync_interval
+            ):
+                return
+            self._sync_attempted_at = time.monotonic()
+
+            try:
+                await self._sync(transport, timeout)
+            except (
+                TransportError,
+                xmlrpc.client.Error,
+                ExpatError,
+                ValueError,
+                TypeError,
+                IndexError,
+                sqlite3.Error,
+            ):
+                logger.warning(
+                    f"Cannot synchronize the versions store with {self.feed_url}, "
+                    "the versions will be fetched from the repository"
+                )
+                self._is_synced = False
+            else:
+                self._is_synced = True
@@ -1,64 +1,234 @@
 import asyncio
-import itertools
 import logging
 import os
+import time
+from typing import Any, Awaitable, Callable, TypeVar
 
 import click
 
 from deps_report import __version__
+from deps_report.client import get_report_from_server
 from deps_report.dependencies_version_checkers import (
     get_dependencies_version_checker_for_parser,
 )
 from deps_report.dependencies_version_checkers.base import (
     DependenciesVersionCheckerBase,
 )
+from deps_report.dependencies_version_checkers.python import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_TOTAL_TIMEOUT,
+)
+from deps_report.dependencies_version_checkers.versions_store import (
+    PYPI_CHANGES_FEED_URL,
+    LatestVersionsStore,
+)
 from deps_report.models import Dependency, VerificationError
-from deps_report.models.results import ErrorResult, VersionResult, VulnerabilityResult
+from deps_report.models.results import ProjectReport
 from deps_report.models.runtime_informations import RuntimeInformations
 from deps_report.parsers import get_parser_for_file_path
-from deps_report.processing import process_dependency
+from deps_report.parsers.python.common import DEFAULT_REPOSITORY
+from deps_report.policy import (
+    POLICY_FAILURE_EXIT_CODE,
+    POLICY_RULES_CHECKS,
+    FailurePolicy,
+    PolicyRule,
+    get_policy_failures,
+    parse_policy,
+)
+from deps_report.processing import (
+    CHECKS,
+    Dependencies,
+    parse_checks,
+    process_project,
+    recheck_project_vulnerabilities,
+)
+from deps_report.report_cache import (
+    DEFAULT_CACHE_DIR,
+    CachedReport,
+    ReportCache,
+    get_report_cache_key,
+)
 from deps_report.runtime_version_checkers import get_runtime_version_checker_for_parser
+from deps_report.server import (
+    DEFAULT_REFRESH_INTERVAL,
+    DEFAULT_VERSIONS_CACHE_TTL,
+    run_server,
+)
+from deps_report.transports import (
+    DEFAULT_TRANSPORT,
+    TRANSPORTS,
+    TransportBase,
+    get_transport,
+)
 from deps_report.utils.asynchronous import coroutine
-from deps_report.utils.output.cli import print_results_stdout
+from deps_report.utils.commands import DefaultCommandGroup
+from deps_report.utils.concurrency_limiter import (
+    CONCURRENCY_LIMITS_FILE_NAME,
+    ConcurrencyStats,
+)
+from deps_report.utils.output.cli import (
+    print_concurrency_stats_stdout,
+    print_results_stdout,
+)
+from deps_report.utils.output.common import classify_versions_results
 from deps_report.utils.output.github_action import send_github_pr_comment_with_results
-from deps_report.vulnerabilities_checkers import get_vulnerability_checker_for_parser
+from deps_report.utils.sharding import (
+    Shard,
+    filter_shard_dependencies,
+    merge_partial_reports,
+    parse_shard,
+    write_partial_report,
+)
+from deps_report.vulnerabilities_checkers import (
+    DEFAULT_VULNERABILITY_DATABASE,
+    VULNERABILITY_DATABASES,
+    get_vulnerability_checker_class_for_parser,
+)
 from deps_report.vulnerabilities_checkers.base import VulnerabilityCheckerBase
+from deps_report.watch import ProjectWatcher
 
 
 async def _process_project(
-    dependencies: list[Dependency],
-    dependencies_version_checker: DependenciesVersionCheckerBase,
-    vulnerability_checker: VulnerabilityCheckerBase,
+    dependencies: Dependencies,
+    dependencies_version_checker: DependenciesVersionCheckerBase | None,
+    vulnerability_checker: VulnerabilityCheckerBase | None,
     runtimes_informations: RuntimeInformations | None,
-) -> None:
-    versions_results: list[VersionResult] = []
-    vulnerabilities_results: list[VulnerabilityResult] = []
-    errors_results: list[ErrorResult] = []
-
+    timeout: float | None,
+    policy: FailurePolicy | None = None,
+    vulnerabilities_first: bool = False,
+) -> ProjectReport:
     click.echo("Processing dependencies...")
-    results = await asyncio.gather(
-        *[
-            process_dependency(
-                dependencies_version_checker, vulnerability_checker, dependency
-            )
-            for dependency in dependencies
-        ]
+    return await process_project(
+        dependencies,
+        dependencies_version_checker,
+        vulnerability_checker,
+        runtimes_informations,
+        timeout,
+        policy,
+        vulnerabilities_first,
     )
 
-    versions_results, vulnerabilities_results, errors_results = map(list, zip(*results))  # type: ignore
-    errors_results = list(itertools.chain(*errors_results))  # type: ignore
 
-    # Filter empty results
-    versions_results = list(filter(None, versions_results))
-    vulnerabilities_results = list(filter(None, vulnerabilities_results))
+T = TypeVar("T")
+
+
+async def _wait_before_deadline(
+    awaitable: Awaitable[T], deadline_at: float | None, step: str
+) -> T | None:
+    """Wait for a step of the run, None is returned if the deadline is reached first."""
+    if deadline_at is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(deadline_at - time.monotonic(), 0))
+    except asyncio.TimeoutError:
+        click.secho(f"Deadline reached while {step}", fg="red")
+        return None
+
+
+def _get_cached_report(
+    report_cache: ReportCache,
+    cache_key: str,
+    cached_report: CachedReport,
+    get_dependencies: Callable[[], list[Dependency]],
+    vulnerability_checker: VulnerabilityCheckerBase | None,
+    vulnerabilities_dataset_version: str | None,
+) -> ProjectReport:
+    click.secho("Report loaded from cache", fg="yellow")
+    # The checker is only created if the vulnerabilities data changed
+    if vulnerability_checker is None:
+        return cached_report.report
 
-    # Print in stdout and send github comment if on Github
-    print_results_stdout(
-        versions_results, vulnerabilities_results, errors_results, runtimes_informations
+    # Versions results are kept, vulnerabilities are checked again
+    click.echo("Vulnerabilities data changed, checking vulnerabilities again...")
+    report = recheck_project_vulnerabilities(
+        cached_report.report, get_dependencies(), vulnerability_checker
     )
-    send_github_pr_comment_with_results(
-        versions_results, vulnerabilities_results, errors_results, runtimes_informations
+    report_cache.set(
+        cache_key,
+        CachedReport(
+            report=report,
+            created_at=cached_report.created_at,
+            vulnerabilities_dataset_version=vulnerabilities_dataset_version
+            if vulnerability_checker.has_data()
+            else None,
+        ),
+    )
+    return report
+
+
+def _output_report(
+    report: ProjectReport,
+    output_json: str | None = None,
+    shard: Shard | None = None,
+    github_comment: bool = True,
+    fail_on: list[PolicyRule] | None = None,
+    concurrency_stats: list[ConcurrencyStats] | None = None,
+) -> None:
+    if fail_on:
+        report.policy_failures = get_policy_failures(fail_on, report)
+
+    if output_json:
+        write_partial_report(output_json, report, shard or Shard(1, 1))
+        click.secho(f"Report written to {output_json}", fg="yellow")
+
+    # Print in stdout and send github comment if on Github, unless it's only a shard
+    classified_versions_results = classify_versions_results(report.versions_results)
+    print_results_stdout(report, classified_versions_results)
+    print_concurrency_stats_stdout(concurrency_stats or [])
+    if shard is None and github_comment:
+        send_github_pr_comment_with_results(report, classified_versions_results)
+
+    if fail_on and report.policy_failures:
+        click.get_current_context().exit(POLICY_FAILURE_EXIT_CODE)
+
+
+async def _watch_project(
+    watcher: ProjectWatcher, output_json: str | None, skipped_checks: list[str]
+) -> None:
+    click.secho(
+        f"Watching {', '.join(watcher.parser.get_file_paths())} (Ctrl+C to stop)",
+        fg="yellow",
     )
+    async for update in watcher.watch():
+        click.secho(
+            f"\n[{time.strftime('%H:%M:%S')}] Checked {len(update.checked_dependencies)} "
+            f"new or changed dependencies in {update.duration * 1000:.0f} ms",
+            fg="yellow",
+        )
+        update.report.skipped_checks = skipped_checks
+        _output_report(update.report, output_json, github_comment=False)
+
+
+def _parse_shard_option(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> Shard | None:
+    if not value:
+        return None
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def _parse_policy_option(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> list[PolicyRule] | None:
+    if not value:
+        return None
+    try:
+        return parse_policy(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def _parse_checks_option(
+    ctx: click.Context, param: click.Parameter, value: str
+) -> list[str]:
+    try:
+        return parse_checks(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
 
 
 def _get_file_path(file: str) -> str:
@@ -78,15 +248,233 @@ def _get_file_path(file: str) -> str:
     ctx.fail(f"file {file} not found")
 
 
-@click.command()
+vulnerability_database_option = click.option(
+    "--vulnerability-database",
+    type=click.Choice(VULNERABILITY_DATABASES),
+    envvar="INPUT_VULNERABILITY_DATABASE",
+    default=DEFAULT_VULNERABILITY_DATABASE,
+    show_default=True,
+    help="Vulnerabilities database to check the dependencies against.",
+)
+vulnerability_database_source_option = click.option(
+    "--vulnerability-database-source",
+    envvar="INPUT_VULNERABILITY_DATABASE_SOURCE",
+    default=None,
+    help="URL or local path (file or directory for OSV) of the vulnerabilities database, if not the default one.",
+)
+
+fail_on_option = click.option(
+    "--fail-on",
+    envvar="INPUT_FAIL_ON",
+    default=None,
+    callback=_parse_policy_option,
+    help=f"Exit with status {POLICY_FAILURE_EXIT_CODE} when one of these comma-separated rules is met, a rule being one of vulnerable, outdated, outdated-major or eol-runtime, optionally followed by :<minimum count> (e.g. vulnerable,outdated-major:3). The remaining checks are cancelled as soon as a rule is met.",
+)
+
+deadline_option = click.option(
+    "--deadline",
+    type=float,
+    envvar="INPUT_DEADLINE",
+    default=0,
+    help="Maximum duration in seconds of the run, the report is generated with the dependencies checked when it is reached (0 for no deadline).",
+)
+
+
+def requests_timeouts_options(f: Any) -> Any:
+    """Add the options for the timeouts of each request to the repositories."""
+    options = [
+        click.option(
+            "--connect-timeout",
+            type=float,
+            envvar="INPUT_CONNECT_TIMEOUT",
+            default=DEFAULT_CONNECT_TIMEOUT,
+            show_default=True,
+            help="Timeout in seconds to connect to a repository (0 for no timeout).",
+        ),
+        click.option(
+            "--read-timeout",
+            type=float,
+            envvar="INPUT_READ_TIMEOUT",
+            default=DEFAULT_READ_TIMEOUT,
+            show_default=True,
+            help="Timeout in seconds between two reads from a repository (0 for no timeout).",
+        ),
+        click.option(
+            "--total-timeout",
+            type=float,
+            envvar="INPUT_TOTAL_TIMEOUT",
+            default=DEFAULT_TOTAL_TIMEOUT,
+            show_default=True,
+            help="Timeout in seconds of a whole request to a repository (0 for no timeout).",
+        ),
+    ]
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+def _get_timeout(value: float) -> float | None:
+    return value if value > 0 else None
+
+
+@click.group(cls=DefaultCommandGroup, default_command="report")
+def main() -> None:
+    """Generate report for the state of your dependencies."""
+    pass
+
+
+cache_max_age_option = click.option(
+    "--cache-max-age",
+    type=float,
+    envvar="INPUT_CACHE_MAX_AGE",
+    default=0,
+    help="Seconds during which the report of a lockfile is reused from the cache, only its vulnerabilities being checked again when their data changed (0 to disable the cache).",
+)
+
+cache_dir_option = click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="INPUT_CACHE_DIR",
+    default=DEFAULT_CACHE_DIR,
+    show_default=True,
+    help="Directory of the reports cache, of the versions store and of the concurrency limits learned.",
+)
+
+
+def versions_store_options(f: Any) -> Any:
+    """Add the options for the store of the latest versions of a repository."""
+    options = [
+        click.option(
+            "--versions-store",
+            is_flag=True,
+            envvar="INPUT_VERSIONS_STORE",
+            help="Keep the latest versions found in a store of the cache directory, synchronized with the changes feed of the repository.",
+        ),
+        click.option(
+            "--versions-store-feed",
+            envvar="INPUT_VERSIONS_STORE_FEED",
+            default=PYPI_CHANGES_FEED_URL,
+            show_default=True,
+            help="XML-RPC URL of the changes feed (changelog_since_serial) of the repository.",
+        ),
+        click.option(
+            "--versions-store-repository",
+            envvar="INPUT_VERSIONS_STORE_REPOSITORY",
+            default=DEFAULT_REPOSITORY.url,
+            show_default=True,
+            help="URL of the repository whose versions are stored.",
+        ),
+    ]
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+http_transport_option = click.option(
+    "--http-transport",
+    type=click.Choice(TRANSPORTS),
+    envvar="INPUT_HTTP_TRANSPORT",
+    default=DEFAULT_TRANSPORT,
+    show_default=True,
+    help="HTTP client used to query the repositories and download the datasets (httpx uses HTTP/2 and must be installed with its http2 extra).",
+)
+
+
+def _get_transport(name: str) -> TransportBase:
+    try:
+        return get_transport(name)
+    except ValueError as e:
+        click.get_current_context().fail(str(e))
+
+
+def _get_versions_store(
+    versions_store: bool, cache_dir: str, feed_url: str, repository_url: str
+) -> LatestVersionsStore | None:
+    if not versions_store:
+        return None
+    return LatestVersionsStore(cache_dir, repository_url, feed_url)
+
+
+@main.command()
 @click.argument(
     "file",
     type=click.Path(),
     default=lambda: os.environ.get("INPUT_FILE", ""),
 )
+@click.option(
+    "--server",
+    envvar="DEPS_REPORT_SERVER",
+    default=None,
+    help="URL (or unix:<path>) of a deps-report server to use, the report is generated locally if it's not reachable.",
+)
+@click.option(
+    "--shard",
+    envvar="INPUT_SHARD",
+    default=None,
+    callback=_parse_shard_option,
+    help="Only check the shard index/count (e.g. 1/4) of the dependencies, to merge the results of all the shards with the merge command (requires --output-json).",
+)
+@click.option(
+    "--output-json",
+    type=click.Path(dir_okay=False),
+    envvar="INPUT_OUTPUT_JSON",
+    default=None,
+    help="Write the report as JSON to this file, which can be given to the merge command.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and check again the new or changed dependencies each time the dependencies files change.",
+)
+@click.option(
+    "--checks",
+    envvar="INPUT_CHECKS",
+    default=",".join(CHECKS),
+    show_default=True,
+    callback=_parse_checks_option,
+    help="Comma-separated checks to run, the data needed by the other ones is not downloaded.",
+)
+@fail_on_option
+@click.option(
+    "--vulnerabilities-first",
+    is_flag=True,
+    envvar="INPUT_VULNERABILITIES_FIRST",
+    help="Check the vulnerabilities of all the dependencies (without any request) before fetching their latest versions, to fail the --fail-on policy without waiting for the repositories.",
+)
+@vulnerability_database_option
+@vulnerability_database_source_option
+@deadline_option
+@requests_timeouts_options
+@cache_max_age_option
+@cache_dir_option
+@versions_store_options
+@http_transport_option
 @coroutine
-async def main(file: str) -> None:
-    """Generate report for the state of your dependencies."""
+async def report(
+    file: str,
+    server: str | None,
+    shard: Shard | None,
+    output_json: str | None,
+    watch: bool,
+    checks: list[str],
+    fail_on: list[PolicyRule] | None,
+    vulnerabilities_first: bool,
+    vulnerability_database: str,
+    vulnerability_database_source: str | None,
+    deadline: float,
+    connect_timeout: float,
+    read_timeout: float,
+    total_timeout: float,
+    cache_max_age: float,
+    cache_dir: str,
+    versions_store: bool,
+    versions_store_feed: str,
+    versions_store_repository: str,
+    http_transport: str,
+) -> None:
+    """Generate report for the state of your dependencies (default command)."""
+    # The deadline of the watch mode applies to each check of the project
+    deadline_at = time.monotonic() + deadline if deadline > 0 and not watch else None
     click.secho(f"deps-report v{__version__}", fg="green")
     click.secho(f"Current working directory: {os.getcwd()}", fg="yellow")
     click.secho(f"File argument provided: {file}", fg="yellow")
@@ -94,10 +482,43 @@ async def main(file: str) -> None:
 
     file = _get_file_path(file)
     click.secho(f"File is: {file}", fg="yellow")
+    if shard is not None and not output_json:
+        click.get_current_context().fail("--output-json is required with --shard")
+    if shard is not None and watch:
+        click.get_current_context().fail("--watch cannot be used with --shard")
+    if fail_on and watch:
+        click.get_current_context().fail("--watch cannot be used with --fail-on")
+    for rule in fail_on or []:
+        if POLICY_RULES_CHECKS[rule.name] not in checks:
+            click.get_current_context().fail(
+                f"--fail-on {rule} requires the {POLICY_RULES_CHECKS[rule.name]} check"
+            )
+    skipped_checks = [check for check in CHECKS if check not in checks]
 
     parser_class = get_parser_for_file_path(file)
+    # The server runs all the checks on all the dependencies, so it's not used for
+    # a shard or some checks, and the state of the watch mode is kept in this process
+    if server and shard is None and not skipped_checks and not watch:
+        server_report = await get_report_from_server(
+            server, parser_class, file, _get_timeout(deadline)
+        )
+        if server_report:
+            click.secho(f"Report generated by server {server}", fg="yellow")
+            _output_report(server_report, output_json, fail_on=fail_on)
+            return
+        click.secho(
+            f"Server {server} is not reachable, generating report locally", fg="yellow"
+        )
+
+    # The dependencies of a streaming parser (e.g. a large SBOM) are checked while
+    # the file is parsed, unless they're all needed first by the shard/watch modes
+    stream_dependencies = (
+        parser_class.streams_dependencies and shard is None and not watch
+    )
+    dependencies: list[Dependency] = []
     try:
-        dependencies = parser_class.get_dependencies()
+        if not stream_dependencies:
+            dependencies = parser_class.get_dependencies()
     except Exception as e:
         logging.exception(e)
         click.secho(
@@ -107,27 +528,302 @@ async def main(file: str) -> None:
         return
     runtime_version = parser_class.get_runtime_version()
 
-    click.secho(f"Found {len(dependencies)} dependencies\n", fg="yellow")
+    if stream_dependencies:
+        click.secho("Dependencies are checked while the file is parsed\n", fg="yellow")
+    else:
+        click.secho(f"Found {len(dependencies)} dependencies\n", fg="yellow")
+    if shard is not None:
+        dependencies = filter_shard_dependencies(dependencies, shard)
+        click.secho(
+            f"Checking {len(dependencies)} dependencies of shard {shard}\n",
+            fg="yellow",
+        )
 
-    dependencies_version_checker = get_dependencies_version_checker_for_parser(
-        type(parser_class)
+    # The checkers of the skipped checks are not created, so their data is not
+    # downloaded (the transport only opens connections when used)
+    transport = _get_transport(http_transport)
+    dependencies_version_checker = (
+        get_dependencies_version_checker_for_parser(
+            type(parser_class),
+            connect_timeout=_get_timeout(connect_timeout),
+            read_timeout=_get_timeout(read_timeout),
+            total_timeout=_get_timeout(total_timeout),
+            versions_store=_get_versions_store(
+                versions_store,
+                cache_dir,
+                versions_store_feed,
+                versions_store_repository,
+            ),
+            transport=transport,
+            concurrency_limits_path=os.path.join(
+                cache_dir, CONCURRENCY_LIMITS_FILE_NAME
+            ),
+        )
+        if "outdated" in checks
+        else None
+    )
+    vulnerability_checker_class = (
+        get_vulnerability_checker_class_for_parser(
+            type(parser_class), vulnerability_database
+        )
+        if "vulnerabilities" in checks
+        else None
     )
-    vulnerability_checker = await get_vulnerability_checker_for_parser(
-        type(parser_class)
+    try:
+        report_cache = (
+            ReportCache(cache_dir, cache_max_age)
+            if cache_max_age > 0 and not watch
+            else None
+        )
+        cache_key = (
+            get_report_cache_key(
+                parser_class,
+                vulnerability_database,
+                vulnerability_database_source,
+                str(shard) if shard else None,
+                ",".join(checks),
+            )
+            if report_cache
+            else ""
+        )
+        cached_report = (
+            report_cache.get(
+                cache_key,
+                {
+                    repository
+                    for dependency in dependencies
+                    for repository in dependency.repositories
+                },
+            )
+            if report_cache
+            else None
+        )
+        # The version of the vulnerabilities data is known without downloading it,
+        # so a cached report only needs the data if it changed
+        vulnerabilities_dataset_version = (
+            await _wait_before_deadline(
+                vulnerability_checker_class.get_source_version(
+                    vulnerability_database_source, transport
+                ),
+                deadline_at,
+                "checking the version of the vulnerabilities data",
+            )
+            if report_cache and vulnerability_checker_class
+            else None
+        )
+
+        # Without the vulnerabilities data before the deadline, all the
+        # dependencies are unfinished
+        vulnerability_checker = (
+            await _wait_before_deadline(
+                vulnerability_checker_class.create(
+                    vulnerability_database_source,
+                    # Dependencies can be added while watching, and are not known
+                    # before being streamed, so no data is filtered out
+                    None
+                    if watch or stream_dependencies
+                    else {dependency.name for dependency in dependencies},
+                    transport,
+                ),
+                deadline_at,
+                "downloading the vulnerabilities data",
+            )
+            if vulnerability_checker_class
+            and (
+                cached_report is None
+                or vulnerabilities_dataset_version is None
+                or vulnerabilities_dataset_version
+                != cached_report.vulnerabilities_dataset_version
+            )
+            else None
+        )
+        # The runtime informations of a cached report are kept, as its versions
+        runtime_checker = (
+            get_runtime_version_checker_for_parser(
+                type(parser_class), transport=transport
+            )
+            if "runtime" in checks and cached_report is None
+            else None
+        )
+
+        if watch:
+            await _watch_project(
+                ProjectWatcher(
+                    parser_class,
+                    dependencies_version_checker,
+                    vulnerability_checker,
+                    runtime_checker,
+                    _get_timeout(deadline),
+                ),
+                output_json,
+                skipped_checks,
+            )
+            return
+
+        if report_cache and cached_report:
+            report = _get_cached_report(
+                report_cache,
+                cache_key,
+                cached_report,
+                parser_class.get_dependencies
+                if stream_dependencies
+                else lambda: dependencies,
+                vulnerability_checker,
+                vulnerabilities_dataset_version,
+            )
+        else:
+            runtime_informations: RuntimeInformations | None = None
+            if runtime_version and runtime_checker:
+                try:
+                    runtime_informations = await _wait_before_deadline(
+                        runtime_checker.get_runtime_informations(runtime_version),
+                        deadline_at,
+                        "checking the runtime version",
+                    )
+                except VerificationError:
+                    runtime_informations = None
+
+            remaining_time = (
+                max(deadline_at - time.monotonic(), 0) if deadline_at else None
+            )
+            policy = None
+            if fail_on:
+                policy = FailurePolicy(fail_on)
+                policy.record_runtime(runtime_informations)
+            try:
+                report = await _process_project(
+                    parser_class.iter_dependencies()
+                    if stream_dependencies
+                    else dependencies,
+                    dependencies_version_checker,
+                    vulnerability_checker,
+                    runtime_informations,
+                    remaining_time,
+                    policy,
+                    vulnerabilities_first,
+                )
+            except (OSError, ValueError) as e:
+                if not stream_dependencies:
+                    raise
+                logging.exception(e)
+                click.secho(
+                    f"An error occurred while trying to parse the dependencies from the file {file}",
+                    fg="red",
+                )
+                return
+
+            # Partial reports are not cached
+            if (
+                report_cache
+                and not report.unfinished_dependencies
+                and not report.bypassed_repositories
+            ):
+                report_cache.set(
+                    cache_key,
+                    CachedReport(
+                        report=report,
+                        created_at=time.time(),
+                        vulnerabilities_dataset_version=vulnerabilities_dataset_version
+                        if vulnerability_checker and vulnerability_checker.has_data()
+                        else None,
+                    ),
+                )
+    finally:
+        if dependencies_version_checker:
+            await dependencies_version_checker.close()
+        await transport.close()
+
+    report.skipped_checks = skipped_checks
+    _output_report(
+        report,
+        output_json,
+        shard,
+        fail_on=fail_on,
+        concurrency_stats=dependencies_version_checker.get_concurrency_stats()
+        if dependencies_version_checker
+        else None,
     )
 
-    runtime_informations: RuntimeInformations | None = None
-    if runtime_version:
-        try:
-            runtime_informations = await get_runtime_version_checker_for_parser(
-                type(parser_class)
-            ).get_runtime_informations(runtime_version)
-        except VerificationError:
-            runtime_informations = None
 
-    await _process_project(
-        dependencies,
-        dependencies_version_checker,
-        vulnerability_checker,
-        runtime_informations,
+@main.command()
+@click.argument("partial_reports", nargs=-1, required=True, type=click.Path())
+@fail_on_option
+def merge(partial_reports: tuple[str, ...], fail_on: list[PolicyRule] | None) -> None:
+    """Merge the JSON reports of the shards written with --shard and --output-json."""
+    click.secho(f"deps-report v{__version__}", fg="green")
+    report = merge_partial_reports(list(partial_reports))
+    if report is None:
+        click.secho("None of the partial reports can be read", fg="red")
+        click.get_current_context().exit(1)
+        return
+
+    click.secho("Partial reports merged", fg="yellow")
+    _output_report(report, fail_on=fail_on)
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", help="Host to listen on.")
+@click.option("--port", default=8484, type=int, help="Port to listen on.")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(),
+    default=None,
+    help="Listen on this Unix socket instead of host/port.",
+)
+@click.option(
+    "--refresh-interval",
+    default=DEFAULT_REFRESH_INTERVAL,
+    type=float,
+    help="Seconds between two refreshes of the vulnerabilities and runtimes data.",
+)
+@click.option(
+    "--versions-cache-ttl",
+    default=DEFAULT_VERSIONS_CACHE_TTL,
+    type=float,
+    help="Seconds during which a latest version found is kept in memory.",
+)
+@vulnerability_database_option
+@vulnerability_database_source_option
+@requests_timeouts_options
+@cache_dir_option
+@versions_store_options
+@http_transport_option
+@coroutine
+async def serve(
+    host: str,
+    port: int,
+    socket_path: str | None,
+    refresh_interval: float,
+    versions_cache_ttl: float,
+    vulnerability_database: str,
+    vulnerability_database_source: str | None,
+    connect_timeout: float,
+    read_timeout: float,
+    total_timeout: float,
+    cache_dir: str,
+    versions_store: bool,
+    versions_store_feed: str,
+    versions_store_repository: str,
+    http_transport: str,
+) -> None:
+    """Run a server keeping the checkers warm to generate reports."""
+    logging.basicConfig(level=logging.INFO)
+    click.secho(f"deps-report v{__version__} server", fg="green")
+    await run_server(
+        host,
+        port,
+        socket_path,
+        refresh_interval,
+        versions_cache_ttl,
+        vulnerability_database,
+        vulnerability_database_source,
+        _get_timeout(connect_timeout),
+        _get_timeout(read_timeout),
+        _get_timeout(total_timeout),
+        _get_versions_store(
+            versions_store, cache_dir, versions_store_feed, versions_store_repository
+        ),
+        _get_transport(http_transport),
+        os.path.join(cache_dir, CONCURRENCY_LIMITS_FILE_NAME),
     )
@@ -1,12 +1,32 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from packaging import version as version_parser
 
 from deps_report.models.dependency_repository import DependencyRepository
 
 
-@dataclass
+@lru_cache(maxsize=2**16)
+def parse_version(
+    version: str,
+) -> version_parser.Version | version_parser.LegacyVersion:
+    """Parse a version, sharing the parsed object between identical versions."""
+    return version_parser.parse(version)
+
+
+@dataclass(frozen=True, slots=True)
 class Dependency:
     name: str
     version: str
-    repositories: list[DependencyRepository]
+    repositories: tuple[DependencyRepository, ...]
     transitive: bool
     for_dev: bool
+    parsed_version: version_parser.Version | version_parser.LegacyVersion = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Intern the version string and cache its parsed value."""
+        object.__setattr__(self, "version", sys.intern(self.version))
+        object.__setattr__(self, "parsed_version", parse_version(self.version))
@@ -1,7 +1,47 @@
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+from urllib.parse import urlsplit, urlunsplit
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DependencyRepository:
     name: str
     url: str
+
+
+def get_url_without_credentials(url: str) -> str:
+    """Remove the user and password (e.g. an expanded token) of a repository URL."""
+    parsed_url = urlsplit(url)
+    if "@" not in parsed_url.netloc:
+        return url
+    return urlunsplit(parsed_url._replace(netloc=parsed_url.netloc.rpartition("@")[2]))
+
+
+# Maximum numbers of repositories and of tuples of repositories interned, the
+# least recently used ones are then only shared by the dependencies using them
+INTERNED_REPOSITORIES_MAX_SIZE = 2**10
+
+
+@lru_cache(maxsize=INTERNED_REPOSITORIES_MAX_SIZE)
+def intern_repository(name: str, url: str) -> DependencyRepository:
+    """Get the instance shared by all the dependencies for this repository."""
+    return DependencyRepository(name=name, url=url)
+
+
+@lru_cache(maxsize=INTERNED_REPOSITORIES_MAX_SIZE)
+def _intern_repositories_tuple(
+    repositories: tuple[DependencyRepository, ...]
+) -> tuple[DependencyRepository, ...]:
+    return repositories
+
+
+def intern_repositories(
+    repositories: Iterable[DependencyRepository],
+) -> tuple[DependencyRepository, ...]:
+    """Get the tuple of repositories shared by all the dependencies using them."""
+    repositories_tuple = tuple(
+        intern_repository(repository.name, repository.url)
+        for repository in repositories
+    )
+    return _intern_repositories_tuple(repositories_tuple)
@@ -1,3 +1,4 @@
 from deps_report.models.results.error_result import ErrorResult
+from deps_report.models.results.project_report import ProjectReport
 from deps_report.models.results.version_result import VersionResult
 from deps_report.models.results.vulnerability_result import VulnerabilityResult
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from deps_report.models.dependency import Dependency
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorResult:
     dependency: Dependency
     error: str
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+
+from deps_report.models.dependency import Dependency
+from deps_report.models.results.error_result import ErrorResult
+from deps_report.models.results.version_result import VersionResult
+from deps_report.models.results.vulnerability_result import VulnerabilityResult
+from deps_report.models.runtime_informations import RuntimeInformations
+
+
+@dataclass(slots=True)
+class ProjectReport:
+    versions_results: list[VersionResult] = field(default_factory=list)
+    vulnerabilities_results: list[VulnerabilityResult] = field(default_factory=list)
+    errors_results: list[ErrorResult] = field(default_factory=list)
+    runtime_informations: RuntimeInformations | None = None
+    unfinished_dependencies: list[Dependency] = field(default_factory=list)
+    bypassed_repositories: list[str] = field(default_factory=list)
+    missing_shards: list[str] = field(default_factory=list)
+    policy_failures: list[str] = field(default_factory=list)
+    skipped_checks: list[str] = field(default_factory=list)
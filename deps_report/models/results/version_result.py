@@ -1,10 +1,32 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
-from deps_report.models.dependency import Dependency
+from packaging import version as version_parser
 
+from deps_report.models.dependency import Dependency, parse_version
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class VersionResult:
     dependency: Dependency
     installed_version: str
     latest_version: str
+    installed_parsed_version: version_parser.Version | version_parser.LegacyVersion = (
+        field(init=False, repr=False, compare=False)
+    )
+    latest_parsed_version: version_parser.Version | version_parser.LegacyVersion = (
+        field(init=False, repr=False, compare=False)
+    )
+
+    def __post_init__(self) -> None:
+        """Intern the versions strings and cache their parsed values."""
+        object.__setattr__(
+            self, "installed_version", sys.intern(self.installed_version)
+        )
+        object.__setattr__(self, "latest_version", sys.intern(self.latest_version))
+        object.__setattr__(
+            self, "installed_parsed_version", parse_version(self.installed_version)
+        )
+        object.__setattr__(
+            self, "latest_parsed_version", parse_version(self.latest_version)
+        )
@@ -3,8 +3,9 @@ from dataclasses import dataclass
 from deps_report.models.dependency import Dependency
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VulnerabilityResult:
     dependency: Dependency
     advisory: str
     impacted_versions: str
+    safe_version: str | None = None
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuntimeInformations:
     name: str
     current_version: str
@@ -3,20 +3,30 @@ import re
 from deps_report.parsers.base import ParserBase
 from deps_report.parsers.python.pipenv import PythonPipenvParser
 from deps_report.parsers.python.poetry import PythonPoetryParser
+from deps_report.parsers.python.sbom import PythonSbomParser
 
 PARSERS_RULES = {
     r".*Pipfile(.lock)?$": PythonPipenvParser,
     r".*poetry.lock?$": PythonPoetryParser,
     r".*pyproject.toml?$": PythonPoetryParser,
+    r".*(bom|\.cdx)\.json$": PythonSbomParser,
+    r".*\.spdx\.json$": PythonSbomParser,
 }
 
 
 def get_parser_for_file_path(
     file_path: str,
+    expand_env: bool = True,
 ) -> ParserBase:
-    """Get the correct dependency parser according to the filename."""
+    """Get the correct dependency parser according to the filename.
+
+    The environment variables are not used to expand the templated repositories
+    URLs if `expand_env` is False (e.g. for files received from a client).
+    """
     for rule_regex, parser_class in PARSERS_RULES.items():
         if re.match(rule_regex, file_path):
-            return parser_class(file_path)  # type: ignore
+            parser: ParserBase = parser_class(file_path)  # type: ignore
+            parser.expand_env = expand_env
+            return parser
 
     raise ValueError(f"Cannot parse dependencies for {file_path}")
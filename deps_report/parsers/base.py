@@ -1,14 +1,44 @@
+import hashlib
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 from deps_report.models import Dependency
 
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class ParserBase(ABC):
+    # If the dependencies are found while the files are read (see iter_dependencies)
+    streams_dependencies = False
+    # If the templated repositories URLs are expanded with the environment variables
+    expand_env = True
+
+    @abstractmethod
+    def get_file_paths(self) -> list[str]:
+        """Return the paths of all the files read by the parser."""
+        pass
+
+    def get_content_hash(self) -> str:
+        """Return a hash of the content of all the files read by the parser."""
+        content_hash = hashlib.sha256()
+        for file_path in self.get_file_paths():
+            with open(file_path, "rb") as file:
+                file_hash = hashlib.sha256()
+                while chunk := file.read(HASH_CHUNK_SIZE):
+                    file_hash.update(chunk)
+                content_hash.update(file_hash.digest())
+        return content_hash.hexdigest()
+
     @abstractmethod
     def get_dependencies(self) -> list[Dependency]:
         """Parse the dependency file to return a list of the dependencies."""
         pass
 
+    async def iter_dependencies(self) -> AsyncIterator[Dependency]:
+        """Iterate over the dependencies, while they're parsed if the parser streams."""
+        for dependency in self.get_dependencies():
+            yield dependency
+
     @abstractmethod
     def get_runtime_version(self) -> str | None:
         """Return the runtime version according to the dependency file."""
@@ -1,6 +1,6 @@
-from deps_report.models import DependencyRepository
+from deps_report.models.dependency_repository import intern_repository
 
-DEFAULT_REPOSITORY = DependencyRepository(
+DEFAULT_REPOSITORY = intern_repository(
     name="pypi",
     url="https://pypi.org/simple",
 )
@@ -5,6 +5,10 @@ from typing import Any
 import toml
 
 from deps_report.models import Dependency, DependencyRepository
+from deps_report.models.dependency_repository import (
+    intern_repositories,
+    intern_repository,
+)
 from deps_report.parsers import ParserBase
 from deps_report.parsers.python.common import DEFAULT_REPOSITORY
 from deps_report.utils.templating import expand_template_string_with_env
@@ -33,6 +37,10 @@ class PythonPipenvParser(ParserBase):
             given_file_path
         )
 
+    def get_file_paths(self) -> list[str]:
+        """Return the paths of the Pipfile and Pipfile.lock files."""
+        return [self.pipenv_file_path, self.pipenv_lock_file_path]
+
     def _get_repositories(self) -> dict[str, DependencyRepository]:
         with open(self.pipenv_lock_file_path, "r") as lock_file:
             file_content = json.load(lock_file)
@@ -40,9 +48,11 @@ class PythonPipenvParser(ParserBase):
         parsed_repositories = {}
         for repository in file_content["_meta"]["sources"]:
             name = repository["name"]
-            parsed_repositories[name] = DependencyRepository(
+            parsed_repositories[name] = intern_repository(
                 name=name,
-                url=expand_template_string_with_env(repository["url"]),
+                url=expand_template_string_with_env(repository["url"])
+                if self.expand_env
+                else repository["url"],
             )
 
         if DEFAULT_REPOSITORY.name not in parsed_repositories:
@@ -54,22 +64,30 @@ class PythonPipenvParser(ParserBase):
         self,
         all_repositories: dict[str, DependencyRepository],
         dependency_dict: dict[str, Any],
-    ) -> list[DependencyRepository]:
+    ) -> tuple[DependencyRepository, ...]:
         # Check if repository specified in lockfile
         # if it's the case return list with this repo first,
         # but still include other as sometimes the explicit repository
         # is the wrong one
         explicit_repo = dependency_dict.get("index")
         if explicit_repo and explicit_repo in all_repositories:
-            return [all_repositories[explicit_repo]] + [
-                item for item in all_repositories.values() if item.name != explicit_repo
-            ]
+            return intern_repositories(
+                [all_repositories[explicit_repo]]
+                + [
+                    item
+                    for item in all_repositories.values()
+                    if item.name != explicit_repo
+                ]
+            )
 
-        return [DEFAULT_REPOSITORY] + [
-            item
-            for item in all_repositories.values()
-            if item.url != DEFAULT_REPOSITORY.url
-        ]
+        return intern_repositories(
+            [DEFAULT_REPOSITORY]
+            + [
+                item
+                for item in all_repositories.values()
+                if item.url != DEFAULT_REPOSITORY.url
+            ]
+        )
 
     def _is_transitive_dependency(
         self, pipenv_file_content: Any, dependency_name: str
@@ -124,8 +142,9 @@ class PythonPipenvParser(ParserBase):
             pipenv_file_content, lock_file_content, "develop", repositories
         )
 
+        parsed_names = {item.name for item in parsed_dependencies}
         for dependency in dev_dependencies:
-            if any(item.name == dependency.name for item in parsed_dependencies):
+            if dependency.name in parsed_names:
                 continue
             parsed_dependencies.append(dependency)
 
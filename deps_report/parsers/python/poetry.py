@@ -4,6 +4,7 @@ from typing import Any
 import toml
 
 from deps_report.models import Dependency, DependencyRepository
+from deps_report.models.dependency_repository import intern_repositories
 from deps_report.parsers import ParserBase
 from deps_report.parsers.python.common import DEFAULT_REPOSITORY
 
@@ -31,6 +32,10 @@ class PythonPoetryParser(ParserBase):
             "Invalid file path provided: you need to specify the path to your pyproject.toml or poetry.lock file"
         )
 
+    def get_file_paths(self) -> list[str]:
+        """Return the paths of the pyproject.toml and poetry.lock files."""
+        return [self.pyproject_file_path, self.poetry_lock_file_path]
+
     def _get_repositories(self) -> dict[str, DependencyRepository]:
         return {"pypi": DEFAULT_REPOSITORY}
 
@@ -54,6 +59,7 @@ class PythonPoetryParser(ParserBase):
             pyproject_file_content = toml.load(pyproject_file_path)
 
         repositories = self._get_repositories()
+        dependency_repositories = intern_repositories([repositories["pypi"]])
 
         dependencies: list[Dependency] = []
         for package in lock_file_content["package"]:
@@ -63,7 +69,7 @@ class PythonPoetryParser(ParserBase):
                     name=name,
                     version=package["version"],
                     for_dev=False,
-                    repositories=[repositories["pypi"]],
+                    repositories=dependency_repositories,
                     transitive=self._is_transitive_dependency(
                         pyproject_file_content, name
                     ),
@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any, AsyncIterator, Iterator
+from urllib.parse import parse_qs, unquote
+
+from packaging.utils import canonicalize_name
+
+from deps_report.models import Dependency
+from deps_report.models.dependency_repository import (
+    intern_repositories,
+    intern_repository,
+)
+from deps_report.parsers import ParserBase
+from deps_report.parsers.python.common import DEFAULT_REPOSITORY
+from deps_report.utils.json_stream import JsonStreamParser
+
+CHUNK_SIZE = 64 * 1024
+# Keys of the components arrays in CycloneDX and SPDX JSON documents
+CYCLONEDX_COMPONENTS_KEY = "components"
+SPDX_PACKAGES_KEY = "packages"
+
+
+def parse_pypi_purl(purl: str) -> tuple[str, str, str | None] | None:
+    """Get the name, version and repository URL of a PyPI package URL.
+
+    None is returned if it's not the purl of a PyPI package with a version
+    (e.g. `pkg:pypi/django@4.2.1?repository_url=https://pypi.org/simple`).
+    """
+    if not purl.startswith("pkg:"):
+        return None
+    purl = purl.removeprefix("pkg:").lstrip("/").split("#")[0]
+    path, _, qualifiers = purl.partition("?")
+    path, _, version = path.rpartition("@")
+    package_type, _, name = path.partition("/")
+    if package_type.lower() != "pypi" or not name or not version:
+        return None
+
+    repository_urls = parse_qs(qualifiers).get("repository_url")
+    return (
+        unquote(name.split("/")[-1]),
+        unquote(version),
+        repository_urls[0].rstrip("/") if repository_urls else None,
+    )
+
+
+def _iter_cyclonedx_purls(component: dict[str, Any]) -> Iterator[str]:
+    if component.get("purl"):
+        yield component["purl"]
+    for subcomponent in component.get("components", []):
+        yield from _iter_cyclonedx_purls(subcomponent)
+
+
+def _iter_spdx_purls(package: dict[str, Any]) -> Iterator[str]:
+    for reference in package.get("externalRefs", []):
+        if reference.get("referenceType") == "purl":
+            yield reference.get("referenceLocator", "")
+
+
+class PythonSbomParser(ParserBase):
+    """Parser of the PyPI packages of a CycloneDX or SPDX JSON SBOM.
+
+    The document is parsed while it's read, keeping only one component in memory,
+    and the packages are deduplicated by their package URL (purl). An SBOM has no
+    direct/transitive distinction, so all the packages are considered direct.
+    """
+
+    streams_dependencies = True
+
+    def __init__(self, given_file_path: str) -> None:
+        """Create the parser for the given SBOM file path."""
+        self.sbom_file_path = given_file_path
+
+    def get_file_paths(self) -> list[str]:
+        """Return the path of the SBOM file."""
+        return [self.sbom_file_path]
+
+    def _get_dependency(self, purl: str) -> Dependency | None:
+        package = parse_pypi_purl(purl)
+        if package is None:
+            return None
+
+        name, version, repository_url = package
+        repository = (
+            intern_repository(name=repository_url, url=repository_url)
+            if repository_url and repository_url != DEFAULT_REPOSITORY.url
+            else DEFAULT_REPOSITORY
+        )
+        return Dependency(
+            name=canonicalize_name(name),
+            version=version,
+            repositories=intern_repositories([repository]),
+            transitive=False,
+            for_dev=False,
+        )
+
+    def _get_new_dependencies(
+        self, items: list[tuple[str | None, Any]], seen_packages: set[Dependency]
+    ) -> Iterator[Dependency]:
+        for key, item in items:
+            if key == CYCLONEDX_COMPONENTS_KEY:
+                purls = _iter_cyclonedx_purls(item)
+            elif key == SPDX_PACKAGES_KEY:
+                purls = _iter_spdx_purls(item)
+            else:
+                continue
+
+            for purl in purls:
+                dependency = self._get_dependency(purl)
+                if dependency is not None and dependency not in seen_packages:
+                    seen_packages.add(dependency)
+                    yield dependency
+
+    def get_dependencies(self) -> list[Dependency]:
+        """Parse the SBOM file to return a list of its PyPI packages."""
+        parser = JsonStreamParser()
+        seen_packages: set[Dependency] = set()
+        dependencies: list[Dependency] = []
+        with open(self.sbom_file_path, "rb") as sbom_file:
+            while chunk := sbom_file.read(CHUNK_SIZE):
+                dependencies.extend(
+                    self._get_new_dependencies(parser.feed(chunk), seen_packages)
+                )
+        dependencies.extend(self._get_new_dependencies(parser.close(), seen_packages))
+        return dependencies
+
+    async def iter_dependencies(self) -> AsyncIterator[Dependency]:
+        """Iterate over the PyPI packages of the SBOM while the file is parsed.
+
+        The event loop runs between two chunks of the file, so the checks of the
+        packages already found can start.
+        """
+        parser = JsonStreamParser()
+        seen_packages: set[Dependency] = set()
+        with open(self.sbom_file_path, "rb") as sbom_file:
+            while chunk := sbom_file.read(CHUNK_SIZE):
+                for dependency in self._get_new_dependencies(
+                    parser.feed(chunk), seen_packages
+                ):
+                    yield dependency
+                await asyncio.sleep(0)
+        for dependency in self._get_new_dependencies(parser.close(), seen_packages):
+            yield dependency
+
+    def get_runtime_version(self) -> str | None:
+        """Return None, the runtime version is not known from an SBOM."""
+        return None
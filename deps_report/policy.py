@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+
+from deps_report.models import RuntimeInformations
+from deps_report.models.results import ProjectReport, VersionResult, VulnerabilityResult
+from deps_report.utils.output.common import classify_versions_results
+
+POLICY_FAILURE_EXIT_CODE = 3
+
+POLICY_RULES = {
+    "vulnerable": "vulnerable dependencies",
+    "outdated": "outdated dependencies",
+    "outdated-major": "outdated major versions",
+    "eol-runtime": "runtime version reached EOL",
+}
+
+# Check (see `--checks`) providing the results of each rule
+POLICY_RULES_CHECKS = {
+    "vulnerable": "vulnerabilities",
+    "outdated": "outdated",
+    "outdated-major": "outdated",
+    "eol-runtime": "runtime",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PolicyRule:
+    """Rule failing when at least `threshold` dependencies match its condition."""
+
+    name: str
+    threshold: int = 1
+
+    def __str__(self) -> str:
+        """Display the rule as `name` or `name:threshold`."""
+        return self.name if self.threshold == 1 else f"{self.name}:{self.threshold}"
+
+
+def parse_policy(value: str) -> list[PolicyRule]:
+    """Parse rules given as `name[:threshold],...`, raise ValueError if not valid."""
+    rules = []
+    for item in value.split(","):
+        name, separator, threshold = item.strip().partition(":")
+        if name not in POLICY_RULES:
+            raise ValueError(
+                f"Unknown policy rule {name}, expected one of {', '.join(POLICY_RULES)}"
+            )
+        if separator and (not threshold.isdigit() or int(threshold) < 1):
+            raise ValueError(f"Invalid threshold {threshold} for policy rule {name}")
+        rules.append(PolicyRule(name, int(threshold) if separator else 1))
+    return rules
+
+
+class FailurePolicy:
+    """Count the results of the checks against rules, to fail as soon as one is met."""
+
+    def __init__(self, rules: list[PolicyRule]) -> None:
+        """Create the policy with no results recorded."""
+        self.rules = rules
+        self._counts = {name: 0 for name in POLICY_RULES}
+        self._vulnerable_dependencies: set[str] = set()
+
+    def record_version(self, version_result: VersionResult | None) -> None:
+        """Record the version result of a dependency (None if it's up to date)."""
+        if version_result is None:
+            return
+        self._counts["outdated"] += 1
+        if classify_versions_results([version_result]).major:
+            self._counts["outdated-major"] += 1
+
+    def record_vulnerabilities(
+        self, vulnerabilities_results: list[VulnerabilityResult]
+    ) -> None:
+        """Record the vulnerabilities found in dependencies."""
+        self._vulnerable_dependencies.update(
+            item.dependency.name for item in vulnerabilities_results
+        )
+        self._counts["vulnerable"] = len(self._vulnerable_dependencies)
+
+    def record_runtime(self, runtime_informations: RuntimeInformations | None) -> None:
+        """Record the informations about the runtime version."""
+        if runtime_informations and runtime_informations.current_version_is_eol:
+            self._counts["eol-runtime"] = 1
+
+    def record_report(self, report: ProjectReport) -> None:
+        """Record all the results of a report."""
+        for version_result in report.versions_results:
+            self.record_version(version_result)
+        self.record_vulnerabilities(report.vulnerabilities_results)
+        self.record_runtime(report.runtime_informations)
+
+    @property
+    def failures(self) -> list[str]:
+        """Get the description of the rules met by the recorded results."""
+        return [
+            f"{self._counts[rule.name]} {POLICY_RULES[rule.name]} (--fail-on {rule})"
+            if rule.name != "eol-runtime"
+            else f"{POLICY_RULES[rule.name]} (--fail-on {rule})"
+            for rule in self.rules
+            if self._counts[rule.name] >= rule.threshold
+        ]
+
+    @property
+    def failed(self) -> bool:
+        """Return if any rule is met by the recorded results."""
+        return any(self._counts[rule.name] >= rule.threshold for rule in self.rules)
+
+
+def get_policy_failures(rules: list[PolicyRule], report: ProjectReport) -> list[str]:
+    """Get the description of the rules met by the results of a report."""
+    policy = FailurePolicy(rules)
+    policy.record_report(report)
+    return policy.failures
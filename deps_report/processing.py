@@ -1,58 +1,383 @@
+import asyncio
+import time
+from dataclasses import replace
+from typing import AsyncIterator
+
 from packaging import version as version_parser
+from packaging.version import Version
 
 from deps_report.dependencies_version_checkers import DependenciesVersionCheckerBase
-from deps_report.models import Dependency, VerificationError
-from deps_report.models.results import ErrorResult, VersionResult, VulnerabilityResult
+from deps_report.models import Dependency, RuntimeInformations, VerificationError
+from deps_report.models.results import (
+    ErrorResult,
+    ProjectReport,
+    VersionResult,
+    VulnerabilityResult,
+)
+from deps_report.policy import FailurePolicy
+from deps_report.utils.version_intervals import parse_version
 from deps_report.vulnerabilities_checkers import VulnerabilityCheckerBase
 
+VERSION_ERROR = "Could not fetch latest version"
+VULNERABILITY_ERROR = "Could not check for vulnerability status"
 
-async def process_dependency(
+CHECKS = ["vulnerabilities", "outdated", "runtime"]
+
+DependencyResults = tuple[
+    VersionResult | None, list[VulnerabilityResult], list[ErrorResult]
+]
+
+# Dependencies of a project, or a stream of them found while its files are parsed
+Dependencies = list[Dependency] | AsyncIterator[Dependency]
+
+
+def parse_checks(value: str) -> list[str]:
+    """Parse comma-separated checks names, raise ValueError if one is unknown."""
+    return validate_checks([item.strip() for item in value.split(",") if item.strip()])
+
+
+def validate_checks(checks: list[str]) -> list[str]:
+    """Return the given checks names, raise ValueError if one is unknown or none is given."""
+    for check in checks:
+        if check not in CHECKS:
+            raise ValueError(
+                f"Unknown check {check}, expected one of {', '.join(CHECKS)}"
+            )
+    if not checks:
+        raise ValueError("At least one check is required")
+    return checks
+
+
+async def check_dependency_version(
     version_checker: DependenciesVersionCheckerBase,
-    vulnerability_checker: VulnerabilityCheckerBase,
     dependency: Dependency,
-) -> tuple[VersionResult | None, VulnerabilityResult | None, list[ErrorResult]]:
-    """For a given dependencies and the associated checker instances, check if the version is the latest and if there is any vulnerabilities in the installed version."""
-    errors_results = []
-    version_result = None
-    vulnerability_result = None
-
+) -> tuple[VersionResult | None, list[ErrorResult]]:
+    """Check if the installed version of a dependency is the latest one."""
     try:
         latest_version = version_parser.parse(
             await version_checker.get_latest_version_of_dependency(dependency)
         )
     except VerificationError:
-        errors_results.append(
-            ErrorResult(
-                dependency=dependency,
-                error="Could not fetch latest version",
-            )
-        )
-        return version_result, vulnerability_result, errors_results
+        return None, [ErrorResult(dependency=dependency, error=VERSION_ERROR)]
 
-    current_version = version_parser.parse(dependency.version)
+    current_version = dependency.parsed_version
     if current_version < latest_version:
-        version_result = VersionResult(
-            dependency=dependency,
-            installed_version=str(current_version),
-            latest_version=str(latest_version),
+        return (
+            VersionResult(
+                dependency=dependency,
+                installed_version=str(current_version),
+                latest_version=str(latest_version),
+            ),
+            [],
         )
+    return None, []
+
+
+def check_dependency_vulnerabilities(
+    vulnerability_checker: VulnerabilityCheckerBase,
+    dependency: Dependency,
+    available_versions: list[Version] | None = None,
+) -> tuple[list[VulnerabilityResult], list[ErrorResult]]:
+    """Check if there is any vulnerabilities in the installed version of a dependency.
 
-    # Check if current version is vulnerable
+    If the available versions of the dependency are given, the first one without
+    any vulnerability is added to the results as the safe version to upgrade to.
+    """
     try:
-        vulnerability = vulnerability_checker.check_if_package_is_vulnerable(dependency)
+        vulnerabilities = vulnerability_checker.check_if_package_is_vulnerable(
+            dependency
+        )
     except VerificationError:
-        errors_results.append(
-            ErrorResult(
-                dependency=dependency,
-                error="Could not check for vulnerability status",
-            )
+        return [], [ErrorResult(dependency=dependency, error=VULNERABILITY_ERROR)]
+
+    safe_version = (
+        vulnerability_checker.get_safe_version(dependency, available_versions)
+        if vulnerabilities and available_versions
+        else None
+    )
+    return [
+        VulnerabilityResult(
+            dependency=dependency,
+            advisory=vulnerability.advisory,
+            impacted_versions=vulnerability.versions_impacted,
+            safe_version=safe_version,
         )
+        for vulnerability in vulnerabilities
+    ], []
+
+
+async def process_dependency(
+    version_checker: DependenciesVersionCheckerBase,
+    vulnerability_checker: VulnerabilityCheckerBase | None,
+    dependency: Dependency,
+) -> DependencyResults:
+    """For a given dependencies and the associated checker instances, check if the version is the latest and if there is any vulnerabilities in the installed version.
+
+    The vulnerabilities are not checked if no vulnerability checker is given.
+    """
+    version_result, errors_results = await check_dependency_version(
+        version_checker, dependency
+    )
+    if errors_results or vulnerability_checker is None:
+        return version_result, [], errors_results
+
+    vulnerabilities_results, errors_results = check_dependency_vulnerabilities(
+        vulnerability_checker,
+        dependency,
+        version_checker.get_available_versions(dependency),
+    )
+    return version_result, vulnerabilities_results, errors_results
+
+
+async def _collect_dependencies(
+    dependencies: AsyncIterator[Dependency], received_dependencies: list[Dependency]
+) -> AsyncIterator[Dependency]:
+    """Iterate over a stream of dependencies, adding them to the received ones."""
+    async for dependency in dependencies:
+        received_dependencies.append(dependency)
+        yield dependency
+
+
+async def check_dependencies(
+    dependencies: Dependencies,
+    version_checker: DependenciesVersionCheckerBase | None,
+    vulnerability_checker: VulnerabilityCheckerBase | None,
+    timeout: float | None = None,
+    policy: FailurePolicy | None = None,
+    vulnerabilities_first: bool = False,
+) -> tuple[dict[Dependency, DependencyResults], set[Dependency]]:
+    """Check the given dependencies, returning the results of each one and the unfinished ones.
+
+    The latest versions, or the vulnerabilities, are not checked if their checker is
+    not given. If a timeout (in seconds) is given, the dependencies not checked when
+    it is reached are cancelled and returned as unfinished. If a failure policy is
+    given, the remaining checks are also cancelled as soon as the results fail it.
+
+    With `vulnerabilities_first`, the vulnerabilities of all the dependencies (checked
+    without any request) are checked before fetching their latest versions, so they
+    are in the results of the unfinished dependencies too.
+
+    A stream of dependencies is checked while it's received, each dependency being
+    scheduled as soon as it's found (except with `vulnerabilities_first`, where the
+    whole stream is received first). The dependencies not received yet when the
+    checks are cancelled are not in the results.
+    """
+    results: dict[Dependency, DependencyResults] = {}
+    vulnerabilities_checked_first = vulnerability_checker is not None and (
+        vulnerabilities_first or version_checker is None
+    )
+    if vulnerability_checker is not None and vulnerabilities_checked_first:
+        if not isinstance(dependencies, list):
+            dependencies = [dependency async for dependency in dependencies]
+        for dependency in dependencies:
+            vulnerabilities_results, errors_results = check_dependency_vulnerabilities(
+                vulnerability_checker, dependency
+            )
+            results[dependency] = (None, vulnerabilities_results, errors_results)
+            if policy:
+                policy.record_vulnerabilities(vulnerabilities_results)
+
+    if version_checker is None:
+        return results, set()
+    checker = version_checker
+
+    received_dependencies: list[Dependency] = []
+    tasks: dict[Dependency, asyncio.Task] = {}
+
+    def schedule_dependency(dependency: Dependency) -> None:
+        received_dependencies.append(dependency)
+        if policy is None or not policy.failed:
+            tasks[dependency] = asyncio.create_task(
+                process_dependency(
+                    checker,
+                    None if vulnerabilities_checked_first else vulnerability_checker,
+                    dependency,
+                )
+            )
+
+    async def receive_dependencies(stream: AsyncIterator[Dependency]) -> None:
+        async for dependency in stream:
+            schedule_dependency(dependency)
+
+    pending: set[asyncio.Task] = set()
+    if isinstance(dependencies, list):
+        # Direct dependencies are scheduled first, so they are checked first
+        # when requests are queued by the HTTP connections limit
+        for dependency in sorted(dependencies, key=lambda item: item.transitive):
+            schedule_dependency(dependency)
     else:
-        if vulnerability:
-            vulnerability_result = VulnerabilityResult(
-                dependency=dependency,
-                advisory=vulnerability.advisory,
-                impacted_versions=vulnerability.versions_impacted,
+        receiving_task = asyncio.create_task(receive_dependencies(dependencies))
+        pending.add(receiving_task)
+    scheduled_count = len(tasks)
+    pending.update(tasks.values())
+
+    # With a policy, the results are recorded as soon as each check completes
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    try:
+        while pending and not (policy and policy.failed):
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(deadline - time.monotonic(), 0) if deadline else None,
+                return_when=asyncio.FIRST_COMPLETED
+                if policy
+                else asyncio.ALL_COMPLETED,
             )
+            if not done:
+                break
+            for task in done:
+                if not isinstance(dependencies, list) and task is receiving_task:
+                    # Raise the parsing errors of the stream
+                    task.result()
+                elif policy:
+                    version_result, vulnerabilities_results, _ = task.result()
+                    policy.record_version(version_result)
+                    policy.record_vulnerabilities(vulnerabilities_results)
+
+            # Wait for the dependencies received from the stream in the meantime
+            pending.update(list(tasks.values())[scheduled_count:])
+            scheduled_count = len(tasks)
+    finally:
+        # Including the dependencies received from the stream since the last wait
+        pending.update(list(tasks.values())[scheduled_count:])
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    unfinished_dependencies = set()
+    for dependency in received_dependencies:
+        if dependency not in tasks or tasks[dependency].cancelled():
+            unfinished_dependencies.add(dependency)
+            continue
+
+        version_result, vulnerabilities_results, errors_results = tasks[
+            dependency
+        ].result()
+        if vulnerability_checker is not None and vulnerabilities_checked_first:
+            _, vulnerabilities_results, vulnerabilities_errors = results[dependency]
+            errors_results = [*errors_results, *vulnerabilities_errors]
+            # The available versions are only known now to get the safe version
+            available_versions = version_checker.get_available_versions(dependency)
+            if vulnerabilities_results and available_versions:
+                safe_version = vulnerability_checker.get_safe_version(
+                    dependency, available_versions
+                )
+                vulnerabilities_results = [
+                    replace(item, safe_version=safe_version)
+                    for item in vulnerabilities_results
+                ]
+        results[dependency] = version_result, vulnerabilities_results, errors_results
+
+    return results, unfinished_dependencies
+
+
+def build_project_report(
+    dependencies: list[Dependency],
+    results: dict[Dependency, DependencyResults],
+    unfinished_dependencies: set[Dependency],
+    version_checker: DependenciesVersionCheckerBase | None,
+    runtime_informations: RuntimeInformations | None,
+) -> ProjectReport:
+    """Gather the results of the dependencies in a report."""
+    report = ProjectReport(
+        runtime_informations=runtime_informations,
+        bypassed_repositories=version_checker.get_bypassed_repositories(dependencies)
+        if version_checker
+        else [],
+    )
+    for dependency in dependencies:
+        if dependency in unfinished_dependencies:
+            report.unfinished_dependencies.append(dependency)
+        if dependency not in results:
+            continue
+
+        version_result, vulnerabilities_results, errors_results = results[dependency]
+        if version_result:
+            report.versions_results.append(version_result)
+        report.vulnerabilities_results.extend(vulnerabilities_results)
+        report.errors_results.extend(errors_results)
+
+    return report
+
+
+async def process_project(
+    dependencies: Dependencies,
+    version_checker: DependenciesVersionCheckerBase | None,
+    vulnerability_checker: VulnerabilityCheckerBase | None,
+    runtime_informations: RuntimeInformations | None,
+    timeout: float | None = None,
+    policy: FailurePolicy | None = None,
+    vulnerabilities_first: bool = False,
+) -> ProjectReport:
+    """Check all the dependencies of a project and gather the results in a report.
+
+    If a timeout (in seconds) is given, the dependencies not checked when it is
+    reached are cancelled and listed as unfinished in the report, as when the
+    given failure policy fails (see `check_dependencies`).
+    """
+    received_dependencies = dependencies if isinstance(dependencies, list) else []
+    results, unfinished_dependencies = await check_dependencies(
+        dependencies
+        if isinstance(dependencies, list)
+        else _collect_dependencies(dependencies, received_dependencies),
+        version_checker,
+        vulnerability_checker,
+        timeout,
+        policy,
+        vulnerabilities_first,
+    )
+    return build_project_report(
+        received_dependencies,
+        results,
+        unfinished_dependencies,
+        version_checker,
+        runtime_informations,
+    )
+
+
+def recheck_project_vulnerabilities(
+    report: ProjectReport,
+    dependencies: list[Dependency],
+    vulnerability_checker: VulnerabilityCheckerBase,
+) -> ProjectReport:
+    """Check again the vulnerabilities of a report, keeping its versions results.
+
+    The available versions of the dependencies are not known, so the previous safe
+    version of a vulnerable dependency is kept if it's still safe.
+    """
+    new_report = ProjectReport(
+        versions_results=report.versions_results,
+        errors_results=[
+            item for item in report.errors_results if item.error != VULNERABILITY_ERROR
+        ],
+        runtime_informations=report.runtime_informations,
+        unfinished_dependencies=report.unfinished_dependencies,
+        bypassed_repositories=report.bypassed_repositories,
+        missing_shards=report.missing_shards,
+    )
+
+    # Vulnerabilities are not checked when the latest version cannot be fetched.
+    # The dependencies are matched by name and version, as the repositories of the
+    # cached ones may not have their credentials
+    not_checked_dependencies = {
+        (item.dependency.name, item.dependency.version)
+        for item in new_report.errors_results
+    } | {(item.name, item.version) for item in report.unfinished_dependencies}
+    safe_versions = {
+        (item.dependency.name, item.dependency.version): item.safe_version
+        for item in report.vulnerabilities_results
+        if item.safe_version
+    }
+    for dependency in dependencies:
+        key = (dependency.name, dependency.version)
+        if key in not_checked_dependencies:
+            continue
+        safe_version = parse_version(safe_versions.get(key) or "")
+        vulnerabilities_results, errors_results = check_dependency_vulnerabilities(
+            vulnerability_checker,
+            dependency,
+            [safe_version] if safe_version is not None else None,
+        )
+        new_report.vulnerabilities_results.extend(vulnerabilities_results)
+        new_report.errors_results.extend(errors_results)
 
-    return version_result, vulnerability_result, errors_results
+    return new_report
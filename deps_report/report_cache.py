@@ -0,0 +1,103 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from deps_report import __version__
+from deps_report.models import DependencyRepository
+from deps_report.models.results import ProjectReport
+from deps_report.parsers import ParserBase
+from deps_report.utils.serialization import report_from_dict, report_to_dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "deps-report",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedReport:
+    report: ProjectReport
+    created_at: float
+    vulnerabilities_dataset_version: str | None
+
+
+def get_report_cache_key(parser: ParserBase, *options: str | None) -> str:
+    """Get the cache key of the report of a project checked with the given options."""
+    key = hashlib.sha256(f"{__version__}:{parser.get_content_hash()}".encode())
+    for option in options:
+        key.update(f":{option}".encode())
+    return key.hexdigest()
+
+
+class ReportCache:
+    """Cache on disk of the reports, keeping them for `max_age` seconds."""
+
+    def __init__(self, cache_dir: str, max_age: float) -> None:
+        """Create the cache storing the reports in the given directory."""
+        self.reports_dir = os.path.join(cache_dir, "reports")
+        self.max_age = max_age
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.reports_dir, f"{key}.json")
+
+    def get(
+        self, key: str, repositories: Iterable[DependencyRepository] = ()
+    ) -> CachedReport | None:
+        """Get the cached report for the key, if it's still fresh.
+
+        The repositories URLs are stored without their credentials, the given
+        repositories of the project are used instead (see `report_from_dict`).
+        """
+        try:
+            with open(self._get_path(key), "r") as cache_file:
+                data = json.load(cache_file)
+            cached_report = CachedReport(
+                report=report_from_dict(data["report"], repositories),
+                created_at=data["created_at"],
+                vulnerabilities_dataset_version=data["vulnerabilities_dataset_version"],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable cached report %s", key)
+            return None
+
+        if time.time() - cached_report.created_at > self.max_age:
+            return None
+        return cached_report
+
+    def set(self, key: str, cached_report: CachedReport) -> None:
+        """Store the report for the key, removing the expired ones."""
+        data = {
+            "report": report_to_dict(cached_report.report),
+            "created_at": cached_report.created_at,
+            "vulnerabilities_dataset_version": cached_report.vulnerabilities_dataset_version,
+        }
+        try:
+            os.makedirs(self.reports_dir, exist_ok=True)
+            self._remove_expired()
+            # Write then rename the file, so concurrent runs never read a partial one
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.reports_dir)
+            with os.fdopen(file_descriptor, "w") as cache_file:
+                json.dump(data, cache_file)
+            os.replace(temporary_path, self._get_path(key))
+        except OSError:
+            logger.warning(
+                "Cannot store the report in cache directory %s", self.reports_dir
+            )
+
+    def _remove_expired(self) -> None:
+        expiration_time = time.time() - self.max_age
+        for entry in os.scandir(self.reports_dir):
+            if entry.name.endswith(".json") and entry.stat().st_mtime < expiration_time:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
@@ -7,6 +7,11 @@ logger = logging.getLogger(__name__)
 
 
 class RuntimeVersionCheckerBase(ABC):
+    @abstractmethod
+    async def refresh(self) -> None:
+        """Download again the runtime versions data used by the checker."""
+        pass
+
     @abstractmethod
     async def get_runtime_informations(
         self, current_version: str
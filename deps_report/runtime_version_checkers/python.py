@@ -1,35 +1,57 @@
-import json
 import logging
 import re
 from datetime import date, timedelta
+from typing import Any
 
-import aiohttp
-from aiohttp.client_exceptions import ClientConnectionError, ClientError
 from dateutil.parser import parse
 
 from deps_report.models import RuntimeInformations, VerificationError
 from deps_report.runtime_version_checkers import RuntimeVersionCheckerBase
+from deps_report.transports import TransportBase, TransportError, use_transport
+from deps_report.utils.json_stream import iter_json_stream
 
 logger = logging.getLogger(__name__)
 
 PYTHON_ENDOFLIFE_DATE_API = "https://endoflife.date/api/python.json"
+ENDOFLIFE_DATE_FIELDS = ("cycle", "latest", "eol")
 
 
 class PythonRuntimeVersionChecker(RuntimeVersionCheckerBase):
-    async def get_runtime_informations(
-        self, current_version: str
-    ) -> RuntimeInformations:
-        """Get informations about your project runtime according to your current version."""
+    def __init__(self, transport: TransportBase | None = None) -> None:
+        """Initialize the Python runtime version checker.
+
+        The data is downloaded with the given transport, or with a temporary default
+        one.
+        """
+        self.data: list[dict[str, Any]] | None = None
+        self.transport = transport
+
+    async def refresh(self) -> None:
+        """Download again the endoflife.date data used by the checker."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(PYTHON_ENDOFLIFE_DATE_API) as response:
-                    response.raise_for_status()
-                    data = json.loads(await response.text())
-        except (ClientConnectionError, ClientError):
+            async with use_transport(self.transport) as transport:
+                self.data = [
+                    {field: item.get(field) for field in ENDOFLIFE_DATE_FIELDS}
+                    async for _, item in iter_json_stream(
+                        transport.stream(
+                            PYTHON_ENDOFLIFE_DATE_API,
+                            headers={"Accept-Encoding": "gzip, deflate"},
+                        )
+                    )
+                ]
+        except (TransportError, ValueError):
             error_msg = "Cannot download endoflife.date data, will skip runtime version checking"
             logger.error(error_msg)
             raise VerificationError(error_msg)
 
+    async def get_runtime_informations(
+        self, current_version: str
+    ) -> RuntimeInformations:
+        """Get informations about your project runtime according to your current version."""
+        if self.data is None:
+            await self.refresh()
+        data = self.data or []
+
         # If the current version includes a patch level, we remove it else we cannot compare it
         version_with_patch_pattern = re.compile("[0-9]\\.[0-9]+\\.[0-9]+")
         if re.match(version_with_patch_pattern, current_version):
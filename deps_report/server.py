@@ -0,0 +1,153 @@
+import asyncio
+import logging
+from typing import Any
+
+from aiohttp import web
+
+from deps_report import __version__
+from deps_report.api import Scanner
+from deps_report.dependencies_version_checkers.versions_store import LatestVersionsStore
+from deps_report.models.results import ProjectReport
+from deps_report.transports import TransportBase
+from deps_report.utils.serialization import report_to_dict
+from deps_report.vulnerabilities_checkers import DEFAULT_VULNERABILITY_DATABASE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 3600
+DEFAULT_VERSIONS_CACHE_TTL = 600
+
+
+class ReportServer:
+    """Keep the checkers and their datasets warm between reports requests."""
+
+    def __init__(
+        self,
+        refresh_interval: float,
+        versions_cache_ttl: float,
+        vulnerability_database: str = DEFAULT_VULNERABILITY_DATABASE,
+        vulnerability_database_source: str | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        total_timeout: float | None = None,
+        versions_store: LatestVersionsStore | None = None,
+        transport: TransportBase | None = None,
+        concurrency_limits_path: str | None = None,
+    ) -> None:
+        """Initialize the server state, the checkers are created on first use.
+
+        All the checkers share the given transport (or a default one), which is
+        closed with the server.
+        """
+        self.refresh_interval = refresh_interval
+        self.scanner = Scanner(
+            vulnerability_database,
+            vulnerability_database_source,
+            versions_cache_ttl,
+            connect_timeout,
+            read_timeout,
+            total_timeout,
+            versions_store,
+            transport,
+            concurrency_limits_path,
+        )
+
+    async def refresh(self) -> None:
+        """Download again the datasets of all the checkers already created."""
+        await self.scanner.refresh()
+
+    async def refresh_periodically(self) -> None:
+        """Refresh the datasets every `refresh_interval` seconds."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            logger.info("Refreshing checkers datasets")
+            await self.refresh()
+
+    async def close(self) -> None:
+        """Release the resources held by the checkers."""
+        await self.scanner.close()
+
+    async def get_report(
+        self, file_name: str, files: dict[str, str], deadline: float | None = None
+    ) -> ProjectReport:
+        """Generate the report for the given dependencies files contents.
+
+        The dependencies not checked after `deadline` seconds are reported as
+        unfinished.
+        """
+        return await self.scanner.scan_contents(file_name, files, deadline=deadline)
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        """Return the server status."""
+        return web.json_response({"version": __version__})
+
+    async def handle_report(self, request: web.Request) -> web.Response:
+        """Return the report for the dependencies files sent in the request body."""
+        try:
+            body: dict[str, Any] = await request.json()
+            report = await self.get_report(
+                body["file_name"], body["files"], body.get("deadline")
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        return web.json_response(report_to_dict(report))
+
+    def create_app(self) -> web.Application:
+        """Create the aiohttp application serving the reports."""
+        app = web.Application()
+        app.add_routes(
+            [
+                web.get("/health", self.handle_health),
+                web.post("/report", self.handle_report),
+            ]
+        )
+        return app
+
+
+async def run_server(
+    host: str,
+    port: int,
+    socket_path: str | None,
+    refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    versions_cache_ttl: float = DEFAULT_VERSIONS_CACHE_TTL,
+    vulnerability_database: str = DEFAULT_VULNERABILITY_DATABASE,
+    vulnerability_database_source: str | None = None,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    total_timeout: float | None = None,
+    versions_store: LatestVersionsStore | None = None,
+    transport: TransportBase | None = None,
+    concurrency_limits_path: str | None = None,
+) -> None:
+    """Serve reports over HTTP (or a Unix socket if a path is given) until cancelled."""
+    server = ReportServer(
+        refresh_interval,
+        versions_cache_ttl,
+        vulnerability_database,
+        vulnerability_database_source,
+        connect_timeout,
+        read_timeout,
+        total_timeout,
+        versions_store,
+        transport,
+        concurrency_limits_path,
+    )
+    runner = web.AppRunner(server.create_app())
+    await runner.setup()
+
+    site: web.BaseSite
+    if socket_path:
+        site = web.UnixSite(runner, socket_path)
+    else:
+        site = web.TCPSite(runner, host, port)
+    await site.start()
+    logger.info(f"deps-report server listening on {site.name}")
+
+    refresh_task = asyncio.create_task(server.refresh_periodically())
+    try:
+        await asyncio.Event().wait()
+    finally:
+        refresh_task.cancel()
+        await server.close()
+        await runner.cleanup()
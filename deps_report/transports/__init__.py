@@ -0,0 +1,52 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from deps_report.transports.aiohttp_transport import AiohttpTransport
+from deps_report.transports.base import (
+    HTTPStatusError,
+    Response,
+    Timeout,
+    TransportBase,
+    TransportError,
+    TransportTimeoutError,
+)
+
+DEFAULT_TRANSPORT = "aiohttp"
+
+TRANSPORTS = ["aiohttp", "httpx"]
+
+
+def get_transport(name: str = DEFAULT_TRANSPORT) -> TransportBase:
+    """Get the HTTP transport with the given name.
+
+    The httpx (HTTP/2) transport requires httpx with its http2 extra, which is not
+    installed by default.
+    """
+    if name == "aiohttp":
+        return AiohttpTransport()
+    if name == "httpx":
+        try:
+            from deps_report.transports.httpx_transport import HttpxTransport
+        except ImportError:
+            raise ValueError(
+                'The httpx transport requires the http2 extra: pip install "deps-report[http2]"'
+            )
+        return HttpxTransport()
+
+    raise NotImplementedError(f"Transport {name} is not implemented")
+
+
+@asynccontextmanager
+async def use_transport(
+    transport: TransportBase | None,
+) -> AsyncIterator[TransportBase]:
+    """Use the given transport, or a default one closed when leaving the context."""
+    if transport is not None:
+        yield transport
+        return
+
+    default_transport = get_transport()
+    try:
+        yield default_transport
+    finally:
+        await default_transport.close()
@@ -0,0 +1,92 @@
+import asyncio
+from typing import AsyncIterator, Mapping
+
+import aiohttp
+from aiohttp.client import ClientSession
+from aiohttp.client_exceptions import ClientConnectionError, ClientError
+
+from deps_report.transports.base import (
+    DEFAULT_TIMEOUT,
+    HTTPStatusError,
+    Response,
+    Timeout,
+    TransportBase,
+    TransportError,
+    TransportTimeoutError,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _get_client_timeout(timeout: Timeout | None) -> aiohttp.ClientTimeout:
+    timeout = timeout or DEFAULT_TIMEOUT
+    return aiohttp.ClientTimeout(
+        total=timeout.total, connect=timeout.connect, sock_read=timeout.read
+    )
+
+
+class AiohttpTransport(TransportBase):
+    """HTTP/1.1 transport sending the requests with a shared aiohttp session."""
+
+    def __init__(self) -> None:
+        """Create the transport, the session is created on first use."""
+        self._session: ClientSession | None = None
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | str | None = None,
+        timeout: Timeout | None = None,
+    ) -> Response:
+        """Send a request and read its whole response."""
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                headers=headers,
+                data=data,
+                timeout=_get_client_timeout(timeout),
+            ) as response:
+                return Response(
+                    url=url,
+                    status=response.status,
+                    headers=response.headers,
+                    content=await response.read(),
+                )
+        except asyncio.TimeoutError as e:
+            raise TransportTimeoutError(f"Timeout for {url}") from e
+        except (ClientConnectionError, ClientError) as e:
+            raise TransportError(str(e)) from e
+
+    async def stream(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: Timeout | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Send a GET request and iterate over the chunks of its content."""
+        try:
+            async with self._get_session().get(
+                url, headers=headers, timeout=_get_client_timeout(timeout)
+            ) as response:
+                if response.status >= 400:
+                    raise HTTPStatusError(response.status, url)
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    yield chunk
+        except asyncio.TimeoutError as e:
+            raise TransportTimeoutError(f"Timeout for {url}") from e
+        except (ClientConnectionError, ClientError) as e:
+            raise TransportError(str(e)) from e
+
+    async def close(self) -> None:
+        """Close the aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
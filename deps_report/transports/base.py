@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Mapping
+
+
+class TransportError(Exception):
+    """Error while sending a request or receiving its response."""
+
+    pass
+
+
+class TransportTimeoutError(TransportError):
+    """A request did not complete before its timeout."""
+
+    pass
+
+
+class HTTPStatusError(TransportError):
+    """A response has an error status."""
+
+    def __init__(self, status: int, url: str) -> None:
+        """Create the error for a response status."""
+        super().__init__(f"HTTP error {status} for {url}")
+        self.status = status
+
+
+@dataclass(frozen=True, slots=True)
+class Timeout:
+    """Timeouts of a request in seconds, None meaning no timeout."""
+
+    connect: float | None = None
+    read: float | None = None
+    total: float | None = None
+
+
+# Timeout of the requests sent without any (e.g. the datasets downloads), the
+# default one of aiohttp
+DEFAULT_TIMEOUT = Timeout(connect=30, total=5 * 60)
+
+
+@dataclass(frozen=True, slots=True)
+class Response:
+    url: str
+    status: int
+    headers: Mapping[str, str]
+    content: bytes
+
+    def text(self) -> str:
+        """Decode the content of the response."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        """Raise an HTTPStatusError if the response has an error status."""
+        if self.status >= 400:
+            raise HTTPStatusError(self.status, self.url)
+
+
+class TransportBase(ABC):
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | str | None = None,
+        timeout: Timeout | None = None,
+    ) -> Response:
+        """Send a request and read its whole response.
+
+        The default timeout is used if none is given. TransportTimeoutError is raised if a timeout is reached, TransportError for
+        the other errors (the status of the response is not checked).
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: Timeout | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Send a GET request and iterate over the (decompressed) chunks of its content.
+
+        The default timeout is used if none is given. HTTPStatusError is raised before any chunk if the response has an error status.
+        """
+        pass
+
+    async def close(self) -> None:
+        """Close the connections of the transport."""
+        pass
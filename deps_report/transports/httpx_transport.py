@@ -0,0 +1,113 @@
+import asyncio
+import time
+from typing import AsyncIterator, Mapping
+
+import httpx
+
+from deps_report.transports.base import (
+    DEFAULT_TIMEOUT,
+    HTTPStatusError,
+    Response,
+    Timeout,
+    TransportBase,
+    TransportError,
+    TransportTimeoutError,
+)
+
+
+def _get_httpx_timeout(timeout: Timeout) -> httpx.Timeout:
+    return httpx.Timeout(None, connect=timeout.connect, read=timeout.read)
+
+
+def _get_remaining_time(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
+
+
+class HttpxTransport(TransportBase):
+    """HTTP/2 transport, multiplexing the requests to a host over a few connections.
+
+    HTTP/2 is negotiated with TLS (ALPN), the hosts not supporting it are reached
+    with HTTP/1.1.
+    """
+
+    def __init__(self) -> None:
+        """Create the transport, the client is created on first use."""
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            # Follow the redirections like aiohttp (e.g. to the normalized simple URL)
+            self._client = httpx.AsyncClient(http2=True, follow_redirects=True)
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | str | None = None,
+        timeout: Timeout | None = None,
+    ) -> Response:
+        """Send a request and read its whole response."""
+        timeout = timeout or DEFAULT_TIMEOUT
+        try:
+            response = await asyncio.wait_for(
+                self._get_client().request(
+                    method,
+                    url,
+                    headers=headers,
+                    content=data,
+                    timeout=_get_httpx_timeout(timeout),
+                ),
+                timeout.total,
+            )
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+            raise TransportTimeoutError(f"Timeout for {url}") from e
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+
+        return Response(
+            url=url,
+            status=response.status_code,
+            headers=response.headers,
+            content=response.content,
+        )
+
+    async def stream(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: Timeout | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Send a GET request and iterate over the chunks of its content."""
+        timeout = timeout or DEFAULT_TIMEOUT
+        deadline = (
+            time.monotonic() + timeout.total if timeout.total is not None else None
+        )
+        try:
+            async with self._get_client().stream(
+                "GET", url, headers=headers, timeout=_get_httpx_timeout(timeout)
+            ) as response:
+                if response.status_code >= 400:
+                    raise HTTPStatusError(response.status_code, url)
+                chunks = response.aiter_bytes()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(), _get_remaining_time(deadline)
+                        )
+                    except StopAsyncIteration:
+                        break
+                    yield chunk
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+            raise TransportTimeoutError(f"Timeout for {url}") from e
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+
+    async def close(self) -> None:
+        """Close the httpx client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
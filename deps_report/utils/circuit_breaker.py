@@ -0,0 +1,48 @@
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Circuit breaker used to stop calling a service known to be unhealthy.
+
+    The circuit opens after `failure_threshold` consecutive failures, every request is
+    then refused until `probe_interval` seconds have passed. A single probe request is
+    then allowed (half-open state): the circuit closes again if it succeeds, else it
+    stays open for another interval.
+    """
+
+    def __init__(self, failure_threshold: int = 3, probe_interval: float = 30) -> None:
+        """Create a closed circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.state = CLOSED
+        self._failures_count = 0
+        self._opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Check if a request can be made, the first allowed after opening is a probe."""
+        if self.state == CLOSED:
+            return True
+
+        # Also allow a new probe if the previous one never completed
+        if time.monotonic() - self._opened_at >= self.probe_interval:
+            self.state = HALF_OPEN
+            self._opened_at = time.monotonic()
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = CLOSED
+        self._failures_count = 0
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit if needed."""
+        self._failures_count += 1
+        if self.state == HALF_OPEN or self._failures_count >= self.failure_threshold:
+            self.state = OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,18 @@
+from typing import Any
+
+import click
+
+
+class DefaultCommandGroup(click.Group):
+    """Click group running a default command when no known sub-command is given."""
+
+    def __init__(self, *args: Any, default_command: str, **kwargs: Any) -> None:
+        """Create the group, `default_command` is the name of the fallback command."""
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Prepend the default command name if args don't start with a command."""
+        if not args or (args[0] not in self.commands and args[0] != "--help"):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
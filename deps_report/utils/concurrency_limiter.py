@@ -0,0 +1,251 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_LIMITS_FILE_NAME = "concurrency_limits.json"
+
+DEFAULT_INITIAL_LIMIT = 10
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 200
+# Number of the latest responses latencies used for the percentiles
+LATENCY_WINDOW = 50
+MIN_LATENCY_SAMPLES = 10
+# The limit decreases when the p90 latency exceeds its baseline (its moving
+# average) by this factor
+LATENCY_TOLERANCE = 1.5
+# Time (in seconds) for the baseline to move by two thirds towards a new p90
+# latency, so a lasting slowdown ends up being accepted
+BASELINE_LATENCY_PERIOD = 60
+LATENCY_DECREASE_FACTOR = 0.9
+OVERLOAD_DECREASE_FACTOR = 0.5
+# Minimum time between two decreases, when the round trip is shorter or unknown
+MIN_DECREASE_INTERVAL = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class ConcurrencyStats:
+    """Requests sent to a host, and its concurrency limit at the end of the run."""
+
+    host: str
+    limit: int
+    max_in_flight: int
+    requests: int
+    overloads: int
+    throughput: float
+    latency_p50: float | None
+    latency_p90: float | None
+
+
+def _get_percentile(values: list[float], percentile: float) -> float:
+    sorted_values = sorted(values)
+    return sorted_values[min(int(len(sorted_values) * percentile), len(values) - 1)]
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit of concurrent requests to a host, adjusted to its responses (AIMD).
+
+    The limit increases additively while all the slots are used and the host answers
+    quickly: by one per response in slow start (until the first decrease, doubling
+    the limit at each round trip), then by one per round trip. It's multiplied by
+    0.5 when the host is overloaded (throttling responses, connection errors and
+    timeouts) and by 0.9 when the p90 latency exceeds 1.5 times its moving average,
+    at most once per round trip. The failures without any response since the
+    previous decrease (e.g. the refused connections of an outage) don't decrease it
+    again. The waiting requests get the slots in their order.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        slow_start: bool = True,
+    ) -> None:
+        """Create the limiter, without slow start if the initial limit is a learned one."""
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = min(max(float(initial_limit), min_limit), max_limit)
+        self.slow_start = slow_start
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests_count = 0
+        self.overloads_count = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._baseline_latency: float | None = None
+        self._baseline_samples = 0
+        self._baseline_updated_at = 0.0
+        self._decreased_at: float | None = None
+        self._responded_since_decrease = True
+        self._failed_since_success = False
+        self._first_request_at: float | None = None
+        self._last_response_at = 0.0
+
+    def _take_slot(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self._first_request_at is None:
+            self._first_request_at = time.monotonic()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take_slot()
+                waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot, to be released once the request is done."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self._take_slot()
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been given just before the cancellation
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release a slot, giving it to the next waiting request."""
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    @property
+    def is_failing(self) -> bool:
+        """Whether the host failed since its last successful response, or never answered."""
+        return self._failed_since_success or not self._latencies
+
+    def _record_response(self, is_success: bool, has_response: bool = True) -> None:
+        self.requests_count += 1
+        self._last_response_at = time.monotonic()
+        self._failed_since_success = not is_success
+        if has_response:
+            self._responded_since_decrease = True
+
+    def _decrease(self, factor: float) -> None:
+        # The responses to the requests sent before a decrease reflect the same
+        # congestion, so it's not decreased again before they're received
+        now = time.monotonic()
+        round_trip = (
+            _get_percentile(list(self._latencies), 0.9) if self._latencies else 0
+        )
+        if self._decreased_at is not None and now - self._decreased_at < max(
+            round_trip, MIN_DECREASE_INTERVAL
+        ):
+            return
+        self._decreased_at = now
+        self._responded_since_decrease = False
+        self.limit = max(self.limit * factor, self.min_limit)
+        self.slow_start = False
+
+    def record_success(self, latency: float) -> None:
+        """Record the latency (in seconds) of a response, adjusting the limit."""
+        self._record_response(is_success=True)
+        self._latencies.append(latency)
+        if len(self._latencies) >= MIN_LATENCY_SAMPLES:
+            p90 = _get_percentile(list(self._latencies), 0.9)
+            # The p90 latency varies with the jitter of the host, so it's compared
+            # to its own average rather than to a lower percentile
+            baseline_latency = self._baseline_latency or p90
+            # Plain average of the first values, then exponential moving average
+            now = time.monotonic()
+            elapsed = now - self._baseline_updated_at
+            self._baseline_samples += 1
+            weight = max(
+                1 / self._baseline_samples,
+                1 - math.exp(-elapsed / BASELINE_LATENCY_PERIOD),
+            )
+            self._baseline_latency = (
+                baseline_latency + (p90 - baseline_latency) * weight
+            )
+            self._baseline_updated_at = now
+            if p90 > baseline_latency * LATENCY_TOLERANCE:
+                self._decrease(LATENCY_DECREASE_FACTOR)
+                return
+
+        # The limit only grows while it's reached, not with a few requests
+        if self.in_flight >= int(self.limit):
+            self.limit = min(
+                self.limit + (1 if self.slow_start else 1 / self.limit),
+                self.max_limit,
+            )
+            self._wake_waiters()
+
+    def record_overload(self) -> None:
+        """Record a throttling response or a timeout, decreasing the limit."""
+        self._record_response(is_success=False)
+        self.overloads_count += 1
+        self._decrease(OVERLOAD_DECREASE_FACTOR)
+
+    def record_failure(self) -> None:
+        """Record a request failed without any response, e.g. a refused connection.
+
+        The limit is decreased as for an overload, unless the host didn't answer
+        since the previous decrease: it's then down, rather than overloaded by the
+        requests, and the limit is kept for its recovery.
+        """
+        self._record_response(is_success=False, has_response=False)
+        self.overloads_count += 1
+        if self._responded_since_decrease:
+            self._decrease(OVERLOAD_DECREASE_FACTOR)
+
+    def get_stats(self, host: str) -> ConcurrencyStats:
+        """Get the statistics of the requests sent through the limiter."""
+        latencies = list(self._latencies)
+        duration = (
+            self._last_response_at - self._first_request_at
+            if self._first_request_at is not None
+            else 0
+        )
+        return ConcurrencyStats(
+            host=host,
+            limit=int(self.limit),
+            max_in_flight=self.max_in_flight,
+            requests=self.requests_count,
+            overloads=self.overloads_count,
+            throughput=self.requests_count / duration if duration > 0 else 0,
+            latency_p50=_get_percentile(latencies, 0.5) if latencies else None,
+            latency_p90=_get_percentile(latencies, 0.9) if latencies else None,
+        )
+
+
+def load_concurrency_limits(path: str) -> dict[str, float]:
+    """Load the concurrency limits per host learned by the previous runs."""
+    try:
+        with open(path, "r") as limits_file:
+            return {
+                host: float(limit) for host, limit in json.load(limits_file).items()
+            }
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, AttributeError, TypeError):
+        logger.warning("Ignoring unreadable concurrency limits %s", path)
+        return {}
+
+
+def save_concurrency_limits(path: str, limits: dict[str, float]) -> None:
+    """Store the concurrency limits per host, keeping the ones of the other hosts."""
+    data = {**load_concurrency_limits(path), **limits}
+    directory = os.path.dirname(path) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write then rename the file, so concurrent runs never read a partial one
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(file_descriptor, "w") as limits_file:
+            json.dump(data, limits_file)
+        os.replace(temporary_path, path)
+    except OSError:
+        logger.warning("Cannot store the concurrency limits in %s", path)
@@ -0,0 +1,175 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator
+
+WHITESPACES = " \t\n\r"
+WHITESPACES_PATTERN = re.compile(f"[{WHITESPACES}]*")
+VALUE_DELIMITERS = f"{WHITESPACES},]}}"
+
+# Parser states
+START = "start"
+OBJECT_START = "object_start"
+OBJECT_KEY = "object_key"
+OBJECT_VALUE = "object_value"
+OBJECT_NEXT = "object_next"
+ARRAY_START = "array_start"
+ARRAY_ITEM = "array_item"
+ARRAY_NEXT = "array_next"
+DONE = "done"
+
+
+class JsonStreamParser:
+    """Incremental parser yielding the items of a JSON document while it's received.
+
+    The items of a top-level array are returned one by one as `(None, item)`.
+    For a top-level object, the items of the array values are returned one by one
+    as `(key, item)` and the other values are returned as a whole as `(key, value)`.
+    Only the item being decoded is kept in memory, not the whole document.
+    """
+
+    def __init__(self) -> None:
+        """Create a parser waiting for the beginning of the document."""
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._state = START
+        self._key: str | None = None
+        self._is_finished = False
+
+    def _skip_whitespaces(self) -> bool:
+        """Skip whitespaces, return False if the end of the buffer is reached."""
+        match = WHITESPACES_PATTERN.match(self._buffer, self._position)
+        if match:
+            self._position = match.end()
+        return self._position < len(self._buffer)
+
+    def _consume_character(self, expected: str) -> str:
+        character = self._buffer[self._position]
+        if character not in expected:
+            raise ValueError(
+                f"Invalid JSON document: unexpected {character!r} at {self._position}"
+            )
+        self._position += 1
+        return character
+
+    def _decode_value(self) -> tuple[bool, Any]:
+        """Decode the value at the current position, if it's completely received."""
+        try:
+            value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            if self._is_finished:
+                raise
+            return False, None
+
+        # A number is complete only once a delimiter is received (e.g. "1" of "1.5")
+        if not self._is_finished and (
+            end == len(self._buffer)
+            or (
+                isinstance(value, (int, float))
+                and self._buffer[end] not in VALUE_DELIMITERS
+            )
+        ):
+            return False, None
+
+        self._position = end
+        return True, value
+
+    def _parse(self) -> list[tuple[str | None, Any]]:
+        items: list[tuple[str | None, Any]] = []
+
+        while self._state != DONE and self._skip_whitespaces():
+            if self._state == START:
+                if self._consume_character("[{") == "[":
+                    self._state = ARRAY_START
+                else:
+                    self._state = OBJECT_START
+            elif self._state == OBJECT_START:
+                if self._buffer[self._position] == "}":
+                    self._position += 1
+                    self._state = DONE
+                else:
+                    self._state = OBJECT_KEY
+            elif self._state == OBJECT_KEY:
+                key_position = self._position
+                is_decoded, key = self._decode_value()
+                if not is_decoded:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError(f"Invalid JSON document: key expected at {key}")
+                if not self._skip_whitespaces():
+                    # Wait for the separator with the key
+                    self._position = key_position
+                    break
+                self._consume_character(":")
+                self._key = key
+                self._state = OBJECT_VALUE
+            elif self._state == OBJECT_VALUE:
+                if self._buffer[self._position] == "[":
+                    self._position += 1
+                    self._state = ARRAY_START
+                    continue
+                is_decoded, value = self._decode_value()
+                if not is_decoded:
+                    break
+                items.append((self._key, value))
+                self._state = OBJECT_NEXT
+            elif self._state == OBJECT_NEXT:
+                if self._consume_character(",}") == ",":
+                    self._state = OBJECT_KEY
+                else:
+                    self._state = DONE
+            elif self._state == ARRAY_START:
+                if self._buffer[self._position] == "]":
+                    self._position += 1
+                    self._state = OBJECT_NEXT if self._key is not None else DONE
+                else:
+                    self._state = ARRAY_ITEM
+            elif self._state == ARRAY_ITEM:
+                is_decoded, value = self._decode_value()
+                if not is_decoded:
+                    break
+                items.append((self._key, value))
+                self._state = ARRAY_NEXT
+            elif self._state == ARRAY_NEXT:
+                if self._consume_character(",]") == ",":
+                    self._state = ARRAY_ITEM
+                else:
+                    self._state = OBJECT_NEXT if self._key is not None else DONE
+
+        # Drop what has already been parsed
+        position, self._position = self._position, 0
+        self._buffer = self._buffer[position:]
+        return items
+
+    def feed(self, data: bytes) -> list[tuple[str | None, Any]]:
+        """Add received data, return the items completely received."""
+        self._buffer += self._text_decoder.decode(data)
+        return self._parse()
+
+    def close(self) -> list[tuple[str | None, Any]]:
+        """Signal the end of the document, return the last items."""
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._is_finished = True
+        items = self._parse()
+        if self._state != DONE:
+            raise ValueError("Invalid JSON document: unexpected end of document")
+        if self._skip_whitespaces():
+            raise ValueError("Invalid JSON document: data after the end of document")
+        return items
+
+
+async def iter_json_stream(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[str | None, Any]]:
+    """Iterate over the items of a JSON document received as chunks of bytes.
+
+    See `JsonStreamParser` for the items returned.
+    """
+    parser = JsonStreamParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
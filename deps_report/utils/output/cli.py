@@ -1,23 +1,27 @@
 import click
 from tabulate import tabulate
 
-from deps_report.models.results import ErrorResult, VersionResult, VulnerabilityResult
-from deps_report.models.runtime_informations import RuntimeInformations
+from deps_report.models.results import ProjectReport
+from deps_report.utils.concurrency_limiter import ConcurrencyStats
 from deps_report.utils.output.common import (
-    get_dependencies_with_outdated_major,
+    ClassifiedVersionsResults,
     get_display_output_for_dependency,
 )
 
 
 def print_results_stdout(
-    versions_results: list[VersionResult],
-    vulnerabilities_results: list[VulnerabilityResult],
-    errors_results: list[ErrorResult],
-    runtime_informations: RuntimeInformations | None,
+    report: ProjectReport,
+    classified_versions_results: ClassifiedVersionsResults,
 ) -> None:
     """Print results as tables on stdout."""
+    runtime_informations = report.runtime_informations
     versions_headers = ["Dependency", "Installed version", "Latest version"]
-    vulnerabilities_headers = ["Dependency", "Advisory", "Versions impacted"]
+    vulnerabilities_headers = [
+        "Dependency",
+        "Advisory",
+        "Versions impacted",
+        "Safe version",
+    ]
     errors_headers = ["Dependency", "Error"]
 
     if runtime_informations and runtime_informations.current_version_is_outdated:
@@ -36,9 +40,30 @@ def print_results_stdout(
                 fg="red",
             )
 
-    if len(vulnerabilities_results) > 0:
+    for repository in report.bypassed_repositories:
         click.secho(
-            f"\n{len(vulnerabilities_results)} vulnerable dependencies found:", fg="red"
+            f"\nRepository {repository} was unhealthy and has been bypassed, some latest versions may come from other repositories or be missing.",
+            fg="yellow",
+        )
+
+    for shard in report.missing_shards:
+        click.secho(
+            f"\nShard {shard} is missing from the report, its dependencies have not been checked.",
+            fg="red",
+        )
+
+    if report.skipped_checks:
+        click.secho(
+            f"\nSkipped checks: {', '.join(report.skipped_checks)}", fg="yellow"
+        )
+
+    if len(report.vulnerabilities_results) > 0:
+        vulnerable_dependencies_count = len(
+            {item.dependency.name for item in report.vulnerabilities_results}
+        )
+        click.secho(
+            f"\n{vulnerable_dependencies_count} vulnerable dependencies found:",
+            fg="red",
         )
         vulnerabilities_table = tabulate(
             [
@@ -46,18 +71,19 @@ def print_results_stdout(
                     get_display_output_for_dependency(item.dependency),
                     item.advisory,
                     item.impacted_versions,
+                    item.safe_version or "-",
                 )
-                for item in vulnerabilities_results
+                for item in report.vulnerabilities_results
             ],
             vulnerabilities_headers,
             tablefmt="plain",
         )
         click.echo(vulnerabilities_table)
 
-    if len(versions_results) > 0:
-        outdated_major = get_dependencies_with_outdated_major(versions_results)
+    if len(report.versions_results) > 0:
+        outdated_major = classified_versions_results.major
         click.secho(
-            f"\n{len(versions_results)} outdated dependencies found (including {len(outdated_major)} outdated major versions):",
+            f"\n{len(report.versions_results)} outdated dependencies found (including {len(outdated_major)} outdated major versions):",
             fg="red",
         )
         versions_table = tabulate(
@@ -67,23 +93,80 @@ def print_results_stdout(
                     item.installed_version,
                     item.latest_version,
                 )
-                for item in versions_results
+                for item in report.versions_results
             ],
             versions_headers,
             tablefmt="plain",
         )
         click.echo(versions_table)
-    else:
+    elif "outdated" not in report.skipped_checks and not report.unfinished_dependencies:
         click.secho("\nNo outdated dependencies found 🎉", fg="green")
 
-    if len(errors_results) > 0:
-        click.secho(f"\n{len(errors_results)} errors:", fg="red")
+    if len(report.errors_results) > 0:
+        click.secho(f"\n{len(report.errors_results)} errors:", fg="red")
         errors_table = tabulate(
             [
                 (get_display_output_for_dependency(item.dependency), item.error)
-                for item in errors_results
+                for item in report.errors_results
             ],
             errors_headers,
             tablefmt="plain",
         )
         click.echo(errors_table)
+
+    if len(report.unfinished_dependencies) > 0:
+        reason = (
+            "after the policy failed"
+            if report.policy_failures
+            else "before the deadline"
+        )
+        click.secho(
+            f"\n{len(report.unfinished_dependencies)} dependencies could not be checked {reason}:",
+            fg="red",
+        )
+        click.echo(
+            "\n".join(
+                get_display_output_for_dependency(item)
+                for item in report.unfinished_dependencies
+            )
+        )
+
+    for failure in report.policy_failures:
+        click.secho(f"\nPolicy failed: {failure}", fg="red")
+
+
+def print_concurrency_stats_stdout(concurrency_stats: list[ConcurrencyStats]) -> None:
+    """Print the requests sent to each repository host as a table on stdout."""
+    if not concurrency_stats:
+        return
+
+    click.secho("\nRequests per repository host:", fg="yellow")
+    click.echo(
+        tabulate(
+            [
+                (
+                    item.host,
+                    item.requests,
+                    item.overloads,
+                    item.max_in_flight,
+                    item.limit,
+                    f"{item.throughput:.1f}",
+                    f"{item.latency_p50 * 1000:.0f} / {item.latency_p90 * 1000:.0f}"
+                    if item.latency_p50 is not None and item.latency_p90 is not None
+                    else "-",
+                )
+                for item in concurrency_stats
+            ],
+            [
+                "Host",
+                "Requests",
+                "Throttled/failed",
+                "Max concurrency",
+                "Concurrency limit",
+                "Requests/s",
+                "Latency p50 / p90 (ms)",
+            ],
+            tablefmt="plain",
+            disable_numparse=True,
+        )
+    )
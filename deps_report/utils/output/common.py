@@ -1,3 +1,5 @@
+from dataclasses import dataclass, field
+
 from packaging import version as version_parser
 
 from deps_report.models import Dependency
@@ -18,22 +20,58 @@ def get_display_output_for_dependency(dependency: Dependency) -> str:
     return f"{dependency.name} ({','.join(properties)})"
 
 
-def get_dependencies_with_outdated_major(
+@dataclass(frozen=True, slots=True)
+class ClassifiedVersionsResults:
+    """Versions results grouped by the most significant part of the version to update.
+
+    The `other` group contains the updates of pre/post/dev releases and the
+    versions which are not PEP 440 compliant.
+    """
+
+    major: list[VersionResult] = field(default_factory=list)
+    minor: list[VersionResult] = field(default_factory=list)
+    patch: list[VersionResult] = field(default_factory=list)
+    other: list[VersionResult] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        """Get the number of versions results."""
+        return len(self.major) + len(self.minor) + len(self.patch) + len(self.other)
+
+    @property
+    def not_major(self) -> list[VersionResult]:
+        """Get the versions results which are not major updates."""
+        return [*self.minor, *self.patch, *self.other]
+
+
+def classify_versions_results(
     results: list[VersionResult],
-) -> list[VersionResult]:
-    """Get the dependencies with outdated major versions."""
-    deps = []
+) -> ClassifiedVersionsResults:
+    """Group the versions results according to the part of the version to update."""
+    classified = ClassifiedVersionsResults()
 
     for result in results:
-        latest_version = version_parser.parse(result.latest_version)
-        installed_version = version_parser.parse(result.installed_version)
+        latest_version = result.latest_parsed_version
+        installed_version = result.installed_parsed_version
 
         if isinstance(latest_version, version_parser.LegacyVersion) or isinstance(
             installed_version, version_parser.LegacyVersion
         ):
-            continue
-
-        if latest_version.major > installed_version.major:
-            deps.append(result)
+            classified.other.append(result)
+        elif latest_version.major > installed_version.major:
+            classified.major.append(result)
+        elif (latest_version.major, latest_version.minor) > (
+            installed_version.major,
+            installed_version.minor,
+        ):
+            classified.minor.append(result)
+        elif (
+            latest_version.major,
+            latest_version.minor,
+            latest_version.micro,
+        ) > (installed_version.major, installed_version.minor, installed_version.micro):
+            classified.patch.append(result)
+        else:
+            classified.other.append(result)
 
-    return deps
+    return classified
@@ -3,17 +3,19 @@ import logging
 import os
 
 from github import Github, GithubException
-from tabulate import tabulate
 
-from deps_report.models import RuntimeInformations
-from deps_report.models.results import ErrorResult, VersionResult, VulnerabilityResult
+from deps_report.models.results import ProjectReport
 from deps_report.utils.output.common import (
-    get_dependencies_with_outdated_major,
+    ClassifiedVersionsResults,
     get_display_output_for_dependency,
 )
 
 logger = logging.getLogger(__name__)
 
+GITHUB_COMMENT_MAX_LENGTH = 65536
+# Length kept available for the sections following a truncated table or list
+SECTIONS_RESERVED_LENGTH = 2000
+
 
 def _get_workflow_run_url() -> str:
     return f"{os.environ['GITHUB_SERVER_URL']}/{os.environ['GITHUB_REPOSITORY']}/actions/runs/{os.environ['GITHUB_RUN_ID']}"
@@ -69,83 +71,178 @@ def _post_github_pr_comment(msg: str) -> None:
         logger.error("Unable to post/edit comment on PR")
 
 
+class _CommentBody:
+    """Comment body built incrementally without exceeding a maximum length."""
+
+    def __init__(self, max_length: int) -> None:
+        self.max_length = max_length
+        self.parts: list[str] = []
+        self.length = 0
+
+    @property
+    def remaining_length(self) -> int:
+        return self.max_length - self.length
+
+    def add(self, text: str) -> None:
+        self.parts.append(text)
+        self.length += len(text)
+
+    def add_lines(self, lines: list[str], truncation_notice: str) -> None:
+        """Add as many lines as possible, followed by a notice if some are missing.
+
+        `truncation_notice` is formatted with the number of lines not added, and
+        enough space is kept for the following sections of the comment.
+        """
+        for index, line in enumerate(lines):
+            if (
+                len(line) + len(truncation_notice) + SECTIONS_RESERVED_LENGTH
+                > self.remaining_length
+            ):
+                self.add(truncation_notice.format(count=len(lines) - index))
+                return
+            self.add(line)
+
+    def __str__(self) -> str:
+        return "".join(self.parts)
+
+
+def _escape_table_cell(text: str) -> str:
+    return text.replace("|", "\\|")
+
+
+def _add_table(body: _CommentBody, headers: list[str], rows: list[list[str]]) -> None:
+    body.add(f"| {' | '.join(headers)} |\n|{'---|' * len(headers)}\n")
+    body.add_lines(
+        [
+            f"| {' | '.join(_escape_table_cell(cell) for cell in row)} |\n"
+            for row in rows
+        ],
+        f"\n⚠️ {{count}} more rows not displayed, see the [logs]({_get_workflow_run_url()}).\n",
+    )
+
+
 def send_github_pr_comment_with_results(
-    versions_results: list[VersionResult],
-    vulnerabilities_results: list[VulnerabilityResult],
-    errors_results: list[ErrorResult],
-    runtime_informations: RuntimeInformations | None,
+    report: ProjectReport,
+    classified_versions_results: ClassifiedVersionsResults,
 ) -> None:
-    """Print results as a comment on the current Github PR."""
+    """Print results as a comment on the current Github PR.
+
+    The tables are truncated if needed to respect the maximum size of a comment.
+    """
     if not _is_running_as_github_action():
         return
 
-    msg = ""
+    header = (
+        f"# **deps-report 🔍**\nCommit scanned: {_get_latest_commit_hash_of_pr()[:7]}\n"
+    )
+    footer = f"\n\n<sub>[*Logs*]({_get_workflow_run_url()})</sub>"
+    body = _CommentBody(GITHUB_COMMENT_MAX_LENGTH - len(header) - len(footer))
+    runtime_informations = report.runtime_informations
 
     # Runtime informations
     if runtime_informations and runtime_informations.current_version_is_outdated:
-        msg += f"ℹ️ {runtime_informations.name} version {runtime_informations.current_version} is used by your project but the latest version is {runtime_informations.latest_version}.\n\n"
+        body.add(
+            f"ℹ️ {runtime_informations.name} version {runtime_informations.current_version} is used by your project but the latest version is {runtime_informations.latest_version}.\n\n"
+        )
         if runtime_informations.current_version_is_eol_soon:
-            msg += f"🚨<b>Your {runtime_informations.name} version reaches EOL date on {runtime_informations.current_version_eol_date}, you should upgrade !</b>\n\n"
+            body.add(
+                f"🚨<b>Your {runtime_informations.name} version reaches EOL date on {runtime_informations.current_version_eol_date}, you should upgrade !</b>\n\n"
+            )
         elif runtime_informations.current_version_is_eol:
-            msg += f"🚨<b>Your {runtime_informations.name} version **reached** EOL date on {runtime_informations.current_version_eol_date}, you should upgrade !</b>\n\n"
+            body.add(
+                f"🚨<b>Your {runtime_informations.name} version **reached** EOL date on {runtime_informations.current_version_eol_date}, you should upgrade !</b>\n\n"
+            )
+
+    for repository in report.bypassed_repositories:
+        body.add(
+            f"⚠️ Repository {repository} was unhealthy and has been bypassed, some latest versions may come from other repositories or be missing.\n\n"
+        )
+
+    for shard in report.missing_shards:
+        body.add(
+            f"⚠️ Shard {shard} is missing from the report, its dependencies have not been checked.\n\n"
+        )
+
+    for failure in report.policy_failures:
+        body.add(f"❌ <b>Policy failed:</b> {failure}\n\n")
+
+    if report.skipped_checks:
+        body.add(f"ℹ️ Skipped checks: {', '.join(report.skipped_checks)}\n\n")
 
     # Vulnerable dependencies
-    if len(vulnerabilities_results) > 0:
-        msg += "## Vulnerable dependencies\n"
-        msg += f"<details><summary> <b>{len(vulnerabilities_results)}</b> dependencies have vulnerabilities 😱</summary>\n\n"
-        vulnerabilities_table = tabulate(
+    if len(report.vulnerabilities_results) > 0:
+        vulnerable_dependencies_count = len(
+            {item.dependency.name for item in report.vulnerabilities_results}
+        )
+        body.add("## Vulnerable dependencies\n")
+        body.add(
+            f"<details><summary> <b>{vulnerable_dependencies_count}</b> dependencies have vulnerabilities 😱</summary>\n\n"
+        )
+        _add_table(
+            body,
+            ["Dependency", "Advisory", "Versions impacted", "Safe version"],
             [
-                (
+                [
                     get_display_output_for_dependency(item.dependency),
                     item.advisory,
                     item.impacted_versions,
-                )
-                for item in vulnerabilities_results
+                    item.safe_version or "-",
+                ]
+                for item in report.vulnerabilities_results
             ],
-            ["Dependency", "Advisory", "Versions impacted"],
-            tablefmt="github",
         )
-        msg += f"{vulnerabilities_table}\n</details>\n\n"
+        body.add("\n</details>\n\n")
 
     # Outdated dependencies
-    msg += "## Outdated dependencies\n"
-    if len(versions_results) > 0:
-        outdated_major = get_dependencies_with_outdated_major(versions_results)
-        msg += f"<details><summary> <b>{len(versions_results)}</b> outdated dependencies found (including {len(outdated_major)} outdated major versions)😢</summary>\n\n"
-
-        if len(outdated_major) > 0:
-            major_versions_table = tabulate(
-                [
-                    (
-                        get_display_output_for_dependency(item.dependency),
-                        item.installed_version,
-                        item.latest_version,
-                    )
-                    for item in outdated_major
-                ],
-                ["Dependency", "Installed version", "Latest version"],
-                tablefmt="github",
+    if "outdated" not in report.skipped_checks:
+        body.add("## Outdated dependencies\n")
+        if classified_versions_results.count > 0:
+            outdated_major = classified_versions_results.major
+            body.add(
+                f"<details><summary> <b>{classified_versions_results.count}</b> outdated dependencies found (including {len(outdated_major)} outdated major versions)😢</summary>\n\n"
             )
-            msg += f"{major_versions_table}\n\n"
 
-        versions_table = tabulate(
-            [
-                (
-                    get_display_output_for_dependency(item.dependency),
-                    item.installed_version,
-                    item.latest_version,
+            for versions_results in (
+                outdated_major,
+                classified_versions_results.not_major,
+            ):
+                if len(versions_results) == 0:
+                    continue
+                _add_table(
+                    body,
+                    ["Dependency", "Installed version", "Latest version"],
+                    [
+                        [
+                            get_display_output_for_dependency(item.dependency),
+                            item.installed_version,
+                            item.latest_version,
+                        ]
+                        for item in versions_results
+                    ],
                 )
-                for item in versions_results
-                if item not in outdated_major
+                body.add("\n")
+            body.add("</details>\n\n")
+        elif not report.unfinished_dependencies:
+            body.add("No outdated dependencies found 🎉\n\n")
+
+    # Dependencies not checked before the deadline or the policy failure
+    if len(report.unfinished_dependencies) > 0:
+        reason = (
+            "after the policy failed"
+            if report.policy_failures
+            else "before the deadline"
+        )
+        body.add("## Unfinished checks\n")
+        body.add(
+            f"<details><summary> <b>{len(report.unfinished_dependencies)}</b> dependencies could not be checked {reason} ⏱️</summary>\n\n"
+        )
+        body.add_lines(
+            [
+                f"- {get_display_output_for_dependency(item)}\n"
+                for item in report.unfinished_dependencies
             ],
-            ["Dependency", "Installed version", "Latest version"],
-            tablefmt="github",
+            "- and {count} more\n",
         )
-        msg += f"{versions_table}\n</details>\n\n"
-    else:
-        msg += "No outdated dependencies found 🎉\n\n"
-
-    footer = f"<sub>[*Logs*]({_get_workflow_run_url()})</sub>"
-    if msg:
-        msg = f"# **deps-report 🔍**\nCommit scanned: {_get_latest_commit_hash_of_pr()[:7]}\n{msg}\n\n{footer}"
-        _post_github_pr_comment(msg)
+        body.add("</details>\n\n")
+
+    _post_github_pr_comment(f"{header}{body}{footer}")
@@ -0,0 +1,180 @@
+from datetime import date
+from typing import Any, Iterable
+
+from deps_report.models import Dependency, DependencyRepository, RuntimeInformations
+from deps_report.models.dependency_repository import (
+    get_url_without_credentials,
+    intern_repositories,
+    intern_repository,
+)
+from deps_report.models.results import (
+    ErrorResult,
+    ProjectReport,
+    VersionResult,
+    VulnerabilityResult,
+)
+
+# Repositories by name and URL without credentials
+_RepositoriesByKey = dict[tuple[str, str], DependencyRepository]
+
+
+def _dependency_to_dict(dependency: Dependency) -> dict[str, Any]:
+    # The reports are shared (e.g. as CI artifacts) and cached, so the credentials
+    # of the repositories URLs are not written
+    return {
+        "name": dependency.name,
+        "version": dependency.version,
+        "repositories": [
+            {
+                "name": repository.name,
+                "url": get_url_without_credentials(repository.url),
+            }
+            for repository in dependency.repositories
+        ],
+        "transitive": dependency.transitive,
+        "for_dev": dependency.for_dev,
+    }
+
+
+def _dependency_from_dict(
+    data: dict[str, Any], repositories: _RepositoriesByKey
+) -> Dependency:
+    return Dependency(
+        name=data["name"],
+        version=data["version"],
+        repositories=intern_repositories(
+            repositories.get((repository["name"], repository["url"]))
+            or intern_repository(name=repository["name"], url=repository["url"])
+            for repository in data["repositories"]
+        ),
+        transitive=data["transitive"],
+        for_dev=data["for_dev"],
+    )
+
+
+def _runtime_informations_to_dict(
+    runtime_informations: RuntimeInformations,
+) -> dict[str, Any]:
+    return {
+        "name": runtime_informations.name,
+        "current_version": runtime_informations.current_version,
+        "latest_version": runtime_informations.latest_version,
+        "current_version_is_outdated": runtime_informations.current_version_is_outdated,
+        "current_version_eol_date": runtime_informations.current_version_eol_date.isoformat(),
+        "current_version_is_eol_soon": runtime_informations.current_version_is_eol_soon,
+        "current_version_is_eol": runtime_informations.current_version_is_eol,
+    }
+
+
+def _runtime_informations_from_dict(data: dict[str, Any]) -> RuntimeInformations:
+    return RuntimeInformations(
+        name=data["name"],
+        current_version=data["current_version"],
+        latest_version=data["latest_version"],
+        current_version_is_outdated=data["current_version_is_outdated"],
+        current_version_eol_date=date.fromisoformat(data["current_version_eol_date"]),
+        current_version_is_eol_soon=data["current_version_is_eol_soon"],
+        current_version_is_eol=data["current_version_is_eol"],
+    )
+
+
+def report_to_dict(report: ProjectReport) -> dict[str, Any]:
+    """Convert a project report to a JSON serializable dict."""
+    return {
+        "versions_results": [
+            {
+                "dependency": _dependency_to_dict(item.dependency),
+                "installed_version": item.installed_version,
+                "latest_version": item.latest_version,
+            }
+            for item in report.versions_results
+        ],
+        "vulnerabilities_results": [
+            {
+                "dependency": _dependency_to_dict(item.dependency),
+                "advisory": item.advisory,
+                "impacted_versions": item.impacted_versions,
+                "safe_version": item.safe_version,
+            }
+            for item in report.vulnerabilities_results
+        ],
+        "errors_results": [
+            {
+                "dependency": _dependency_to_dict(item.dependency),
+                "error": item.error,
+            }
+            for item in report.errors_results
+        ],
+        "runtime_informations": _runtime_informations_to_dict(
+            report.runtime_informations
+        )
+        if report.runtime_informations
+        else None,
+        "unfinished_dependencies": [
+            _dependency_to_dict(item) for item in report.unfinished_dependencies
+        ],
+        "bypassed_repositories": report.bypassed_repositories,
+        "missing_shards": report.missing_shards,
+        "policy_failures": report.policy_failures,
+        "skipped_checks": report.skipped_checks,
+    }
+
+
+def report_from_dict(
+    data: dict[str, Any], repositories: Iterable[DependencyRepository] = ()
+) -> ProjectReport:
+    """Build a project report from a dict created with `report_to_dict`.
+
+    The repositories URLs are stored without their credentials: the given
+    repositories (e.g. of the parsed dependencies files) are used instead of the
+    stored ones with the same name and URL once redacted.
+    """
+    repositories_by_key = {
+        (repository.name, get_url_without_credentials(repository.url)): repository
+        for repository in repositories
+    }
+    return ProjectReport(
+        versions_results=[
+            VersionResult(
+                dependency=_dependency_from_dict(
+                    item["dependency"], repositories_by_key
+                ),
+                installed_version=item["installed_version"],
+                latest_version=item["latest_version"],
+            )
+            for item in data["versions_results"]
+        ],
+        vulnerabilities_results=[
+            VulnerabilityResult(
+                dependency=_dependency_from_dict(
+                    item["dependency"], repositories_by_key
+                ),
+                advisory=item["advisory"],
+                impacted_versions=item["impacted_versions"],
+                safe_version=item.get("safe_version"),
+            )
+            for item in data["vulnerabilities_results"]
+        ],
+        errors_results=[
+            ErrorResult(
+                dependency=_dependency_from_dict(
+                    item["dependency"], repositories_by_key
+                ),
+                error=item["error"],
+            )
+            for item in data["errors_results"]
+        ],
+        runtime_informations=_runtime_informations_from_dict(
+            data["runtime_informations"]
+        )
+        if data["runtime_informations"]
+        else None,
+        unfinished_dependencies=[
+            _dependency_from_dict(item, repositories_by_key)
+            for item in data.get("unfinished_dependencies", [])
+        ],
+        bypassed_repositories=data.get("bypassed_repositories", []),
+        missing_shards=data.get("missing_shards", []),
+        policy_failures=data.get("policy_failures", []),
+        skipped_checks=data.get("skipped_checks", []),
+    )
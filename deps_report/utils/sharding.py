@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from packaging.utils import canonicalize_name
+
+from deps_report.models import Dependency
+from deps_report.models.results import ProjectReport
+from deps_report.utils.serialization import report_from_dict, report_to_dict
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_REPORT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class Shard:
+    """Shard `index` (starting at 1) of a dependencies set split in `count` shards."""
+
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        """Display the shard as `index/count`."""
+        return f"{self.index}/{self.count}"
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a shard given as `index/count`, raise ValueError if it's not valid."""
+    index, separator, count = value.partition("/")
+    if not separator or not index.isdigit() or not count.isdigit():
+        raise ValueError(f"Invalid shard {value}, expected index/count (e.g. 1/4)")
+
+    shard = Shard(int(index), int(count))
+    if not 1 <= shard.index <= shard.count:
+        raise ValueError(f"Invalid shard {value}, index must be between 1 and count")
+    return shard
+
+
+def get_dependency_shard_index(dependency: Dependency, shards_count: int) -> int:
+    """Get the shard of a dependency from the hash of its name.
+
+    The hash is stable between runs (unlike `hash()`), so a package is always checked
+    by the same shard.
+    """
+    name_hash = hashlib.sha256(canonicalize_name(dependency.name).encode()).digest()
+    return int.from_bytes(name_hash[:8], "big") % shards_count + 1
+
+
+def filter_shard_dependencies(
+    dependencies: list[Dependency], shard: Shard
+) -> list[Dependency]:
+    """Keep only the dependencies of the given shard."""
+    return [
+        dependency
+        for dependency in dependencies
+        if get_dependency_shard_index(dependency, shard.count) == shard.index
+    ]
+
+
+def write_partial_report(path: str, report: ProjectReport, shard: Shard) -> None:
+    """Write the report of a shard, to be merged with the other shards."""
+    data = {
+        "format_version": PARTIAL_REPORT_FORMAT_VERSION,
+        "shard": {"index": shard.index, "count": shard.count},
+        "report": report_to_dict(report),
+    }
+    with open(path, "w") as partial_file:
+        json.dump(data, partial_file)
+
+
+def _read_partial_report(path: str) -> tuple[Shard, ProjectReport] | None:
+    try:
+        with open(path, "r") as partial_file:
+            data: dict[str, Any] = json.load(partial_file)
+        if data.get("format_version") != PARTIAL_REPORT_FORMAT_VERSION:
+            raise ValueError(f"unknown format version {data.get('format_version')}")
+        shard = Shard(data["shard"]["index"], data["shard"]["count"])
+        return shard, report_from_dict(data["report"])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.error(f"Ignoring the partial report {path} which cannot be read: {e}")
+        return None
+
+
+def merge_partial_reports(paths: list[str]) -> ProjectReport | None:
+    """Merge the reports of the shards, listing the missing shards in the result.
+
+    The partial reports which cannot be read, or ran other checks than the first
+    one read, are ignored (their shard is then missing), None is returned if none of
+    them can be read.
+    """
+    partial_reports: dict[int, ProjectReport] = {}
+    shards_count = None
+    skipped_checks: list[str] = []
+    for path in paths:
+        partial_report = _read_partial_report(path)
+        if partial_report is None:
+            continue
+
+        shard, report = partial_report
+        if shards_count is None:
+            shards_count = shard.count
+            skipped_checks = report.skipped_checks
+        if shard.count != shards_count:
+            logger.error(
+                f"Ignoring the partial report {path} of shard {shard}, "
+                f"other shards are out of {shards_count}"
+            )
+            continue
+        if shard.index in partial_reports:
+            logger.error(
+                f"Ignoring the partial report {path}, shard {shard} is duplicated"
+            )
+            continue
+        if set(report.skipped_checks) != set(skipped_checks):
+            logger.error(
+                f"Ignoring the partial report {path} of shard {shard}, its skipped "
+                f"checks ({', '.join(report.skipped_checks) or 'none'}) differ from "
+                f"the other shards ({', '.join(skipped_checks) or 'none'})"
+            )
+            continue
+        partial_reports[shard.index] = report
+
+    if shards_count is None:
+        return None
+
+    merged_report = ProjectReport(skipped_checks=skipped_checks)
+    bypassed_repositories = set()
+    for index in range(1, shards_count + 1):
+        if index not in partial_reports:
+            merged_report.missing_shards.append(str(Shard(index, shards_count)))
+            continue
+
+        report = partial_reports[index]
+        merged_report.versions_results.extend(report.versions_results)
+        merged_report.vulnerabilities_results.extend(report.vulnerabilities_results)
+        merged_report.errors_results.extend(report.errors_results)
+        merged_report.unfinished_dependencies.extend(report.unfinished_dependencies)
+        merged_report.missing_shards.extend(report.missing_shards)
+        merged_report.policy_failures.extend(
+            item
+            for item in report.policy_failures
+            if item not in merged_report.policy_failures
+        )
+        bypassed_repositories.update(report.bypassed_repositories)
+        if merged_report.runtime_informations is None:
+            merged_report.runtime_informations = report.runtime_informations
+
+    merged_report.bypassed_repositories = sorted(bypassed_repositories)
+    return merged_report
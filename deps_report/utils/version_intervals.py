@@ -0,0 +1,218 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+T = TypeVar("T")
+
+
+def parse_version(version: str) -> Version | None:
+    """Parse a PEP 440 version, return None if the version is not valid."""
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+@dataclass(frozen=True)
+class VersionInterval:
+    """Interval of versions, a None bound means the interval is unbounded on this side."""
+
+    lower: Version | None
+    upper: Version | None
+    lower_inclusive: bool = True
+    upper_inclusive: bool = False
+
+    def __str__(self) -> str:
+        """Display the interval as a version specifier."""
+        if self.lower is not None and self.lower == self.upper:
+            return f"=={self.lower}"
+
+        constraints = []
+        if self.lower is not None:
+            constraints.append(
+                f">={self.lower}" if self.lower_inclusive else f">{self.lower}"
+            )
+        if self.upper is not None:
+            constraints.append(
+                f"<={self.upper}" if self.upper_inclusive else f"<{self.upper}"
+            )
+
+        return ",".join(constraints) or "*"
+
+
+def get_interval_from_specifiers(specifiers: str) -> VersionInterval | None:
+    """Convert a version specifier set (e.g. `>=1.0,<1.2`) to the interval it allows.
+
+    The specifiers which cannot be represented by bounds (`!=`, `~=`, wildcards...)
+    are ignored, so the interval can contain more versions than the specifier set.
+    None is returned if no version is allowed or the specifiers are not valid.
+    """
+    try:
+        specifier_set = SpecifierSet(specifiers)
+    except InvalidSpecifier:
+        return None
+
+    lower: Version | None = None
+    upper: Version | None = None
+    lower_inclusive = upper_inclusive = True
+    for specifier in specifier_set:
+        version = parse_version(specifier.version)
+        if version is None:
+            continue
+        if specifier.operator in (">", ">=", "==") and (
+            lower is None
+            or version > lower
+            or (version == lower and specifier.operator == ">")
+        ):
+            lower, lower_inclusive = version, specifier.operator != ">"
+        if specifier.operator in ("<", "<=", "==") and (
+            upper is None
+            or version < upper
+            or (version == upper and specifier.operator == "<")
+        ):
+            upper, upper_inclusive = version, specifier.operator != "<"
+
+    if (
+        lower is not None
+        and upper is not None
+        and (
+            lower > upper
+            or (lower == upper and not (lower_inclusive and upper_inclusive))
+        )
+    ):
+        return None
+    return VersionInterval(
+        lower=lower,
+        upper=upper,
+        lower_inclusive=lower_inclusive,
+        upper_inclusive=upper_inclusive,
+    )
+
+
+class VersionIntervalIndex(Generic[T]):
+    """Index of values associated to version intervals.
+
+    All the bounds of the intervals are sorted to split the versions in elementary
+    regions (each bound and each gap between two bounds), every region knowing the
+    values whose interval covers it. Finding the values for a version is then a
+    bisection on the bounds.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._entries: list[tuple[VersionInterval, T]] = []
+        self._bounds: list[Version] = []
+        self._regions: list[tuple[int, ...]] = []
+        self._uncovered_regions: list[int] = []
+        self._is_built = True
+
+    def __len__(self) -> int:
+        """Return the number of intervals in the index."""
+        return len(self._entries)
+
+    def add(self, interval: VersionInterval, value: T) -> None:
+        """Associate a value to an interval of versions."""
+        self._entries.append((interval, value))
+        self._is_built = False
+
+    def _get_region_index(self, version: Version, inclusive: bool, lower: bool) -> int:
+        bound_index = bisect_left(self._bounds, version)
+        if inclusive:
+            return 2 * bound_index + 1
+        return 2 * bound_index + 2 if lower else 2 * bound_index
+
+    def _build(self) -> None:
+        bounds = set()
+        for interval, _ in self._entries:
+            if interval.lower is not None:
+                bounds.add(interval.lower)
+            if interval.upper is not None:
+                bounds.add(interval.upper)
+        self._bounds = sorted(bounds)
+
+        regions: list[dict[int, None]] = [{} for _ in range(2 * len(self._bounds) + 1)]
+        for entry_index, (interval, _) in enumerate(self._entries):
+            start = (
+                0
+                if interval.lower is None
+                else self._get_region_index(
+                    interval.lower, interval.lower_inclusive, lower=True
+                )
+            )
+            end = (
+                len(regions) - 1
+                if interval.upper is None
+                else self._get_region_index(
+                    interval.upper, interval.upper_inclusive, lower=False
+                )
+            )
+            for region_index in range(start, end + 1):
+                regions[region_index][entry_index] = None
+
+        self._regions = [tuple(region) for region in regions]
+        self._uncovered_regions = [
+            region_index
+            for region_index, region in enumerate(self._regions)
+            if not region
+        ]
+        self._is_built = True
+
+    def _get_version_region_index(self, version: Version) -> int:
+        bound_index = bisect_left(self._bounds, version)
+        if bound_index < len(self._bounds) and self._bounds[bound_index] == version:
+            return 2 * bound_index + 1
+        return 2 * bound_index
+
+    def find(self, version: Version) -> list[T]:
+        """Get the values of all the intervals containing the version."""
+        if not self._is_built:
+            self._build()
+        if not self._entries:
+            return []
+
+        region = self._regions[self._get_version_region_index(version)]
+
+        values: dict[int, T] = {}
+        for entry_index in region:
+            value = self._entries[entry_index][1]
+            values.setdefault(id(value), value)
+        return list(values.values())
+
+    def find_first_uncovered(
+        self, versions: list[Version], after: Version
+    ) -> Version | None:
+        """Get the first of the sorted versions greater than `after` in no interval.
+
+        Instead of looking up each version, the versions inside a covered region are
+        skipped by bisecting them from the start of the next uncovered region.
+        """
+        if not self._is_built:
+            self._build()
+
+        version_index = bisect_right(versions, after)
+        while version_index < len(versions):
+            version = versions[version_index]
+            if not self._entries:
+                return version
+            region_index = self._get_version_region_index(version)
+            if not self._regions[region_index]:
+                return version
+
+            uncovered_index = bisect_right(self._uncovered_regions, region_index)
+            if uncovered_index == len(self._uncovered_regions):
+                return None
+            # Odd regions are a bound, even ones the gap after the previous bound
+            next_region_index = self._uncovered_regions[uncovered_index]
+            if next_region_index % 2:
+                version_index = bisect_left(
+                    versions, self._bounds[next_region_index // 2]
+                )
+            else:
+                version_index = bisect_right(
+                    versions, self._bounds[next_region_index // 2 - 1]
+                )
+
+        return None
@@ -2,24 +2,56 @@ from typing import Type
 
 from deps_report.parsers import PythonPipenvParser
 from deps_report.parsers.python.poetry import PythonPoetryParser
+from deps_report.parsers.python.sbom import PythonSbomParser
+from deps_report.transports import TransportBase
 from deps_report.vulnerabilities_checkers.base import VulnerabilityCheckerBase
 from deps_report.vulnerabilities_checkers.python import PythonVulnerabilityChecker
+from deps_report.vulnerabilities_checkers.python_osv import (
+    PythonOsvVulnerabilityChecker,
+)
 
-VULNERABILITY_CHECKER_RULES = {
-    PythonPipenvParser: PythonVulnerabilityChecker,
-    PythonPoetryParser: PythonVulnerabilityChecker,
+DEFAULT_VULNERABILITY_DATABASE = "safety-db"
+
+VULNERABILITY_CHECKER_RULES: dict[Type, dict[str, Type[VulnerabilityCheckerBase]]] = {
+    PythonPipenvParser: {
+        "safety-db": PythonVulnerabilityChecker,
+        "osv": PythonOsvVulnerabilityChecker,
+    },
+    PythonPoetryParser: {
+        "safety-db": PythonVulnerabilityChecker,
+        "osv": PythonOsvVulnerabilityChecker,
+    },
+    PythonSbomParser: {
+        "safety-db": PythonVulnerabilityChecker,
+        "osv": PythonOsvVulnerabilityChecker,
+    },
 }
 
+VULNERABILITY_DATABASES = ["safety-db", "osv"]
 
-async def get_vulnerability_checker_for_parser(
+
+def get_vulnerability_checker_class_for_parser(
     parser: Type,
-) -> VulnerabilityCheckerBase:
-    """Get the correct vulnerability checker according to dependency parser used."""
-    for parser_class, vuln_checker_class in VULNERABILITY_CHECKER_RULES.items():
-        if parser == parser_class:
-            ret = await vuln_checker_class.create()
-            return ret
+    database: str = DEFAULT_VULNERABILITY_DATABASE,
+) -> Type[VulnerabilityCheckerBase]:
+    """Get the correct vulnerability checker class according to dependency parser used."""
+    for parser_class, vuln_checker_classes in VULNERABILITY_CHECKER_RULES.items():
+        if parser == parser_class and database in vuln_checker_classes:
+            return vuln_checker_classes[database]
 
     raise NotImplementedError(
-        f"Checking vulnerabilities for {parser} is not implemented yet"
+        f"Checking vulnerabilities for {parser} with {database} is not implemented yet"
     )
+
+
+async def get_vulnerability_checker_for_parser(
+    parser: Type,
+    database: str = DEFAULT_VULNERABILITY_DATABASE,
+    source: str | None = None,
+    packages: set[str] | None = None,
+    transport: TransportBase | None = None,
+) -> VulnerabilityCheckerBase:
+    """Get the correct vulnerability checker according to dependency parser used."""
+    vuln_checker_class = get_vulnerability_checker_class_for_parser(parser, database)
+    ret = await vuln_checker_class.create(source, packages, transport)
+    return ret
@@ -3,22 +3,73 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 
+from packaging.version import Version
+
 from deps_report.models import Dependency, Vulnerability
+from deps_report.transports import TransportBase, TransportError, use_transport
 
 logger = logging.getLogger(__name__)
 
 
+async def get_url_version(url: str, transport: TransportBase | None) -> str | None:
+    """Get the ETag (or modification date) of a URL with a HEAD request, if any."""
+    try:
+        async with use_transport(transport) as used_transport:
+            response = await used_transport.request("HEAD", url)
+    except TransportError:
+        return None
+    if response.status >= 400:
+        return None
+    return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
 class VulnerabilityCheckerBase(ABC):
     @classmethod
     @abstractmethod
-    async def create(cls) -> VulnerabilityCheckerBase:
-        """Create the checker instance by fetching the required data."""
+    async def create(
+        cls,
+        source: str | None = None,
+        packages: set[str] | None = None,
+        transport: TransportBase | None = None,
+    ) -> VulnerabilityCheckerBase:
+        """Create the checker instance by fetching the required data.
+
+        The source of the data (URL or path) can be given to replace the default one.
+        If packages names are given, only their vulnerabilities are kept. The data is
+        downloaded with the given transport, or with a temporary default one.
+        """
         pass
 
     @abstractmethod
     def check_if_package_is_vulnerable(
         self,
         dependency: Dependency,
-    ) -> Vulnerability | None:
-        """Check if the specified dependency has a vulnerability reported."""
+    ) -> list[Vulnerability]:
+        """Get all the vulnerabilities reported for the specified dependency."""
         pass
+
+    def has_data(self) -> bool:
+        """Return if the data of the checker could be loaded."""
+        return True
+
+    @classmethod
+    async def get_source_version(
+        cls,
+        source: str | None = None,
+        transport: TransportBase | None = None,
+    ) -> str | None:
+        """Get the version of the data at the source, without downloading the data.
+
+        None is returned if the version cannot be known, the data being then
+        considered as changed.
+        """
+        return None
+
+    def get_safe_version(
+        self, dependency: Dependency, versions: list[Version]
+    ) -> str | None:
+        """Get the first of the sorted versions, above the installed one, without any known vulnerability.
+
+        None is returned if there is no such version or if the checker cannot tell.
+        """
+        return None
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import json
 import logging
+from typing import Any
 
-import aiohttp
-from aiohttp.client_exceptions import ClientConnectionError, ClientError
 from packaging.specifiers import SpecifierSet
+from packaging.version import Version
 
 from deps_report.models import Dependency, VerificationError, Vulnerability
+from deps_report.transports import TransportBase, TransportError, use_transport
+from deps_report.utils.json_stream import iter_json_stream
+from deps_report.utils.version_intervals import (
+    VersionIntervalIndex,
+    get_interval_from_specifiers,
+    parse_version,
+)
 from deps_report.vulnerabilities_checkers import VulnerabilityCheckerBase
+from deps_report.vulnerabilities_checkers.base import get_url_version
 
 logger = logging.getLogger(__name__)
 
@@ -16,56 +23,121 @@ logger = logging.getLogger(__name__)
 DATABASE_URL = (
     "https://raw.githubusercontent.com/pyupio/safety-db/master/data/insecure_full.json"
 )
+DATABASE_FIELDS = ("v", "advisory", "cve")
 
 
 class PythonVulnerabilityChecker(VulnerabilityCheckerBase):
-    def __init__(self, vulnerabilities_data: dict | None) -> None:
+    def __init__(
+        self,
+        vulnerabilities_data: dict[str, list[dict[str, Any]]] | None,
+    ) -> None:
         """Initialize the Python vulnerability checker."""
         self.data = vulnerabilities_data
+        self._indexes: dict[str, VersionIntervalIndex[str]] = {}
 
     @classmethod
-    async def create(cls) -> PythonVulnerabilityChecker:
-        """Create the checker instance by fetching the required data."""
+    async def create(
+        cls,
+        source: str | None = None,
+        packages: set[str] | None = None,
+        transport: TransportBase | None = None,
+    ) -> PythonVulnerabilityChecker:
+        """Create the checker instance by fetching the required data.
+
+        The database is downloaded compressed and decoded while it's received, only
+        the needed fields of the entries of the wanted packages are kept.
+        """
+        data: dict[str, list[dict[str, Any]]] = {}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(DATABASE_URL) as response:
-                    response.raise_for_status()
-                    data = json.loads(await response.text())
-        except (ClientConnectionError, ClientError):
+            async with use_transport(transport) as used_transport:
+                async for package, entry in iter_json_stream(
+                    used_transport.stream(
+                        source or DATABASE_URL,
+                        headers={"Accept-Encoding": "gzip, deflate"},
+                    )
+                ):
+                    if not package or package.startswith("$"):
+                        continue
+                    if packages is not None and package not in packages:
+                        continue
+                    data.setdefault(package, []).append(
+                        {field: entry.get(field) for field in DATABASE_FIELDS}
+                    )
+        except (TransportError, ValueError):
             logger.error(
                 "Cannot download safety-db database, will skip vulnerabilities checking"
             )
-            data = None
+            return PythonVulnerabilityChecker(None)
 
         return PythonVulnerabilityChecker(data)
 
     def check_if_package_is_vulnerable(
         self,
         dependency: Dependency,
-    ) -> Vulnerability | None:
-        """Check if the specified dependency has a vulnerability reported."""
-        if not self.data:
+    ) -> list[Vulnerability]:
+        """Get all the vulnerabilities reported for the specified dependency."""
+        if self.data is None:
             raise VerificationError(
                 "Cannot check vulnerability status, error when downloading database"
             )
 
         database_entry = self.data.get(dependency.name)
         if database_entry is None:
-            return None
+            return []
 
+        vulnerabilities = []
         for vulnerability_entry in database_entry:
             constraint = vulnerability_entry["v"]
             specifier_set = SpecifierSet(constraint)
 
             if specifier_set.contains(dependency.version):
-                return Vulnerability(
-                    advisory=vulnerability_entry["advisory"]
-                    .replace("\r", "")
-                    .replace(
-                        "\n", " "
-                    ),  # remove line breaks to avoid breaking Github table formating
-                    cve=vulnerability_entry.get("cve"),
-                    versions_impacted=constraint,
+                vulnerabilities.append(
+                    Vulnerability(
+                        advisory=vulnerability_entry["advisory"]
+                        .replace("\r", "")
+                        .replace(
+                            "\n", " "
+                        ),  # remove line breaks to avoid breaking Github table formating
+                        cve=vulnerability_entry.get("cve"),
+                        versions_impacted=constraint,
+                    )
                 )
 
-        return None
+        return vulnerabilities
+
+    def _get_package_index(self, package: str) -> VersionIntervalIndex[str]:
+        """Get the index of the impacted versions of a package, built on first use."""
+        if package not in self._indexes:
+            package_index: VersionIntervalIndex[str] = VersionIntervalIndex()
+            for vulnerability_entry in (self.data or {}).get(package, []):
+                interval = get_interval_from_specifiers(vulnerability_entry["v"])
+                if interval is not None:
+                    package_index.add(interval, vulnerability_entry["v"])
+            self._indexes[package] = package_index
+        return self._indexes[package]
+
+    def get_safe_version(
+        self, dependency: Dependency, versions: list[Version]
+    ) -> str | None:
+        """Get the first of the sorted versions, above the installed one, without any known vulnerability."""
+        installed_version = parse_version(dependency.version)
+        if self.data is None or installed_version is None:
+            return None
+
+        safe_version = self._get_package_index(dependency.name).find_first_uncovered(
+            versions, installed_version
+        )
+        return str(safe_version) if safe_version else None
+
+    def has_data(self) -> bool:
+        """Return if the safety-db database could be downloaded."""
+        return self.data is not None
+
+    @classmethod
+    async def get_source_version(
+        cls,
+        source: str | None = None,
+        transport: TransportBase | None = None,
+    ) -> str | None:
+        """Get the ETag (or modification date) of the safety-db database."""
+        return await get_url_version(source or DATABASE_URL, transport)
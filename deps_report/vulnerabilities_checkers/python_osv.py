@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+import os
+import zipfile
+from typing import Any, Iterator
+
+from packaging.utils import canonicalize_name
+from packaging.version import Version
+
+from deps_report.models import Dependency, VerificationError, Vulnerability
+from deps_report.transports import TransportBase, TransportError, use_transport
+from deps_report.utils.version_intervals import (
+    VersionInterval,
+    VersionIntervalIndex,
+    parse_version,
+)
+from deps_report.vulnerabilities_checkers import VulnerabilityCheckerBase
+from deps_report.vulnerabilities_checkers.base import get_url_version
+
+logger = logging.getLogger(__name__)
+
+
+DATABASE_URL = "https://osv-vulnerabilities.storage.googleapis.com/PyPI/all.zip"
+OSV_ECOSYSTEM = "PyPI"
+OSV_RANGES_TYPES = ("ECOSYSTEM", "SEMVER")
+
+
+def _iter_records_from_json(content: bytes | str) -> Iterator[dict[str, Any]]:
+    data = json.loads(content)
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+def _iter_records_from_zip(zip_file: zipfile.ZipFile) -> Iterator[dict[str, Any]]:
+    for name in zip_file.namelist():
+        if name.endswith(".json"):
+            yield from _iter_records_from_json(zip_file.read(name))
+
+
+def _iter_records_from_path(path: str) -> Iterator[dict[str, Any]]:
+    """Read OSV records from a directory of JSON files, a JSON file or a zip dump."""
+    if os.path.isdir(path):
+        for directory, _, filenames in os.walk(path):
+            for filename in sorted(filenames):
+                if filename.endswith(".json"):
+                    yield from _iter_records_from_path(
+                        os.path.join(directory, filename)
+                    )
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zip_file:
+            yield from _iter_records_from_zip(zip_file)
+    else:
+        with open(path, "rb") as json_file:
+            yield from _iter_records_from_json(json_file.read())
+
+
+def _get_path_version(path: str) -> str:
+    """Get a version of a local OSV dump from the modification times of its files."""
+    if not os.path.isdir(path):
+        return str(os.stat(path).st_mtime_ns)
+
+    return str(
+        max(
+            (
+                os.stat(os.path.join(directory, filename)).st_mtime_ns
+                for directory, _, filenames in os.walk(path)
+                for filename in filenames
+            ),
+            default=0,
+        )
+    )
+
+
+def _get_intervals_from_range(osv_range: dict[str, Any]) -> list[VersionInterval]:
+    """Convert the introduced/fixed/last_affected events of an OSV range to intervals."""
+    events: list[tuple[Version | None, str]] = []
+    for event in osv_range.get("events", []):
+        for event_type in ("introduced", "fixed", "last_affected"):
+            if event_type not in event:
+                continue
+            if event_type == "introduced" and event[event_type] == "0":
+                events.append((None, event_type))
+                continue
+            event_version = parse_version(event[event_type])
+            if event_version is not None:
+                events.append((event_version, event_type))
+
+    # Events must be evaluated sorted by version, "0" being lower than any version
+    events.sort(key=lambda item: (item[0] is not None, item[0] or 0))
+
+    intervals = []
+    is_affected = False
+    introduced_version = None
+    for event_version, event_type in events:
+        if event_type == "introduced":
+            if not is_affected:
+                is_affected = True
+                introduced_version = event_version
+        elif is_affected:
+            intervals.append(
+                VersionInterval(
+                    lower=introduced_version,
+                    upper=event_version,
+                    upper_inclusive=event_type == "last_affected",
+                )
+            )
+            is_affected = False
+
+    if is_affected:
+        intervals.append(VersionInterval(lower=introduced_version, upper=None))
+
+    return intervals
+
+
+class PythonOsvVulnerabilityChecker(VulnerabilityCheckerBase):
+    def __init__(
+        self,
+        index: dict[str, VersionIntervalIndex[Vulnerability]] | None,
+    ):
+        """Initialize the checker with the per-package index of the vulnerabilities."""
+        self.index = index
+
+    @staticmethod
+    def _build_index(
+        records: Iterator[dict[str, Any]],
+        packages: set[str] | None = None,
+    ) -> dict[str, VersionIntervalIndex[Vulnerability]]:
+        index: dict[str, VersionIntervalIndex[Vulnerability]] = {}
+
+        for record in records:
+            if record.get("withdrawn"):
+                continue
+
+            cve = next(
+                (
+                    alias
+                    for alias in [record.get("id", ""), *record.get("aliases", [])]
+                    if alias.startswith("CVE-")
+                ),
+                None,
+            )
+            advisory = record.get("summary") or record.get("details") or record["id"]
+
+            for affected in record.get("affected", []):
+                package = affected.get("package", {})
+                if package.get("ecosystem") != OSV_ECOSYSTEM:
+                    continue
+                package_name = canonicalize_name(package["name"])
+                if packages is not None and package_name not in packages:
+                    continue
+
+                intervals = [
+                    interval
+                    for osv_range in affected.get("ranges", [])
+                    if osv_range.get("type") in OSV_RANGES_TYPES
+                    for interval in _get_intervals_from_range(osv_range)
+                ]
+                versions = [
+                    parsed_version
+                    for parsed_version in map(
+                        parse_version, affected.get("versions", [])
+                    )
+                    if parsed_version is not None
+                ]
+                if not intervals and not versions:
+                    continue
+
+                vulnerability = Vulnerability(
+                    # remove line breaks to avoid breaking Github table formating
+                    advisory=f"{record['id']}: {advisory}".replace("\r", "").replace(
+                        "\n", " "
+                    ),
+                    cve=cve,
+                    versions_impacted="; ".join(str(interval) for interval in intervals)
+                    or ", ".join(str(version) for version in versions),
+                )
+
+                package_index = index.setdefault(package_name, VersionIntervalIndex())
+                for interval in intervals:
+                    package_index.add(interval, vulnerability)
+                for version in versions:
+                    package_index.add(
+                        VersionInterval(
+                            lower=version, upper=version, upper_inclusive=True
+                        ),
+                        vulnerability,
+                    )
+
+        return index
+
+    @classmethod
+    async def create(
+        cls,
+        source: str | None = None,
+        packages: set[str] | None = None,
+        transport: TransportBase | None = None,
+    ) -> PythonOsvVulnerabilityChecker:
+        """Create the checker instance from an OSV dump.
+
+        The source can be a local directory of OSV JSON files, a JSON file, a zip
+        dump or the URL of a zip dump (the PyPI dump of osv.dev by default).
+        """
+        source = source or DATABASE_URL
+        if packages is not None:
+            packages = {canonicalize_name(package) for package in packages}
+        try:
+            if source.startswith(("http://", "https://")):
+                async with use_transport(transport) as used_transport:
+                    response = await used_transport.request("GET", source)
+                response.raise_for_status()
+                with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+                    index = await asyncio.to_thread(
+                        cls._build_index, _iter_records_from_zip(zip_file), packages
+                    )
+            else:
+                index = await asyncio.to_thread(
+                    cls._build_index, _iter_records_from_path(source), packages
+                )
+        except (TransportError, OSError, ValueError):
+            logger.error(
+                "Cannot load OSV vulnerabilities, will skip vulnerabilities checking"
+            )
+            return PythonOsvVulnerabilityChecker(None)
+
+        return PythonOsvVulnerabilityChecker(index)
+
+    def check_if_package_is_vulnerable(
+        self,
+        dependency: Dependency,
+    ) -> list[Vulnerability]:
+        """Get all the vulnerabilities reported for the specified dependency."""
+        if self.index is None:
+            raise VerificationError(
+                "Cannot check vulnerability status, error when loading OSV data"
+            )
+
+        package_index = self.index.get(canonicalize_name(dependency.name))
+        installed_version = parse_version(dependency.version)
+        if package_index is None or installed_version is None:
+            return []
+
+        return package_index.find(installed_version)
+
+    def get_safe_version(
+        self, dependency: Dependency, versions: list[Version]
+    ) -> str | None:
+        """Get the first of the sorted versions, above the installed one, without any known vulnerability."""
+        installed_version = parse_version(dependency.version)
+        if self.index is None or installed_version is None:
+            return None
+
+        package_index = self.index.get(
+            canonicalize_name(dependency.name), VersionIntervalIndex()
+        )
+        safe_version = package_index.find_first_uncovered(versions, installed_version)
+        return str(safe_version) if safe_version else None
+
+    def has_data(self) -> bool:
+        """Return if the OSV data could be loaded."""
+        return self.index is not None
+
+    @classmethod
+    async def get_source_version(
+        cls,
+        source: str | None = None,
+        transport: TransportBase | None = None,
+    ) -> str | None:
+        """Get the ETag (or modification date) of the OSV dump."""
+        source = source or DATABASE_URL
+        if source.startswith(("http://", "https://")):
+            return await get_url_version(source, transport)
+        try:
+            return _get_path_version(source)
+        except OSError:
+            return None
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from deps_report.dependencies_version_checkers import DependenciesVersionCheckerBase
+from deps_report.models import Dependency, RuntimeInformations, VerificationError
+from deps_report.models.results import ProjectReport
+from deps_report.parsers import ParserBase
+from deps_report.processing import (
+    VERSION_ERROR,
+    DependencyResults,
+    build_project_report,
+    check_dependencies,
+)
+from deps_report.runtime_version_checkers import RuntimeVersionCheckerBase
+from deps_report.vulnerabilities_checkers import VulnerabilityCheckerBase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_INTERVAL = 1
+
+
+@dataclass(frozen=True, slots=True)
+class WatchUpdate:
+    """Report of the project after a change, with the dependencies checked again."""
+
+    report: ProjectReport
+    checked_dependencies: list[Dependency]
+    duration: float
+
+
+def get_files_modification_times(paths: list[str]) -> dict[str, int | None]:
+    """Get the modification time of each file, None if it doesn't exist."""
+    modification_times: dict[str, int | None] = {}
+    for path in paths:
+        try:
+            modification_times[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            modification_times[path] = None
+    return modification_times
+
+
+class ProjectWatcher:
+    """Check the dependencies of a project again each time its files change.
+
+    The checkers and the results of the dependencies are kept between the checks,
+    so only the dependencies added or changed since the previous check are checked.
+    """
+
+    def __init__(
+        self,
+        parser: ParserBase,
+        version_checker: DependenciesVersionCheckerBase | None,
+        vulnerability_checker: VulnerabilityCheckerBase | None,
+        runtime_checker: RuntimeVersionCheckerBase | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Create the watcher of the files read by the parser.
+
+        The timeout (in seconds) applies to each check, the dependencies not checked
+        when it's reached are checked again after the next change.
+        """
+        self.parser = parser
+        self.version_checker = version_checker
+        self.vulnerability_checker = vulnerability_checker
+        self.runtime_checker = runtime_checker
+        self.timeout = timeout
+        self._results: dict[Dependency, DependencyResults] = {}
+        self._runtime_informations: dict[str, RuntimeInformations | None] = {}
+        self._modification_times: dict[str, int | None] = {}
+
+    def has_changed(self) -> bool:
+        """Return if the files of the project changed since the previous check."""
+        return (
+            get_files_modification_times(self.parser.get_file_paths())
+            != self._modification_times
+        )
+
+    async def _get_runtime_informations(self) -> RuntimeInformations | None:
+        runtime_version = self.parser.get_runtime_version()
+        if not runtime_version or self.runtime_checker is None:
+            return None
+
+        if runtime_version not in self._runtime_informations:
+            try:
+                self._runtime_informations[
+                    runtime_version
+                ] = await self.runtime_checker.get_runtime_informations(runtime_version)
+            except VerificationError:
+                self._runtime_informations[runtime_version] = None
+        return self._runtime_informations[runtime_version]
+
+    async def check(self) -> WatchUpdate:
+        """Parse the project files and check the dependencies added or changed.
+
+        The results of the removed dependencies are dropped, as the ones of the
+        dependencies whose latest version could not be fetched, to try again.
+        """
+        started_at = time.monotonic()
+        self._modification_times = get_files_modification_times(
+            self.parser.get_file_paths()
+        )
+        dependencies = self.parser.get_dependencies()
+
+        current_dependencies = set(dependencies)
+        self._results = {
+            dependency: results
+            for dependency, results in self._results.items()
+            if dependency in current_dependencies
+            and all(error.error != VERSION_ERROR for error in results[2])
+        }
+        changed_dependencies = [
+            dependency for dependency in dependencies if dependency not in self._results
+        ]
+        unfinished_dependencies: set[Dependency] = set()
+        if changed_dependencies:
+            results, unfinished_dependencies = await check_dependencies(
+                changed_dependencies,
+                self.version_checker,
+                self.vulnerability_checker,
+                self.timeout,
+            )
+            self._results.update(
+                (dependency, results[dependency])
+                for dependency in results
+                if dependency not in unfinished_dependencies
+            )
+
+        report = build_project_report(
+            dependencies,
+            self._results,
+            unfinished_dependencies,
+            self.version_checker,
+            await self._get_runtime_informations(),
+        )
+        return WatchUpdate(
+            report=report,
+            checked_dependencies=changed_dependencies,
+            duration=time.monotonic() - started_at,
+        )
+
+    async def watch(
+        self, interval: float = DEFAULT_WATCH_INTERVAL
+    ) -> AsyncIterator[WatchUpdate]:
+        """Check the project, then again each time its files change.
+
+        The modification times of the files are polled every `interval` seconds.
+        A file being written can fail to be parsed, it's parsed again at its next
+        change.
+        """
+        while True:
+            if self.has_changed():
+                try:
+                    update = await self.check()
+                except Exception as e:
+                    logger.error(f"Cannot check the dependencies of the project: {e}")
+                else:
+                    yield update
+            await asyncio.sleep(interval)
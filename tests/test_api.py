@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from deps_report.api import Scanner
+from deps_report.policy import PolicyRule
+
+FILES = {
+    "Pipfile": '[packages]\nurllib3 = "*"\n\n[requires]\npython_version = "3.10"\n',
+    "Pipfile.lock": '{"_meta": {"sources": []}, "default": {}, "develop": {}}',
+}
+
+
+@pytest.mark.parametrize(
+    "options, error",
+    [
+        ({"checks": ["vulnerabilities", "licenses"]}, "Unknown check licenses"),
+        ({"checks": []}, "At least one check is required"),
+        (
+            {"checks": ["vulnerabilities"], "fail_on": [PolicyRule("outdated-major")]},
+            "Policy rule outdated-major requires the outdated check",
+        ),
+    ],
+)
+def test_invalid_scan_options(options: dict[str, Any], error: str) -> None:
+    async def scan() -> None:
+        async with Scanner() as scanner:
+            await scanner.scan_contents("Pipfile.lock", FILES, **options)
+
+    with pytest.raises(ValueError, match=error):
+        asyncio.run(scan())
@@ -0,0 +1,168 @@
+import asyncio
+import json
+import math
+import random
+from pathlib import Path
+from typing import Any, AsyncIterator, Mapping
+
+import pytest
+
+from deps_report.dependencies_version_checkers.python import (
+    PythonDependenciesVersionChecker,
+)
+from deps_report.models import Dependency, DependencyRepository, VerificationError
+from deps_report.transports import Response, TransportBase, TransportError
+from deps_report.utils import concurrency_limiter
+from deps_report.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+SIMPLE_PAGE = '<a href="#">django-4.1.tar.gz</a><a href="#">django-4.2.1.tar.gz</a>'
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: Any) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(concurrency_limiter.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+def _record_saturated_responses(
+    limiter: AdaptiveConcurrencyLimiter, clock: FakeClock, latencies: list[float]
+) -> None:
+    """Record the responses of a host always sent as many requests as the limit."""
+    for latency in latencies:
+        limiter.in_flight = int(limiter.limit)
+        clock.now += latency / limiter.limit
+        limiter.record_success(latency)
+
+
+def _get_jittery_latencies(
+    rnd: random.Random, median: float, count: int
+) -> list[float]:
+    return [rnd.lognormvariate(math.log(median), 1) for _ in range(count)]
+
+
+def test_latency_jitter_does_not_decrease_the_limit(clock: FakeClock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=100)
+
+    # The p90 latency of the host is always 3.6 times its median one
+    _record_saturated_responses(
+        limiter, clock, _get_jittery_latencies(random.Random(0), 0.05, 5000)
+    )
+
+    assert limiter.limit > 50
+
+
+def test_latency_increase_decreases_the_limit(clock: FakeClock) -> None:
+    rnd = random.Random(0)
+    limiter = AdaptiveConcurrencyLimiter(50, slow_start=False)
+    _record_saturated_responses(limiter, clock, _get_jittery_latencies(rnd, 0.05, 500))
+    limit = limiter.limit
+
+    _record_saturated_responses(limiter, clock, _get_jittery_latencies(rnd, 0.2, 600))
+
+    assert limiter.limit < limit * 0.9 * 0.9
+
+
+def test_overloads_decrease_the_limit_once_per_round_trip(clock: FakeClock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(40, slow_start=False)
+    _record_saturated_responses(limiter, clock, [2.0] * 10)
+
+    limiter.record_overload()
+    limiter.record_overload()
+    assert int(limiter.limit) == 20
+
+    clock.now += 2
+    limiter.record_overload()
+    assert int(limiter.limit) == 10
+
+
+def test_outage_does_not_collapse_the_limit(clock: FakeClock) -> None:
+    limiter = AdaptiveConcurrencyLimiter(40, slow_start=False)
+
+    # Refused connections, without any latency known
+    for _ in range(100):
+        clock.now += 0.5
+        limiter.record_failure()
+
+    assert limiter.limit == 20
+    assert limiter.is_failing
+
+    _record_saturated_responses(limiter, clock, [0.05])
+    assert not limiter.is_failing
+    clock.now += 1
+    limiter.record_failure()
+    assert int(limiter.limit) == 10
+
+
+class RefusingTransport(TransportBase):
+    """Transport refusing the connections to the hosts down, answering otherwise."""
+
+    def __init__(self, hosts_down: set[str]) -> None:
+        self.hosts_down = hosts_down
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | str | None = None,
+        timeout: Any = None,
+    ) -> Response:
+        if any(url.startswith(f"https://{host}/") for host in self.hosts_down):
+            raise TransportError("Connection refused")
+        return Response(url, 200, {}, SIMPLE_PAGE.encode())
+
+    def stream(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: Any = None,
+    ) -> AsyncIterator[bytes]:
+        raise NotImplementedError
+
+
+def test_limits_of_the_failing_hosts_are_not_stored(tmp_path: Path) -> None:
+    limits_path = tmp_path / "concurrency_limits.json"
+    limits_path.write_text(json.dumps({"mirror.example.com": 40}))
+    hosts = ["mirror.example.com", "new-mirror.example.com", "pypi.org"]
+
+    async def check() -> None:
+        checker = PythonDependenciesVersionChecker(
+            transport=RefusingTransport(set(hosts[:2])),
+            circuit_breaker_failure_threshold=100,
+            concurrency_limits_path=str(limits_path),
+        )
+        for index in range(20):
+            for host in hosts:
+                try:
+                    await checker.get_latest_version_of_dependency(
+                        Dependency(
+                            name=f"package-{index}",
+                            version="4.1",
+                            repositories=(
+                                DependencyRepository(
+                                    name=host, url=f"https://{host}/simple"
+                                ),
+                            ),
+                            transitive=False,
+                            for_dev=False,
+                        )
+                    )
+                except VerificationError:
+                    pass
+        await checker.close()
+
+    asyncio.run(check())
+
+    assert json.loads(limits_path.read_text()) == {
+        "mirror.example.com": 40,
+        "pypi.org": pytest.approx(10, abs=2),
+    }
@@ -0,0 +1,78 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Mapping
+
+from click.testing import CliRunner
+
+from deps_report import main as main_module
+from deps_report.main import main
+from deps_report.transports import Response, TransportBase
+
+PIPFILE = """
+[packages]
+urllib3 = "*"
+
+[dev-packages]
+
+[requires]
+python_version = "3.10"
+"""
+PIPFILE_LOCK = {
+    "_meta": {"sources": [{"name": "pypi", "url": "https://pypi.org/simple"}]},
+    "default": {"urllib3": {"version": "==1.24.1"}},
+    "develop": {},
+}
+
+
+class StalledTransport(TransportBase):
+    """Transport of hosts which never answer."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | str | None = None,
+        timeout: Any = None,
+    ) -> Response:
+        await asyncio.sleep(60)
+        raise AssertionError("Not cancelled")
+
+    async def stream(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: Any = None,
+    ) -> AsyncIterator[bytes]:
+        await asyncio.sleep(60)
+        yield b""
+
+
+def test_deadline_bounds_the_datasets_downloads(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    (tmp_path / "Pipfile").write_text(PIPFILE)
+    (tmp_path / "Pipfile.lock").write_text(json.dumps(PIPFILE_LOCK))
+    monkeypatch.setattr(main_module, "_get_transport", lambda name: StalledTransport())
+
+    started_at = time.monotonic()
+    result = CliRunner().invoke(
+        main,
+        [
+            str(tmp_path / "Pipfile.lock"),
+            "--deadline",
+            "0.5",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert time.monotonic() - started_at < 5
+    assert (
+        "Deadline reached while downloading the vulnerabilities data" in result.output
+    )
+    assert "1 dependencies could not be checked before the deadline" in result.output
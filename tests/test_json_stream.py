@@ -0,0 +1,126 @@
+import asyncio
+import json
+import random
+from typing import Any, AsyncIterator
+
+import pytest
+
+from deps_report.utils.json_stream import JsonStreamParser, iter_json_stream
+
+
+def _parse_chunks(chunks: list[bytes]) -> list[tuple[str | None, Any]]:
+    parser = JsonStreamParser()
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items
+
+
+def _get_expected_items(document: Any) -> list[tuple[str | None, Any]]:
+    if isinstance(document, list):
+        return [(None, item) for item in document]
+    items: list[tuple[str | None, Any]] = []
+    for key, value in document.items():
+        if isinstance(value, list):
+            items.extend((key, item) for item in value)
+        else:
+            items.append((key, value))
+    return items
+
+
+def _random_value(rnd: random.Random, depth: int = 0) -> Any:
+    draw = rnd.random()
+    if depth > 2 or draw < 0.3:
+        return rnd.choice(
+            [0, 1, -2.5e3, 12345678901234, 'a\u00e9"\\x\U0001f600', True, None, ""]
+        )
+    if draw < 0.6:
+        return [_random_value(rnd, depth + 1) for _ in range(rnd.randint(0, 4))]
+    return {
+        f"k{index}\u00e9": _random_value(rnd, depth + 1)
+        for index in range(rnd.randint(0, 4))
+    }
+
+
+def test_top_level_array_items() -> None:
+    assert _parse_chunks([b'[1, "a", {"b": [2]}, []]']) == [
+        (None, 1),
+        (None, "a"),
+        (None, {"b": [2]}),
+        (None, []),
+    ]
+
+
+def test_top_level_object_items() -> None:
+    document = b'{"meta": {"version": 1}, "packages": [{"name": "a"}, 2], "empty": []}'
+
+    assert _parse_chunks([document]) == [
+        ("meta", {"version": 1}),
+        ("packages", {"name": "a"}),
+        ("packages", 2),
+    ]
+
+
+def test_number_split_between_chunks() -> None:
+    assert _parse_chunks([b"[1", b"2.", b"5e", b"1]"]) == [(None, 125.0)]
+
+
+def test_multibyte_character_split_between_chunks() -> None:
+    encoded = json.dumps(["\u00e9\U0001f600"], ensure_ascii=False).encode()
+
+    assert _parse_chunks(
+        [encoded[index : index + 1] for index in range(len(encoded))]
+    ) == [(None, "\u00e9\U0001f600")]
+
+
+def test_items_returned_as_soon_as_received() -> None:
+    parser = JsonStreamParser()
+
+    assert parser.feed(b'{"packages": [{"name": "a"}, {"na') == [
+        ("packages", {"name": "a"})
+    ]
+    assert parser.feed(b'me": "b"}]}') == [("packages", {"name": "b"})]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "document",
+    [b"", b"[1, 2", b'{"a":', b"[1 2]", b'{"a" 1}', b"{1: 2}", b"[1]]", b"1"],
+)
+def test_invalid_documents(document: bytes) -> None:
+    with pytest.raises(ValueError):
+        _parse_chunks([document])
+
+
+def test_random_documents_split_in_random_chunks() -> None:
+    rnd = random.Random(0)
+    for iteration in range(2000):
+        document = _random_value(rnd)
+        if not isinstance(document, (list, dict)):
+            document = {"value": document}
+        encoded = json.dumps(
+            document,
+            ensure_ascii=iteration % 2 == 0,
+            indent=rnd.choice([None, 1]),
+        ).encode()
+
+        chunks = []
+        position = 0
+        while position < len(encoded):
+            size = rnd.randint(1, 7)
+            chunks.append(encoded[position : position + size])
+            position += size
+
+        assert _parse_chunks(chunks) == _get_expected_items(document), encoded
+
+
+def test_iter_json_stream() -> None:
+    async def get_chunks() -> AsyncIterator[bytes]:
+        for chunk in [b'{"a": [1,', b" 2]", b', "b": true}']:
+            yield chunk
+
+    async def parse() -> list[tuple[str | None, Any]]:
+        return [item async for item in iter_json_stream(get_chunks())]
+
+    assert asyncio.run(parse()) == [("a", 1), ("a", 2), ("b", True)]
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from deps_report.models import Dependency, DependencyRepository
+from deps_report.models.results import ProjectReport, VersionResult, VulnerabilityResult
+from deps_report.utils.output import github_action
+from deps_report.utils.output.cli import print_results_stdout
+from deps_report.utils.output.common import classify_versions_results
+
+NO_OUTDATED_MESSAGE = "No outdated dependencies found 🎉"
+DJANGO = Dependency(
+    name="django",
+    version="4.2",
+    repositories=(DependencyRepository(name="pypi", url="https://pypi.org/simple"),),
+    transitive=False,
+    for_dev=False,
+)
+
+
+def _get_comment(report: ProjectReport, tmp_path: Path, monkeypatch: Any) -> str:
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps({"pull_request": {"head": {"sha": "0" * 40}}}))
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    for name in ("GITHUB_SERVER_URL", "GITHUB_REPOSITORY", "GITHUB_RUN_ID"):
+        monkeypatch.setenv(name, "test")
+    comments: list[str] = []
+    monkeypatch.setattr(github_action, "_post_github_pr_comment", comments.append)
+
+    github_action.send_github_pr_comment_with_results(
+        report, classify_versions_results(report.versions_results)
+    )
+
+    assert len(comments) == 1
+    return comments[0]
+
+
+@pytest.mark.parametrize(
+    "report, is_up_to_date",
+    [
+        (ProjectReport(), True),
+        (ProjectReport(unfinished_dependencies=[DJANGO]), False),
+        (ProjectReport(skipped_checks=["outdated"]), False),
+    ],
+)
+def test_no_outdated_dependencies_message(
+    report: ProjectReport,
+    is_up_to_date: bool,
+    tmp_path: Path,
+    monkeypatch: Any,
+    capsys: Any,
+) -> None:
+    print_results_stdout(report, classify_versions_results(report.versions_results))
+
+    assert (NO_OUTDATED_MESSAGE in capsys.readouterr().out) is is_up_to_date
+    assert (
+        NO_OUTDATED_MESSAGE in _get_comment(report, tmp_path, monkeypatch)
+    ) is is_up_to_date
+
+
+def test_large_report_comment_is_truncated(tmp_path: Path, monkeypatch: Any) -> None:
+    dependencies = [
+        Dependency(
+            name=f"package-{index}",
+            version="1.0.0",
+            repositories=DJANGO.repositories,
+            transitive=True,
+            for_dev=False,
+        )
+        for index in range(3000)
+    ]
+    report = ProjectReport(
+        vulnerabilities_results=[
+            VulnerabilityResult(
+                dependency=dependency,
+                advisory="Remote code execution " * 10,
+                impacted_versions="<2.0.0",
+                safe_version="2.0.0",
+            )
+            for dependency in dependencies
+        ],
+        versions_results=[
+            VersionResult(
+                dependency=dependency,
+                installed_version="1.0.0",
+                latest_version="2.0.0",
+            )
+            for dependency in dependencies
+        ],
+        unfinished_dependencies=dependencies,
+    )
+
+    comment = _get_comment(report, tmp_path, monkeypatch)
+
+    assert len(comment) <= github_action.GITHUB_COMMENT_MAX_LENGTH
+    assert "## Vulnerable dependencies" in comment
+    assert "2765 more rows not displayed" in comment
+    assert "## Outdated dependencies" in comment
+    assert "3000 more rows not displayed" in comment
+    assert "## Unfinished checks" in comment
+    assert "- and 3000 more" in comment
+    assert comment.endswith("<sub>[*Logs*](test/test/actions/runs/test)</sub>")
@@ -0,0 +1,44 @@
+import asyncio
+from typing import AsyncIterator
+
+from deps_report.dependencies_version_checkers import DependenciesVersionCheckerBase
+from deps_report.models import Dependency
+from deps_report.processing import check_dependencies
+
+
+def _get_dependency(name: str) -> Dependency:
+    return Dependency(
+        name=name, version="1.0", repositories=(), transitive=False, for_dev=False
+    )
+
+
+class SlowVersionChecker(DependenciesVersionCheckerBase):
+    """Version checker answering immediately, except for the slow dependencies."""
+
+    def __init__(self, slow_names: set[str]) -> None:
+        self.slow_names = slow_names
+
+    async def get_latest_version_of_dependency(self, dependency: Dependency) -> str:
+        if dependency.name in self.slow_names:
+            await asyncio.sleep(10)
+        return "2.0"
+
+
+def test_deadline_while_the_stream_is_received() -> None:
+    fast, slow, late = (_get_dependency(name) for name in ("fast", "slow", "late"))
+
+    async def get_dependencies() -> AsyncIterator[Dependency]:
+        yield fast
+        yield slow
+        # The file is still parsed when the deadline passes
+        await asyncio.sleep(10)
+        yield late
+
+    results, unfinished_dependencies = asyncio.run(
+        check_dependencies(
+            get_dependencies(), SlowVersionChecker({"slow"}), None, timeout=0.1
+        )
+    )
+
+    assert list(results) == [fast]
+    assert unfinished_dependencies == {slow}
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from deps_report.models import Dependency, DependencyRepository
+from deps_report.parsers import get_parser_for_file_path
+from deps_report.parsers.python import sbom
+from deps_report.parsers.python.common import DEFAULT_REPOSITORY
+from deps_report.parsers.python.sbom import parse_pypi_purl
+
+PRIVATE_REPOSITORY_URL = "https://pypi.example.com/simple"
+
+CYCLONEDX_SBOM = {
+    "bomFormat": "CycloneDX",
+    "specVersion": "1.5",
+    "metadata": {"component": {"purl": "pkg:pypi/my-project@1.0.0"}},
+    "components": [
+        {
+            "name": "Django",
+            "purl": "pkg:pypi/Django@4.2.1",
+            "components": [
+                {"name": "asgiref", "purl": "pkg:pypi/asgiref@3.7.2"},
+                {
+                    "name": "internal",
+                    "purl": f"pkg:pypi/internal@0.1.0?repository_url={PRIVATE_REPOSITORY_URL}/",
+                },
+            ],
+        },
+        {"name": "left-pad", "purl": "pkg:npm/left-pad@1.3.0"},
+        {"name": "no-purl"},
+        {"name": "django", "purl": "pkg:pypi/django@4.2.1#subpath"},
+    ],
+}
+
+SPDX_SBOM = {
+    "spdxVersion": "SPDX-2.3",
+    "packages": [
+        {
+            "name": "requests",
+            "externalRefs": [
+                {
+                    "referenceCategory": "SECURITY",
+                    "referenceType": "cpe23Type",
+                    "referenceLocator": "cpe:2.3:a:python:requests:2.31.0",
+                },
+                {
+                    "referenceCategory": "PACKAGE-MANAGER",
+                    "referenceType": "purl",
+                    "referenceLocator": "pkg:pypi/requests@2.31.0",
+                },
+            ],
+        },
+        {"name": "no-references"},
+        {
+            "name": "requests-duplicate",
+            "externalRefs": [
+                {
+                    "referenceType": "purl",
+                    "referenceLocator": "pkg:pypi/requests@2.31.0",
+                }
+            ],
+        },
+    ],
+}
+
+
+def _get_dependency(
+    name: str, version: str, repository_url: str | None = None
+) -> Dependency:
+    repository = (
+        DEFAULT_REPOSITORY
+        if repository_url is None
+        else DependencyRepository(name=repository_url, url=repository_url)
+    )
+    return Dependency(
+        name=name,
+        version=version,
+        repositories=(repository,),
+        transitive=False,
+        for_dev=False,
+    )
+
+
+def _write_sbom(tmp_path: Path, file_name: str, document: Any) -> str:
+    sbom_path = tmp_path / file_name
+    sbom_path.write_text(json.dumps(document))
+    return str(sbom_path)
+
+
+@pytest.mark.parametrize(
+    "purl, expected",
+    [
+        ("pkg:pypi/django@4.2.1", ("django", "4.2.1", None)),
+        ("pkg:PyPI/Django@4.2.1", ("Django", "4.2.1", None)),
+        ("pkg:/pypi/django@4.2.1", ("django", "4.2.1", None)),
+        ("pkg:pypi/namespace/django@4.2.1", ("django", "4.2.1", None)),
+        ("pkg:pypi/zope.interface@5.0%2Blocal", ("zope.interface", "5.0+local", None)),
+        (
+            f"pkg:pypi/django@4.2.1?checksum=sha256:abc&repository_url={PRIVATE_REPOSITORY_URL}/",
+            ("django", "4.2.1", PRIVATE_REPOSITORY_URL),
+        ),
+        ("pkg:pypi/django@4.2.1?checksum=sha256:abc", ("django", "4.2.1", None)),
+        ("pkg:pypi/django@4.2.1#src/django", ("django", "4.2.1", None)),
+        ("pkg:pypi/django", None),
+        ("pkg:npm/%40angular/core@16.0.0", None),
+        ("pkg:npm/left-pad@1.3.0", None),
+        ("django==4.2.1", None),
+    ],
+)
+def test_parse_pypi_purl(purl: str, expected: tuple[str, str, str | None]) -> None:
+    assert parse_pypi_purl(purl) == expected
+
+
+def test_cyclonedx_nested_components(tmp_path: Path) -> None:
+    parser = get_parser_for_file_path(_write_sbom(tmp_path, "bom.json", CYCLONEDX_SBOM))
+
+    assert parser.get_dependencies() == [
+        _get_dependency("django", "4.2.1"),
+        _get_dependency("asgiref", "3.7.2"),
+        _get_dependency("internal", "0.1.0", PRIVATE_REPOSITORY_URL),
+    ]
+
+
+def test_spdx_external_references(tmp_path: Path) -> None:
+    parser = get_parser_for_file_path(
+        _write_sbom(tmp_path, "project.spdx.json", SPDX_SBOM)
+    )
+
+    assert parser.get_dependencies() == [_get_dependency("requests", "2.31.0")]
+
+
+def test_streamed_dependencies_are_deduplicated(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    document = {
+        "bomFormat": "CycloneDX",
+        "components": [
+            {"purl": f"pkg:pypi/package-{index % 50}@1.0.0"} for index in range(500)
+        ],
+    }
+    parser = get_parser_for_file_path(_write_sbom(tmp_path, "bom.json", document))
+    # Split the document in many chunks, the duplicates being in different chunks
+    monkeypatch.setattr(sbom, "CHUNK_SIZE", 64)
+
+    async def iter_dependencies() -> list[Dependency]:
+        return [dependency async for dependency in parser.iter_dependencies()]
+
+    expected = [_get_dependency(f"package-{index}", "1.0.0") for index in range(50)]
+    assert parser.get_dependencies() == expected
+    assert asyncio.run(iter_dependencies()) == expected
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from deps_report import client as client_module
+from deps_report.api import Scanner
+from deps_report.models import Dependency
+from deps_report.models.results import ProjectReport
+from deps_report.parsers import ParserBase, get_parser_for_file_path
+from deps_report.server import ReportServer
+from deps_report.vulnerabilities_checkers.python import PythonVulnerabilityChecker
+
+PIPFILE = """
+[packages]
+django = "*"
+
+[dev-packages]
+
+[requires]
+python_version = "3.10"
+"""
+
+PIPFILE_LOCK = {
+    "_meta": {
+        "sources": [
+            {"name": "private", "url": "https://${DEPS_REPORT_SECRET}@example.com"}
+        ]
+    },
+    "default": {"django": {"version": "==4.2.1", "index": "private"}},
+    "develop": {},
+}
+
+
+async def _post_report(body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+    server = ReportServer(refresh_interval=3600, versions_cache_ttl=0)
+    try:
+        async with TestClient(TestServer(server.create_app())) as client:
+            response = await client.post("/report", json=body)
+            return response.status, await response.json()
+    finally:
+        await server.close()
+
+
+def test_report_rejects_file_name_outside_of_sent_files() -> None:
+    status, data = asyncio.run(
+        _post_report({"file_name": "/etc/deps/Pipfile.lock", "files": {}})
+    )
+
+    assert status == 400
+    assert "Invalid file name" in data["error"]
+
+
+def test_report_rejects_missing_companion_file() -> None:
+    status, data = asyncio.run(
+        _post_report(
+            {
+                "file_name": "Pipfile.lock",
+                "files": {"Pipfile.lock": json.dumps(PIPFILE_LOCK)},
+            }
+        )
+    )
+
+    assert status == 400
+    assert data["error"] == "Missing file Pipfile"
+
+
+def _get_repositories_urls(dependencies: list[Dependency]) -> set[str]:
+    return {
+        repository.url
+        for dependency in dependencies
+        for repository in dependency.repositories
+    }
+
+
+def test_parser_expands_environment_only_if_asked(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setenv("DEPS_REPORT_SECRET", "secret-token")
+    (tmp_path / "Pipfile").write_text(PIPFILE)
+    (tmp_path / "Pipfile.lock").write_text(json.dumps(PIPFILE_LOCK))
+    lock_file_path = str(tmp_path / "Pipfile.lock")
+
+    expanded_urls = _get_repositories_urls(
+        get_parser_for_file_path(lock_file_path).get_dependencies()
+    )
+    raw_urls = _get_repositories_urls(
+        get_parser_for_file_path(lock_file_path, expand_env=False).get_dependencies()
+    )
+
+    assert "https://secret-token@example.com" in expanded_urls
+    assert "https://${DEPS_REPORT_SECRET}@example.com" in raw_urls
+    assert not any("secret-token" in url for url in raw_urls)
+
+
+def test_scan_contents_does_not_expand_environment(monkeypatch: Any) -> None:
+    monkeypatch.setenv("DEPS_REPORT_SECRET", "secret-token")
+    scanned_dependencies: list[Dependency] = []
+
+    async def fake_scan_parser(
+        self: Scanner, parser: ParserBase, *args: Any
+    ) -> ProjectReport:
+        dependencies = args[4]
+        scanned_dependencies.extend(dependencies)
+        return ProjectReport()
+
+    monkeypatch.setattr(Scanner, "_scan_parser", fake_scan_parser)
+
+    async def scan() -> None:
+        async with Scanner() as scanner:
+            await scanner.scan_contents(
+                "Pipfile.lock",
+                {"Pipfile": PIPFILE, "Pipfile.lock": json.dumps(PIPFILE_LOCK)},
+            )
+
+    asyncio.run(scan())
+
+    urls = _get_repositories_urls(scanned_dependencies)
+    assert "https://${DEPS_REPORT_SECRET}@example.com" in urls
+    assert not any("secret-token" in url for url in urls)
+
+
+def test_refresh_keeps_checker_when_download_fails(monkeypatch: Any) -> None:
+    working_checker = PythonVulnerabilityChecker({"django": []})
+
+    async def failed_create(*args: Any, **kwargs: Any) -> PythonVulnerabilityChecker:
+        return PythonVulnerabilityChecker(None)
+
+    monkeypatch.setattr(PythonVulnerabilityChecker, "create", failed_create)
+
+    async def refresh() -> Scanner:
+        async with Scanner() as scanner:
+            scanner._vulnerability_checkers[
+                PythonVulnerabilityChecker
+            ] = working_checker
+            await scanner.refresh()
+            return scanner
+
+    scanner = asyncio.run(refresh())
+
+    assert (
+        scanner._vulnerability_checkers[PythonVulnerabilityChecker] is working_checker
+    )
+
+
+def test_client_stops_waiting_for_stalled_server(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    (tmp_path / "Pipfile").write_text(PIPFILE)
+    lock_path = tmp_path / "Pipfile.lock"
+    lock_path.write_text(json.dumps(PIPFILE_LOCK))
+    monkeypatch.setattr(client_module, "DEADLINE_MARGIN", 0.1)
+
+    async def stalled_report(request: web.Request) -> web.Response:
+        await asyncio.sleep(60)
+        return web.json_response({})
+
+    async def get_report() -> ProjectReport | None:
+        app = web.Application()
+        app.router.add_post("/report", stalled_report)
+        async with TestServer(app) as server:
+            return await client_module.get_report_from_server(
+                str(server.make_url("")),
+                get_parser_for_file_path(str(lock_path)),
+                str(lock_path),
+                deadline=0.2,
+            )
+
+    started_at = time.monotonic()
+    report = asyncio.run(get_report())
+
+    assert report is None
+    assert time.monotonic() - started_at < 5
@@ -0,0 +1,132 @@
+import asyncio
+import socket
+from typing import Any, Awaitable, Callable
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from deps_report.transports import (
+    HTTPStatusError,
+    Timeout,
+    TransportBase,
+    TransportError,
+    TransportTimeoutError,
+    get_transport,
+)
+
+TRANSPORTS = ["aiohttp", "httpx"]
+
+SHORT_TIMEOUT = Timeout(connect=1, read=0.2, total=0.5)
+
+
+async def _ok(request: web.Request) -> web.Response:
+    return web.Response(text="ok")
+
+
+async def _unavailable(request: web.Request) -> web.Response:
+    return web.Response(status=503, text="unavailable")
+
+
+async def _stalled(request: web.Request) -> web.Response:
+    await asyncio.sleep(60)
+    return web.Response(text="too late")
+
+
+async def _stalled_body(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse()
+    await response.prepare(request)
+    await response.write(b"first chunk")
+    await asyncio.sleep(60)
+    return response
+
+
+def _run_with_server(
+    transport_name: str, test: Callable[[TransportBase, str], Awaitable[Any]]
+) -> Any:
+    async def run() -> Any:
+        app = web.Application()
+        app.router.add_get("/ok", _ok)
+        app.router.add_get("/unavailable", _unavailable)
+        app.router.add_get("/stalled", _stalled)
+        app.router.add_get("/stalled-body", _stalled_body)
+        transport = get_transport(transport_name)
+        try:
+            async with TestServer(app) as server:
+                return await test(transport, str(server.make_url("")).rstrip("/"))
+        finally:
+            await transport.close()
+
+    return asyncio.run(run())
+
+
+def _get_closed_port_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/ok"
+
+
+async def _read_stream(transport: TransportBase, url: str) -> bytes:
+    return b"".join([chunk async for chunk in transport.stream(url)])
+
+
+@pytest.mark.parametrize("transport_name", TRANSPORTS)
+def test_request_returns_error_statuses(transport_name: str) -> None:
+    async def test(transport: TransportBase, base_url: str) -> None:
+        response = await transport.request("GET", f"{base_url}/unavailable")
+
+        assert response.status == 503
+        with pytest.raises(HTTPStatusError) as error:
+            response.raise_for_status()
+        assert error.value.status == 503
+
+    _run_with_server(transport_name, test)
+
+
+@pytest.mark.parametrize("transport_name", TRANSPORTS)
+def test_stream_raises_error_statuses(transport_name: str) -> None:
+    async def test(transport: TransportBase, base_url: str) -> None:
+        assert await _read_stream(transport, f"{base_url}/ok") == b"ok"
+        with pytest.raises(HTTPStatusError) as error:
+            await _read_stream(transport, f"{base_url}/unavailable")
+        assert error.value.status == 503
+
+    _run_with_server(transport_name, test)
+
+
+@pytest.mark.parametrize("transport_name", TRANSPORTS)
+def test_request_timeout_raises_timeout_error(transport_name: str) -> None:
+    async def test(transport: TransportBase, base_url: str) -> None:
+        with pytest.raises(TransportTimeoutError):
+            await transport.request("GET", f"{base_url}/stalled", timeout=SHORT_TIMEOUT)
+
+    _run_with_server(transport_name, test)
+
+
+@pytest.mark.parametrize("transport_name", TRANSPORTS)
+def test_stream_timeout_raises_timeout_error(transport_name: str) -> None:
+    async def test(transport: TransportBase, base_url: str) -> None:
+        chunks = []
+        with pytest.raises(TransportTimeoutError):
+            async for chunk in transport.stream(
+                f"{base_url}/stalled-body", timeout=SHORT_TIMEOUT
+            ):
+                chunks.append(chunk)
+        assert chunks == [b"first chunk"]
+
+    _run_with_server(transport_name, test)
+
+
+@pytest.mark.parametrize("transport_name", TRANSPORTS)
+def test_connection_error_raises_transport_error(transport_name: str) -> None:
+    async def test(transport: TransportBase, base_url: str) -> None:
+        url = _get_closed_port_url()
+        with pytest.raises(TransportError) as request_error:
+            await transport.request("GET", url)
+        with pytest.raises(TransportError) as stream_error:
+            await _read_stream(transport, url)
+        assert not isinstance(request_error.value, TransportTimeoutError)
+        assert not isinstance(stream_error.value, TransportTimeoutError)
+
+    _run_with_server(transport_name, test)
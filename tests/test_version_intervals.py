@@ -0,0 +1,180 @@
+import random
+
+import pytest
+from packaging.specifiers import SpecifierSet
+from packaging.version import Version
+
+from deps_report.utils.version_intervals import (
+    VersionInterval,
+    VersionIntervalIndex,
+    get_interval_from_specifiers,
+)
+
+
+def _random_version(rnd: random.Random) -> Version:
+    return Version(f"{rnd.randint(0, 3)}.{rnd.randint(0, 3)}.{rnd.randint(0, 3)}")
+
+
+def _contains(interval: VersionInterval, version: Version) -> bool:
+    if interval.lower is not None and (
+        version < interval.lower
+        or (version == interval.lower and not interval.lower_inclusive)
+    ):
+        return False
+    if interval.upper is not None and (
+        version > interval.upper
+        or (version == interval.upper and not interval.upper_inclusive)
+    ):
+        return False
+    return True
+
+
+def _random_interval(rnd: random.Random) -> VersionInterval:
+    lower, upper = sorted([_random_version(rnd), _random_version(rnd)])
+    return VersionInterval(
+        lower=None if rnd.random() < 0.15 else lower,
+        upper=None if rnd.random() < 0.15 else upper,
+        lower_inclusive=rnd.random() < 0.5,
+        upper_inclusive=rnd.random() < 0.5,
+    )
+
+
+def test_index_finds_the_intervals_containing_a_version() -> None:
+    index: VersionIntervalIndex[str] = VersionIntervalIndex()
+    index.add(VersionInterval(Version("1.0"), Version("2.0")), "a")
+    index.add(
+        VersionInterval(Version("1.5"), Version("1.5"), upper_inclusive=True), "b"
+    )
+    index.add(VersionInterval(None, Version("1.0"), upper_inclusive=True), "c")
+    index.add(VersionInterval(Version("2.0"), None, lower_inclusive=False), "d")
+
+    assert index.find(Version("0.1")) == ["c"]
+    assert sorted(index.find(Version("1.0"))) == ["a", "c"]
+    assert index.find(Version("1.5")) == ["a", "b"]
+    assert index.find(Version("2.0")) == []
+    assert index.find(Version("3.0")) == ["d"]
+    assert len(index) == 4
+
+
+def test_index_returns_each_value_once() -> None:
+    advisory = object()
+    index: VersionIntervalIndex[object] = VersionIntervalIndex()
+    index.add(VersionInterval(Version("1.0"), Version("2.0")), advisory)
+    index.add(VersionInterval(Version("1.5"), None), advisory)
+
+    assert index.find(Version("1.6")) == [advisory]
+
+
+def test_empty_index() -> None:
+    index: VersionIntervalIndex[str] = VersionIntervalIndex()
+
+    assert index.find(Version("1.0")) == []
+    assert index.find_first_uncovered([Version("1.0")], Version("0.1")) == Version(
+        "1.0"
+    )
+
+
+def test_index_is_rebuilt_after_an_addition() -> None:
+    index: VersionIntervalIndex[str] = VersionIntervalIndex()
+    index.add(VersionInterval(Version("1.0"), Version("2.0")), "a")
+    assert index.find(Version("3.0")) == []
+
+    index.add(VersionInterval(Version("3.0"), None), "b")
+    assert index.find(Version("3.0")) == ["b"]
+
+
+def test_index_matches_a_linear_scan() -> None:
+    rnd = random.Random(0)
+    for _ in range(2000):
+        intervals = [
+            (_random_interval(rnd), value) for value in range(rnd.randint(0, 6))
+        ]
+        index: VersionIntervalIndex[int] = VersionIntervalIndex()
+        for interval, value in intervals:
+            index.add(interval, value)
+
+        for _ in range(10):
+            version = _random_version(rnd)
+            assert sorted(index.find(version)) == [
+                value for interval, value in intervals if _contains(interval, version)
+            ], (intervals, version)
+
+
+def test_first_uncovered_version() -> None:
+    index: VersionIntervalIndex[str] = VersionIntervalIndex()
+    index.add(VersionInterval(None, Version("1.2")), "a")
+    index.add(
+        VersionInterval(Version("1.2"), Version("2.0"), lower_inclusive=False), "b"
+    )
+    index.add(VersionInterval(Version("2.1"), None), "c")
+    versions = [Version(version) for version in ("1.0", "1.2", "1.9", "2.0", "2.1")]
+
+    # Both bounds of "b" are exclusive
+    assert index.find_first_uncovered(versions, Version("0.1")) == Version("1.2")
+    assert index.find_first_uncovered(versions, Version("1.2")) == Version("2.0")
+    assert index.find_first_uncovered(versions, Version("2.0")) is None
+
+
+def test_first_uncovered_version_matches_a_linear_scan() -> None:
+    rnd = random.Random(1)
+    for _ in range(2000):
+        index: VersionIntervalIndex[int] = VersionIntervalIndex()
+        for value in range(rnd.randint(0, 5)):
+            index.add(_random_interval(rnd), value)
+        versions = sorted({_random_version(rnd) for _ in range(rnd.randint(0, 30))})
+        after = _random_version(rnd)
+
+        expected = next(
+            (
+                version
+                for version in versions
+                if version > after and not index.find(version)
+            ),
+            None,
+        )
+        assert index.find_first_uncovered(versions, after) == expected
+
+
+@pytest.mark.parametrize(
+    "specifiers, expected",
+    [
+        (">=1.0,<1.2", ">=1.0,<1.2"),
+        ("<1.2,>1.0,<=1.1", ">1.0,<=1.1"),
+        ("==1.0", "==1.0"),
+        (">=1.0,>1.0", ">1.0"),
+        ("", "*"),
+        # Not representable by bounds, so ignored
+        (">=1.0,!=1.1,~=1.0", ">=1.0"),
+    ],
+)
+def test_interval_from_specifiers(specifiers: str, expected: str) -> None:
+    assert str(get_interval_from_specifiers(specifiers)) == expected
+
+
+@pytest.mark.parametrize("specifiers", [">1.0,<1.0", ">1.0,<=1.0", "==1.0,<1.0", "=<"])
+def test_interval_from_specifiers_without_any_version(specifiers: str) -> None:
+    assert get_interval_from_specifiers(specifiers) is None
+
+
+def test_interval_from_specifiers_matches_the_specifier_set() -> None:
+    rnd = random.Random(2)
+    for _ in range(3000):
+        operators = ["<", "<=", ">", ">=", "=="]
+        is_exact = rnd.random() < 0.7
+        if not is_exact:
+            operators += ["!=", "~="]
+        specifiers = ",".join(
+            f"{rnd.choice(operators)}{_random_version(rnd)}"
+            for _ in range(rnd.randint(1, 3))
+        )
+        specifier_set = SpecifierSet(specifiers)
+        interval = get_interval_from_specifiers(specifiers)
+
+        for _ in range(20):
+            version = _random_version(rnd)
+            is_contained = interval is not None and _contains(interval, version)
+            if is_exact:
+                assert is_contained == specifier_set.contains(version), specifiers
+            elif specifier_set.contains(version):
+                # The ignored specifiers only make the interval contain more versions
+                assert is_contained, specifiers
@@ -0,0 +1,129 @@
+import asyncio
+import xmlrpc.client
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from deps_report.dependencies_version_checkers.python import (
+    PythonDependenciesVersionChecker,
+)
+from deps_report.dependencies_version_checkers.versions_store import LatestVersionsStore
+from deps_report.models import Dependency, DependencyRepository
+
+PACKAGES = {"django": "4.2.1", "requests": "2.31.0"}
+
+
+class FeedServer:
+    """Stand-in of PyPI, with its simple index and its XML-RPC changes feed."""
+
+    def __init__(self) -> None:
+        self.packages = dict(PACKAGES)
+        self.last_serial = 100
+        # Events of the feed: (name, version, timestamp, action, serial)
+        self.events: list[tuple[str, str, int, str, int]] = []
+        self.feed_calls: list[tuple[str, tuple[Any, ...]]] = []
+        self.fetched_packages: list[str] = []
+        self.is_feed_down = False
+
+    async def handle_feed(self, request: web.Request) -> web.Response:
+        if self.is_feed_down:
+            return web.Response(status=503)
+        params, method = xmlrpc.client.loads(await request.text())
+        self.feed_calls.append((method, params))
+        if method == "changelog_last_serial":
+            result: Any = self.last_serial
+        else:
+            result = [list(event) for event in self.events if event[4] > params[0]]
+        return web.Response(
+            text=xmlrpc.client.dumps((result,), methodresponse=True),
+            content_type="text/xml",
+        )
+
+    async def handle_simple_page(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        self.fetched_packages.append(name)
+        return web.Response(
+            text=f'<a href="#">{name}-1.0.tar.gz</a>'
+            f'<a href="#">{name}-{self.packages[name]}.tar.gz</a>',
+            content_type="text/html",
+        )
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/pypi", self.handle_feed)
+        app.router.add_get("/simple/{name}", self.handle_simple_page)
+        return app
+
+
+async def _check_versions(
+    server: FeedServer, test_server: TestServer, cache_dir: Path
+) -> dict[str, str]:
+    """Get the latest versions in a new run, with a new checker and store."""
+    server.fetched_packages.clear()
+    server.feed_calls.clear()
+    repository_url = str(test_server.make_url("/simple"))
+    store = LatestVersionsStore(
+        str(cache_dir), repository_url, str(test_server.make_url("/pypi"))
+    )
+    checker = PythonDependenciesVersionChecker(versions_store=store)
+    repository = DependencyRepository(name="pypi", url=repository_url)
+    try:
+        return {
+            name: await checker.get_latest_version_of_dependency(
+                Dependency(
+                    name=name,
+                    version="1.0",
+                    repositories=(repository,),
+                    transitive=False,
+                    for_dev=False,
+                )
+            )
+            for name in PACKAGES
+        }
+    finally:
+        await checker.close()
+
+
+def test_versions_store_synchronization(tmp_path: Path) -> None:
+    server = FeedServer()
+
+    async def run() -> None:
+        async with TestServer(server.create_app()) as test_server:
+            # First run: only the serial of the feed is stored
+            assert await _check_versions(server, test_server, tmp_path) == PACKAGES
+            assert server.feed_calls == [("changelog_last_serial", ())]
+            assert sorted(server.fetched_packages) == sorted(PACKAGES)
+
+            # Without any change, the versions come from the store
+            assert await _check_versions(server, test_server, tmp_path) == PACKAGES
+            assert server.feed_calls == [("changelog_since_serial", (100,))]
+            assert server.fetched_packages == []
+
+            # Only the changed project is fetched again
+            server.packages["django"] = "5.0"
+            server.events = [
+                ("Django", "5.0", 0, "new release", 101),
+                ("other", "1.0", 0, "new release", 102),
+            ]
+            assert await _check_versions(server, test_server, tmp_path) == {
+                **PACKAGES,
+                "django": "5.0",
+            }
+            assert server.feed_calls == [
+                ("changelog_since_serial", (100,)),
+                ("changelog_since_serial", (102,)),
+            ]
+            assert server.fetched_packages == ["django"]
+
+            # If the feed is down, the store cannot be trusted
+            server.is_feed_down = True
+            server.packages["requests"] = "2.32.0"
+            assert await _check_versions(server, test_server, tmp_path) == {
+                "django": "5.0",
+                "requests": "2.32.0",
+            }
+            assert sorted(server.fetched_packages) == sorted(PACKAGES)
+
+    asyncio.run(run())